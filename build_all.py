@@ -0,0 +1,44 @@
+# Regenerate all static documentation and infrastructure artifacts in parallel
+import importlib
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from artifact_writes import preflight, write_if_changed
+
+# Generator scripts exposing build() -> ((filename, payload_bytes), ...)
+GENERATORS = (
+    "script",      # terraform_dev_databases.tf
+    "script_1",    # terraform_prod_critical_databases.tf
+    "script_2",    # terraform_module_{main,variables,outputs}.tf
+    "script_10",   # database_ownership.{md,json,md.gz}
+    "script_13",   # deployment_guide.md
+    "script_15",   # implementation_summary.md
+)
+
+
+def _call_build(module_name):
+    """Import a generator in the worker process and return its payloads"""
+    return importlib.import_module(module_name).build()
+
+
+def main():
+    """Build every generator concurrently and write only the files whose bytes changed"""
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(_call_build, GENERATORS))
+
+    outputs = [(Path(filename), payload) for result in results for filename, payload in result]
+    preflight(tuple(path for path, _ in outputs))
+
+    written = 0
+    for path, payload in outputs:
+        if write_if_changed(path, payload):
+            written += 1
+            print(f"✅ {path}")
+        else:
+            print(f"   {path} (up-to-date)")
+
+    print(f"\n{written} of {len(outputs)} files regenerated")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+# Criticality-derived settings shared by the monitor (script_8.py) and Helm
+# values (script_9.py) generators. Criticality is one of three values, so
+# every derived constant is computed once here at import time.
+
+# Alert thresholds in seconds: (no-connection critical, warning)
+_ALERT_THRESHOLDS = {
+    "CRITICAL": (86400, 43200),  # 24 hours / 12 hours
+    "MEDIUM": (259200, 172800),  # 72 hours (3 days) / 48 hours (2 days)
+    "LOW": (2592000, 1814400),  # 30 days / 21 days
+}
+
+# Monitor message text; only critical databases get the manual-review wording
+_CRITICAL_NOTES = {
+    "criticality_note": "⚠️ **CRITICAL DATABASE** - Manual review required before any action",
+    "critical_action": "Create GitHub issue for manual review",
+    "escalation_note": "This is a CRITICAL system requiring immediate review.",
+    "manual_review": "true",
+}
+
+_STANDARD_NOTES = {
+    "criticality_note": "",
+    "critical_action": "Evaluate for removal",
+    "escalation_note": "",
+    "manual_review": "false",
+}
+
+_MONITOR_NOTES = {
+    "CRITICAL": _CRITICAL_NOTES,
+    "MEDIUM": _STANDARD_NOTES,
+    "LOW": _STANDARD_NOTES,
+}
+
+# Helm values: resources, storage, tuning, replicas, backup, PDB and quotas
+_REPLICAS_DISABLED = {
+    "read_replicas": "# readReplicas: # Disabled for non-critical",
+    "replica_count": "# replicaCount: 0",
+    "replica_resources": "",
+    "replica_requests": "",
+    "replica_cpu_request": "",
+    "replica_memory_request": "",
+    "replica_limits": "",
+    "replica_cpu_limit": "",
+    "replica_memory_limit": "",
+}
+
+_PDB_DISABLED = {
+    "pod_disruption_budget": "# podDisruptionBudget: # Disabled for non-critical",
+    "pdb_enabled": "",
+    "pdb_min_available": "",
+}
+
+_BACKUP_STORAGE = {
+    "backup_storage": "storage:",
+    "backup_storage_type": "type: 'azure-blob'",
+    "backup_container": "container: 'database-backups'",
+}
+
+_HELM_SETTINGS = {
+    "CRITICAL": {
+        "cpu_request": "2000m",
+        "memory_request": "4Gi",
+        "cpu_limit": "4000m",
+        "memory_limit": "8Gi",
+        "pvc_size": "100Gi",
+        "storage_class": "premium-ssd",
+        "max_connections": 200,
+        "shared_buffers": "1GB",
+        "effective_cache_size": "3GB",
+        "work_mem": "32MB",
+        "read_replicas": "readReplicas:",
+        "replica_count": "replicaCount: 2",
+        "replica_resources": "resources:",
+        "replica_requests": "requests:",
+        "replica_cpu_request": "cpu: '1000m'",
+        "replica_memory_request": "memory: '2Gi'",
+        "replica_limits": "limits:",
+        "replica_cpu_limit": "cpu: '2000m'",
+        "replica_memory_limit": "memory: '4Gi'",
+        "backup_enabled": "true",
+        "backup_schedule": "schedule: '0 2 * * *'  # Daily at 2 AM",
+        "backup_retention": "retention: '30d'",
+        **_BACKUP_STORAGE,
+        "pod_disruption_budget": "podDisruptionBudget:",
+        "pdb_enabled": "enabled: true",
+        "pdb_min_available": "minAvailable: 1",
+        "quota_cpu": "8000m",
+        "quota_memory": "16Gi",
+        "quota_pvcs": 3,
+        "staging_cpu_request": "1000m",
+        "staging_memory_request": "2Gi",
+        "staging_cpu_limit": "2000m",
+        "staging_memory_limit": "4Gi",
+        "staging_pvc_size": "50Gi",
+        "database_tier": "critical",
+    },
+    "MEDIUM": {
+        "cpu_request": "500m",
+        "memory_request": "2Gi",
+        "cpu_limit": "1000m",
+        "memory_limit": "4Gi",
+        "pvc_size": "50Gi",
+        "storage_class": "standard-ssd",
+        "max_connections": 100,
+        "shared_buffers": "512MB",
+        "effective_cache_size": "1536MB",
+        "work_mem": "16MB",
+        **_REPLICAS_DISABLED,
+        "backup_enabled": "true",
+        "backup_schedule": "schedule: '0 2 * * *'  # Daily at 2 AM",
+        "backup_retention": "retention: '7d'",
+        **_BACKUP_STORAGE,
+        **_PDB_DISABLED,
+        "quota_cpu": "2000m",
+        "quota_memory": "8Gi",
+        "quota_pvcs": 2,
+        "staging_cpu_request": "500m",
+        "staging_memory_request": "1Gi",
+        "staging_cpu_limit": "1000m",
+        "staging_memory_limit": "2Gi",
+        "staging_pvc_size": "25Gi",
+        "database_tier": "standard",
+    },
+    "LOW": {
+        "cpu_request": "250m",
+        "memory_request": "1Gi",
+        "cpu_limit": "500m",
+        "memory_limit": "2Gi",
+        "pvc_size": "20Gi",
+        "storage_class": "standard-ssd",
+        "max_connections": 50,
+        "shared_buffers": "256MB",
+        "effective_cache_size": "768MB",
+        "work_mem": "8MB",
+        **_REPLICAS_DISABLED,
+        "backup_enabled": "false",
+        "backup_schedule": "# Backup disabled for low criticality",
+        "backup_retention": "",
+        "backup_storage": "",
+        "backup_storage_type": "",
+        "backup_container": "",
+        **_PDB_DISABLED,
+        "quota_cpu": "1000m",
+        "quota_memory": "4Gi",
+        "quota_pvcs": 1,
+        "staging_cpu_request": "500m",
+        "staging_memory_request": "1Gi",
+        "staging_cpu_limit": "1000m",
+        "staging_memory_limit": "2Gi",
+        "staging_pvc_size": "25Gi",
+        "database_tier": "standard",
+    },
+}
+
+
+def _monitor_settings(connection_threshold, warning_threshold):
+    """Monitor fields derived from the alert thresholds"""
+    return {
+        "connection_threshold": connection_threshold,
+        "warning_threshold": warning_threshold,
+        "connection_days": connection_threshold / 86400,
+        "connection_days_whole": connection_threshold // 86400,
+        "connection_hours": connection_threshold / 3600,
+        "warning_recovery": warning_threshold * 0.8,
+        "critical_recovery": connection_threshold * 0.8,
+    }
+
+
+# criticality -> every monitor and Helm field that depends only on it
+CRITICALITY_DERIVED = {
+    criticality: {
+        **_monitor_settings(*_ALERT_THRESHOLDS[criticality]),
+        **_MONITOR_NOTES[criticality],
+        **_HELM_SETTINGS[criticality],
+    }
+    for criticality in _ALERT_THRESHOLDS
+}
@@ -0,0 +1,155 @@
+# Database inventory shared by the monitor, Helm values and fused config generators
+import sys
+from dataclasses import dataclass
+from string import Formatter
+from pathlib import Path
+from typing import Dict, Tuple
+
+from artifact_writes import write_if_changed
+
+
+@dataclass(frozen=True, slots=True)
+class DatabaseSpec:
+    """One scenario database and the metadata its generated configs need"""
+    name: str
+    scenario: str
+    owner: str
+    criticality: str
+    description: str
+
+
+DATABASES: Tuple[DatabaseSpec, ...] = (
+    # Config-Only scenarios
+    DatabaseSpec(
+        "periodic_table",
+        "CONFIG_ONLY",
+        "chemistry-team@company.com",
+        "LOW",
+        "Chemical elements reference database for chemistry applications",
+    ),
+    DatabaseSpec(
+        "world_happiness",
+        "CONFIG_ONLY",
+        "analytics-team@company.com",
+        "LOW",
+        "World happiness index data for analytics and reporting",
+    ),
+    DatabaseSpec(
+        "titanic",
+        "CONFIG_ONLY",
+        "data-science-team@company.com",
+        "LOW",
+        "Historical passenger data for data science training and demos",
+    ),
+    # Mixed scenarios
+    DatabaseSpec(
+        "pagila",
+        "MIXED",
+        "development-team@company.com",
+        "MEDIUM",
+        "DVD rental store database with moderate service layer usage",
+    ),
+    DatabaseSpec(
+        "chinook",
+        "MIXED",
+        "media-team@company.com",
+        "MEDIUM",
+        "Digital media store with basic service integrations",
+    ),
+    DatabaseSpec(
+        "netflix",
+        "MIXED",
+        "content-team@company.com",
+        "MEDIUM",
+        "Content catalog with lightweight service connections",
+    ),
+    # Logic-Heavy scenarios
+    DatabaseSpec(
+        "employees",
+        "LOGIC_HEAVY",
+        "hr-team@company.com",
+        "CRITICAL",
+        "Enterprise payroll system with critical business operations",
+    ),
+    DatabaseSpec(
+        "lego",
+        "LOGIC_HEAVY",
+        "analytics-team@company.com",
+        "CRITICAL",
+        "Product analytics and revenue forecasting system",
+    ),
+    DatabaseSpec(
+        "postgres_air",
+        "LOGIC_HEAVY",
+        "operations-team@company.com",
+        "CRITICAL",
+        "Flight operations and safety-critical airline database",
+    ),
+)
+
+
+# Lowercase forms of every scenario and criticality value, interned once so the
+# templates reuse one string object instead of calling .lower() per render
+LOWER: Dict[str, str] = {
+    value: sys.intern(value.lower())
+    for value in ("CONFIG_ONLY", "MIXED", "LOGIC_HEAVY", "LOW", "MEDIUM", "CRITICAL")
+}
+
+
+def compile_template(template, fixed):
+    """Split a format template into (chunk, field) segments with ``fixed`` folded in
+
+    Fields found in ``fixed`` are formatted once and merged into the surrounding
+    constant text; only the remaining per-database fields are left to render.
+    """
+    segments = []
+    chunk = ""
+    for literal, field, spec, conversion in Formatter().parse(template):
+        chunk += literal
+        if field is None:
+            continue
+        if field in fixed:
+            value = fixed[field]
+            if conversion:
+                value = repr(value) if conversion == "r" else str(value)
+            chunk += format(value, spec)
+        else:
+            segments.append((chunk, field))
+            chunk = ""
+    segments.append((chunk, None))
+    return tuple(segments)
+
+
+def render(segments, fields):
+    """Render compiled template segments with the per-database ``fields``"""
+    parts = []
+    for chunk, field in segments:
+        parts.append(chunk)
+        if field is not None:
+            parts.append(fields[field])
+    return "".join(parts)
+
+
+def encode_segments(segments):
+    """Pre-encode the constant chunks of compiled segments to UTF-8 bytes"""
+    return tuple((chunk.encode("utf-8"), field) for chunk, field in segments)
+
+
+def render_bytes(segments, fields):
+    """Render encoded segments straight to a payload, encoding only ``fields``"""
+    parts = []
+    for chunk, field in segments:
+        parts.append(chunk)
+        if field is not None:
+            parts.append(fields[field].encode("utf-8"))
+    return b"".join(parts)
+
+
+def write_payload(output):
+    """Write one pre-encoded (filename, payload) pair unless the file already holds it
+
+    Returns whether the file was written; unchanged files keep their mtime so
+    re-runs don't wake up downstream watchers.
+    """
+    filename, payload = output
+    return write_if_changed(Path(filename), payload)
@@ -0,0 +1,666 @@
+#!/usr/bin/env python3
+"""
+Database Decommissioning Scenarios Deployment
+=============================================
+
+Asyncio deployment driver; deploy_scenarios.sh delegates to it. External
+tools (terraform, kubectl, helm, az, docker) run as concurrent subprocesses,
+capped by a semaphore, so independent steps overlap their network waits.
+Every finished command is recorded and the deployment report is written from
+those records.
+
+Usage: python deploy_scenarios.py <environment> [options]
+       ./deploy_scenarios.sh <environment> [options]
+
+Author: Database Team
+Version: 1.0
+"""
+
+import argparse
+import asyncio
+import base64
+import getpass
+import hashlib
+import os
+import shutil
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Dict, List, Optional, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent
+LOG_FILE = REPO_ROOT / "deployment.log"
+
+# Upper bound on external processes running at the same time
+MAX_CONCURRENT_PROCESSES = 8
+TF_PARALLELISM = os.environ.get("TF_PARALLELISM", "20")
+
+# Cached Azure account probe, reused for AZ_ACCOUNT_CACHE_TTL minutes
+AZ_ACCOUNT_CACHE = Path(
+    os.environ.get("XDG_RUNTIME_DIR", "/tmp"),
+    f"az_account_{os.environ.get('ARM_SUBSCRIPTION_ID', 'default')}.json",
+)
+AZ_ACCOUNT_CACHE_TTL = int(os.environ.get("AZ_ACCOUNT_CACHE_TTL", "10"))
+AZ_ARM_RESOURCE = "https://management.azure.com"
+
+REQUIRED_TOOLS = ("terraform", "az", "helm", "docker")
+ENVIRONMENTS = ("dev", "staging", "prod")
+
+# Databases whose monitors are deployed with each environment
+ENVIRONMENT_DATABASES = {
+    "dev": ("periodic_table", "world_happiness", "titanic"),
+    "staging": ("pagila", "chinook", "netflix"),
+    "prod": ("employees", "lego", "postgres_air"),
+}
+
+REPORT_SUMMARY = {
+    "dev": "- Deployed Config-Only scenarios: periodic_table, world_happiness, titanic",
+    "staging": "- Deployed Mixed scenarios: pagila, chinook, netflix",
+    "prod": "- Deployed Logic-Heavy scenarios: employees, lego, postgres_air",
+    "all": "- Deployed all scenarios across dev, staging, and prod environments",
+}
+
+STAGING_MAIN_TF = """\
+# Staging environment for Mixed scenarios
+terraform {
+  required_providers {
+    azurerm = {
+      source  = "hashicorp/azurerm"
+      version = "~>3.0"
+    }
+  }
+}
+
+provider "azurerm" {
+  features {}
+}
+
+# Mixed scenario databases: pagila, chinook, netflix
+# (Implementation would be similar to dev but with different configs)
+"""
+
+SERVICES_COMPOSE = """\
+version: '3.8'
+services:
+  database-service:
+    build:
+      context: ./src
+      dockerfile: ../Dockerfile.services
+    environment:
+      - ENVIRONMENT=staging
+      - PAGILA_DB_HOST=${PAGILA_DB_HOST}
+      - CHINOOK_DB_HOST=${CHINOOK_DB_HOST}
+      - NETFLIX_DB_HOST=${NETFLIX_DB_HOST}
+    ports:
+      - "8080:8080"
+    healthcheck:
+      test: ["CMD", "curl", "-f", "http://localhost:8080/health"]
+      interval: 30s
+      timeout: 10s
+      retries: 3
+"""
+
+# Color codes for output
+RED = "\033[0;31m"
+GREEN = "\033[0;32m"
+YELLOW = "\033[1;33m"
+BLUE = "\033[0;34m"
+NC = "\033[0m"  # No Color
+
+
+def services_source_hash() -> str:
+    """Content hash of everything the database-service image is built from"""
+    digest = hashlib.sha256()
+    sources = [REPO_ROOT / "Dockerfile.services"]
+    for directory in ("services", "config"):
+        sources += (REPO_ROOT / "src" / directory).rglob("*")
+    for path in sorted(p for p in sources if p.is_file()):
+        digest.update(str(path.relative_to(REPO_ROOT)).encode() + b"\0")
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def namespace_manifest(name: str) -> bytes:
+    """Kubernetes Namespace manifest, applied from stdin"""
+    return (
+        f"apiVersion: v1\nkind: Namespace\nmetadata:\n  name: {name}\n"
+    ).encode()
+
+
+@dataclass(frozen=True)
+class Completion:
+    """Completion record for one external command"""
+
+    environment: str
+    command: Tuple[str, ...]
+    returncode: int
+    duration: float
+
+
+class DeploymentError(Exception):
+    """A deployment step failed"""
+
+
+class ScenarioDeployer:
+    """Runs the deployment steps for one or more environments"""
+
+    def __init__(self, dry_run: bool = False, force: bool = False):
+        self.dry_run = dry_run
+        self.force = force
+        self.completions: List[Completion] = []
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_PROCESSES)
+        # The Terraform plugin cache is not safe for concurrent writers
+        self._terraform_init_lock = asyncio.Lock()
+        self._outputs: Dict[str, IO[bytes]] = {}
+        self._log = open(LOG_FILE, "a", encoding="utf-8")
+
+        self._env = dict(os.environ, TF_IN_AUTOMATION="1", TF_INPUT="0")
+        self._env.setdefault("AZURE_CONFIG_DIR", str(Path.home() / ".azure"))
+        self._env.setdefault("AAD_LOGIN_METHOD", "azurecli")
+        self._env.setdefault(
+            "TF_PLUGIN_CACHE_DIR", str(REPO_ROOT / ".terraform.d" / "plugin-cache")
+        )
+        Path(self._env["TF_PLUGIN_CACHE_DIR"]).mkdir(parents=True, exist_ok=True)
+        # One admin password per run, shared by every environment. Terraform
+        # reads it from TF_VAR_admin_password, so it never appears in argv,
+        # in the process list or in the recorded commands of the report.
+        self.admin_password = self._env.setdefault(
+            "DB_ADMIN_PASSWORD", base64.b64encode(os.urandom(24)).decode()
+        )
+        self._env["TF_VAR_admin_password"] = self.admin_password
+        # Set once production deployment has been approved for this run
+        self._prod_approved = force
+
+    # Logging
+
+    def log(self, message: str) -> None:
+        """Write a timestamped line to stdout and the deployment log"""
+        line = f"{datetime.now():%Y-%m-%d %H:%M:%S} - {message}"
+        print(line)
+        self._log.write(line + "\n")
+        self._log.flush()
+
+    def info(self, message: str) -> None:
+        print(f"{BLUE}ℹ️  {message}{NC}")
+        self.log(f"INFO: {message}")
+
+    def success(self, message: str) -> None:
+        print(f"{GREEN}✅ {message}{NC}")
+        self.log(f"SUCCESS: {message}")
+
+    def warning(self, message: str) -> None:
+        print(f"{YELLOW}⚠️  {message}{NC}")
+        self.log(f"WARNING: {message}")
+
+    def error(self, message: str) -> None:
+        print(f"{RED}ERROR: {message}{NC}", file=sys.stderr)
+        self.log(f"ERROR: {message}")
+
+    def close(self) -> None:
+        for output in self._outputs.values():
+            output.close()
+        self._log.close()
+
+    # Subprocesses
+
+    async def run(
+        self,
+        environment: str,
+        *command: str,
+        cwd: Optional[Path] = None,
+        stdin: Optional[bytes] = None,
+        check: bool = True,
+        quiet: bool = False,
+    ) -> int:
+        """Run an external command under the concurrency cap and record it"""
+        output = asyncio.subprocess.DEVNULL if quiet else self._outputs.get(environment)
+        async with self._semaphore:
+            started = time.monotonic()
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                cwd=cwd,
+                env=self._env,
+                stdin=asyncio.subprocess.PIPE if stdin is not None else None,
+                stdout=output,
+                stderr=asyncio.subprocess.DEVNULL if quiet else None,
+            )
+            await process.communicate(stdin)
+
+        self.completions.append(
+            Completion(environment, command, process.returncode, time.monotonic() - started)
+        )
+        if check and process.returncode != 0:
+            raise DeploymentError(
+                f"'{' '.join(command[:2])}' failed with exit code {process.returncode}"
+            )
+        return process.returncode
+
+    async def terraform_init(self, environment: str, tf_dir: Path) -> None:
+        """Initialize Terraform; concurrent inits take turns on the plugin cache"""
+        async with self._terraform_init_lock:
+            await self.run(environment, "terraform", "init", cwd=tf_dir)
+
+    async def kubectl_apply(
+        self, environment: str, *args: str, stdin: Optional[bytes] = None
+    ) -> None:
+        """Server-side apply: one PATCH per object, conflicts resolved by the API server"""
+        await self.run(
+            environment,
+            "kubectl",
+            "apply",
+            "--server-side",
+            "--force-conflicts",
+            "--field-manager=deploy-scenarios",
+            *args,
+            stdin=stdin,
+        )
+
+    # Checks
+
+    async def check_prerequisites(self) -> None:
+        """Check required tools and Azure authentication"""
+        self.info("Checking deployment prerequisites...")
+
+        for tool in REQUIRED_TOOLS:
+            if shutil.which(tool) is None:
+                raise DeploymentError(f"{tool} is required but not installed")
+
+        if not await self._az_account_cached():
+            raise DeploymentError("Azure CLI not authenticated. Run 'az login' first.")
+
+        if not os.access(self._env["AZURE_CONFIG_DIR"], os.W_OK):
+            self.warning(
+                f"Azure token cache {self._env['AZURE_CONFIG_DIR']} is not writable; "
+                "tools will re-authenticate"
+            )
+
+        if not os.environ.get("ARM_SUBSCRIPTION_ID"):
+            self.warning("Environment variable ARM_SUBSCRIPTION_ID is not set")
+
+        self.success("Prerequisites check completed")
+
+    async def _az_account_cached(self) -> bool:
+        """Probe Azure authentication unless the cached probe is still fresh"""
+        try:
+            stat = AZ_ACCOUNT_CACHE.stat()
+            if stat.st_size and time.time() - stat.st_mtime < AZ_ACCOUNT_CACHE_TTL * 60:
+                return True
+        except FileNotFoundError:
+            pass
+
+        process = await asyncio.create_subprocess_exec(
+            "az",
+            "account",
+            "get-access-token",
+            "--resource",
+            AZ_ARM_RESOURCE,
+            "--query",
+            "{subscription: subscription, tenant: tenant, expiresOn: expiresOn}",
+            "--output",
+            "json",
+            env=self._env,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        account, _ = await process.communicate()
+        if process.returncode != 0:
+            return False
+        AZ_ACCOUNT_CACHE.write_bytes(account)
+        return True
+
+    def validate_scenarios(self) -> None:
+        """Run the scenario validator in this interpreter"""
+        self.info("Validating database scenarios...")
+
+        import test_scenarios_validation
+
+        if test_scenarios_validation.main() != 0:
+            raise DeploymentError(
+                "Scenario validation failed. Fix issues before deployment."
+            )
+        self.success("Scenario validation passed")
+
+    # Environments
+
+    async def deploy_dev(self) -> None:
+        """Deploy development environment (Config-Only)"""
+        self.info("Deploying development environment (Config-Only scenarios)...")
+
+        tf_dir = REPO_ROOT / "terraform" / "environments" / "dev"
+        if not (tf_dir / "databases.tf").is_file():
+            # Copy our generated file to the expected location
+            tf_dir.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(REPO_ROOT / "terraform_dev_databases.tf", tf_dir / "databases.tf")
+
+        self.info("Initializing Terraform...")
+        await self.terraform_init("dev", tf_dir)
+
+        if self.dry_run:
+            self.info("Planning Terraform deployment...")
+            await self.run("dev", "terraform", "plan", "-out=dev.tfplan", cwd=tf_dir)
+            self.info("Dry run completed. Plan saved to dev.tfplan")
+            return
+
+        self.info("Applying Terraform configuration...")
+        await self.run(
+            "dev",
+            "terraform",
+            "apply",
+            "-auto-approve",
+            f"-parallelism={TF_PARALLELISM}",
+            cwd=tf_dir,
+        )
+
+        await self.deploy_monitoring("dev")
+        self.success("Development environment deployed successfully")
+
+    async def deploy_staging(self) -> None:
+        """Deploy staging environment (Mixed scenarios)"""
+        self.info("Deploying staging environment (Mixed scenarios)...")
+
+        # Generate staging config (simplified for demo)
+        tf_dir = REPO_ROOT / "terraform" / "environments" / "staging"
+        tf_dir.mkdir(parents=True, exist_ok=True)
+        (tf_dir / "main.tf").write_text(STAGING_MAIN_TF, encoding="utf-8")
+
+        await self.terraform_init("staging", tf_dir)
+
+        if self.dry_run:
+            self.info("Dry run - staging Terraform configuration created")
+            return
+
+        await self.deploy_service_layer()
+        await self.deploy_monitoring("staging")
+        self.success("Staging environment deployed successfully")
+
+    async def deploy_prod(self) -> None:
+        """Deploy production environment (Logic-Heavy)"""
+        self.info("Deploying production environment (Logic-Heavy scenarios)...")
+
+        self.confirm_prod_approval()
+
+        tf_dir = REPO_ROOT / "terraform" / "environments" / "prod"
+        if not (tf_dir / "critical_databases.tf").is_file():
+            tf_dir.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(
+                REPO_ROOT / "terraform_prod_critical_databases.tf",
+                tf_dir / "critical_databases.tf",
+            )
+
+        await self.terraform_init("prod", tf_dir)
+
+        if self.dry_run:
+            await self.run("prod", "terraform", "plan", cwd=tf_dir)
+            self.info("Production deployment plan completed")
+            return
+
+        await self.deploy_critical_systems()
+        await self.deploy_monitoring("prod")
+        self.success("Production environment deployed successfully")
+
+    def confirm_prod_approval(self) -> None:
+        """Ask for production approval unless --force was given or it was granted"""
+        # Production deployment requires additional approvals
+        self.warning("Production deployment requires executive approval")
+
+        if not self._prod_approved:
+            if not sys.stdin.isatty():
+                raise DeploymentError(
+                    "Production deployment needs an interactive terminal or --force"
+                )
+            reply = input("Are you authorized to deploy to production? (yes/no): ")
+            if reply.strip().lower() != "yes":
+                raise DeploymentError("Production deployment cancelled")
+            self._prod_approved = True
+
+    async def deploy_all(self) -> None:
+        """Deploy every environment concurrently, each with its own output log"""
+        # Ask once, before the environments start, so the prompt is not
+        # interleaved with their output
+        self.confirm_prod_approval()
+
+        for environment in ENVIRONMENTS:
+            self._outputs[environment] = open(
+                REPO_ROOT / f"deployment.{environment}.log", "wb"
+            )
+
+        outcomes = await asyncio.gather(
+            self.deploy_dev(),
+            self.deploy_staging(),
+            self.deploy_prod(),
+            return_exceptions=True,
+        )
+        failed = []
+        for environment, outcome in zip(ENVIRONMENTS, outcomes):
+            if isinstance(outcome, BaseException):
+                self.error(f"{environment}: {outcome}")
+                failed.append(environment)
+        if failed:
+            raise DeploymentError(
+                f"Deployment failed for: {' '.join(failed)} "
+                "(see deployment.<environment>.log)"
+            )
+
+    # Components
+
+    async def deploy_service_layer(self) -> None:
+        """Deploy service layer for mixed scenarios"""
+        self.info("Deploying service layer applications...")
+
+        # Only rewrite the compose file when its content changes
+        compose_file = REPO_ROOT / "docker-compose.services.yml"
+        try:
+            unchanged = compose_file.read_text(encoding="utf-8") == SERVICES_COMPOSE
+        except FileNotFoundError:
+            unchanged = False
+        if not unchanged:
+            compose_file.write_text(SERVICES_COMPOSE, encoding="utf-8")
+
+        up_args = ("up", "-d", "--remove-orphans")
+        if await self.run(
+            "staging", "docker", "compose", "version", check=False, quiet=True
+        ) == 0:
+            compose = ("docker", "compose", "-f", compose_file.name)
+            up_args += ("--wait",)
+        elif shutil.which("docker-compose"):
+            compose = ("docker-compose", "-f", compose_file.name)
+        else:
+            self.warning("Docker Compose not available, skipping service layer deployment")
+            return
+
+        # The build context is src/ only; rebuild the image when the service
+        # sources or the Dockerfile actually change, not on every deploy
+        hash_file = REPO_ROOT / ".services.hash"
+        services_hash = services_source_hash()
+        if not hash_file.is_file() or hash_file.read_text() != services_hash:
+            self.info("Service sources changed, rebuilding database-service image...")
+            await self.run("staging", *compose, "build", "database-service", cwd=REPO_ROOT)
+            hash_file.write_text(services_hash)
+
+        await self.run("staging", *compose, *up_args, cwd=REPO_ROOT)
+        self.success("Service layer deployed")
+
+    async def deploy_critical_systems(self) -> None:
+        """Deploy critical systems for logic-heavy scenarios"""
+        self.info("Deploying critical business systems...")
+
+        if shutil.which("kubectl") is None:
+            self.warning("kubectl not available, skipping Kubernetes deployment")
+            return
+
+        await self.kubectl_apply(
+            "prod", "-f", "-", stdin=namespace_manifest("business-systems")
+        )
+
+        charts = {
+            "employees-payroll": REPO_ROOT / "helm-charts" / "employees",
+            "lego-analytics": REPO_ROOT / "helm-charts" / "lego",
+        }
+        # Resolve chart dependencies before the parallel installs
+        for chart in charts.values():
+            await self.run("prod", "helm", "dependency", "build", f"{chart}/")
+
+        await asyncio.gather(
+            *(
+                self.run(
+                    "prod",
+                    "helm",
+                    "upgrade",
+                    "--install",
+                    release,
+                    f"{chart}/",
+                    "--namespace",
+                    "business-systems",
+                    "--atomic",
+                    "--timeout",
+                    "5m",
+                    "--wait",
+                )
+                for release, chart in charts.items()
+            )
+        )
+        self.success("Critical systems deployed to Kubernetes")
+
+    async def deploy_monitoring(self, environment: str) -> None:
+        """Deploy the namespace and all monitors of an environment in one apply"""
+        self.info(f"Deploying monitoring for {environment} environment...")
+
+        if shutil.which("kubectl") is None:
+            self.warning("kubectl not available, skipping monitoring deployment")
+            return
+
+        # One directory read instead of a stat per database
+        available = set(REPO_ROOT.glob("datadog_monitor_*.yaml"))
+        files = []
+        for db in ENVIRONMENT_DATABASES[environment]:
+            monitor = REPO_ROOT / f"datadog_monitor_{db}.yaml"
+            if monitor in available:
+                files += ["-f", str(monitor)]
+
+        await self.kubectl_apply(
+            environment,
+            "-n",
+            "monitoring",
+            "-f",
+            "-",
+            *files,
+            stdin=namespace_manifest("monitoring"),
+        )
+        self.success("Monitoring configurations deployed")
+
+    # Report
+
+    def generate_report(self, environment: str) -> None:
+        """Write the deployment report, including every recorded command"""
+        self.info(f"Generating deployment report for {environment}...")
+
+        lines = [
+            f"# Deployment Report - {environment} Environment",
+            "",
+            f"**Deployment Date:** {datetime.now():%c}",
+            f"**Environment:** {environment}",
+            f"**Deployed By:** {getpass.getuser()}",
+            "",
+            "## Deployment Summary",
+            "",
+            REPORT_SUMMARY[environment],
+            "",
+            "## Infrastructure Deployed",
+            "",
+            "- Terraform configurations applied",
+            "- Database servers provisioned",
+            "- Monitoring alerts configured",
+            "- Service layer deployed" if environment != "dev" else "- ",
+            "",
+            "## Commands Run",
+            "",
+            "| Environment | Command | Exit Code | Duration |",
+            "|-------------|---------|-----------|----------|",
+        ]
+        for completion in self.completions:
+            lines.append(
+                f"| {completion.environment} | `{' '.join(completion.command[:3])}` "
+                f"| {completion.returncode} | {completion.duration:.1f}s |"
+            )
+        lines += [
+            "",
+            "## Next Steps",
+            "",
+            "1. Verify database connectivity",
+            "2. Run scenario validation: `python test_scenarios_validation.py`",
+            "3. Monitor Datadog alerts",
+            "4. Test decommissioning workflow",
+            "",
+            "## Support",
+            "",
+            "For issues, contact: database-team@company.com",
+            "",
+        ]
+
+        report = REPO_ROOT / f"deployment_report_{environment}.md"
+        report.write_text("\n".join(lines), encoding="utf-8")
+        self.success(f"Deployment report generated: {report.name}")
+
+
+async def deploy(args: argparse.Namespace) -> int:
+    """Run the requested deployment and return the exit code"""
+    deployer = ScenarioDeployer(dry_run=args.dry_run, force=args.force)
+    try:
+        deployer.info("Starting database decommissioning scenarios deployment")
+        deployer.info(f"Environment: {args.environment}")
+        deployer.info(f"Dry run: {str(args.dry_run).lower()}")
+
+        await deployer.check_prerequisites()
+
+        if not args.skip_validation:
+            deployer.validate_scenarios()
+
+        if args.validate_only:
+            deployer.success("Validation completed successfully")
+            return 0
+
+        if args.environment == "all":
+            await deployer.deploy_all()
+        else:
+            await getattr(deployer, f"deploy_{args.environment}")()
+
+        deployer.generate_report(args.environment)
+        deployer.success("Deployment completed successfully!")
+        deployer.info("Check deployment.log for detailed logs")
+        return 0
+    except DeploymentError as e:
+        deployer.error(str(e))
+        return 1
+    finally:
+        deployer.close()
+
+
+def main() -> int:
+    """Main deployment entry point"""
+    parser = argparse.ArgumentParser(
+        description="Deploy database decommissioning test scenarios"
+    )
+    parser.add_argument("environment", choices=(*ENVIRONMENTS, "all"))
+    parser.add_argument(
+        "--validate-only", action="store_true", help="Run validation only, no deployment"
+    )
+    parser.add_argument(
+        "--skip-validation", action="store_true", help="Skip scenario validation"
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Show what would be deployed"
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="Force deployment even with warnings"
+    )
+    args = parser.parse_args()
+
+    # The validator and generated files work relative to the repository root
+    os.chdir(REPO_ROOT)
+    return asyncio.run(deploy(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+# Generate the Datadog monitor and Helm values files for every database in one pass
+import argparse
+import io
+import os
+import sys
+import tarfile
+from concurrent.futures import ThreadPoolExecutor
+
+from database_inventory import DATABASES, write_payload
+from script_8 import monitor_file
+from script_9 import helm_values_file
+
+
+def build():
+    """Return the (filename, payload) pairs of both config files, database by database"""
+    outputs = []
+    for db in DATABASES:
+        outputs.append(monitor_file(db))
+        outputs.append(helm_values_file(db))
+    return tuple(outputs)
+
+
+def build_bundle():
+    """Return a tar archive of every config file at its deployed repository path
+
+    Members carry a fixed mtime (SOURCE_DATE_EPOCH, else 0), so the same
+    configs always produce the same bytes.
+    """
+    buffer = io.BytesIO()
+    mtime = int(os.environ.get("SOURCE_DATE_EPOCH", "0"))
+    with tarfile.open(fileobj=buffer, mode="w") as tar:
+        for db in DATABASES:
+            members = (
+                (f"monitoring/database-monitors/{db.name}_monitor.yaml", monitor_file(db)),
+                (f"helm-charts/{db.name}/values.yaml", helm_values_file(db)),
+            )
+            for member, (_, payload) in members:
+                info = tarfile.TarInfo(member)
+                info.size = len(payload)
+                info.mtime = mtime
+                info.mode = 0o644
+                tar.addfile(info, io.BytesIO(payload))
+    return buffer.getvalue()
+
+
+def main():
+    """Render every config file, then write them all concurrently or as one bundle"""
+    parser = argparse.ArgumentParser(
+        description="Generate Datadog monitor and Helm values configs for all databases"
+    )
+    parser.add_argument(
+        "--bundle",
+        metavar="PATH",
+        help="write a single tar archive instead of loose files (e.g. db_configs.tar)",
+    )
+    args = parser.parse_args()
+
+    if args.bundle:
+        # The whole archive is assembled in memory and lands in one write
+        write_payload((args.bundle, build_bundle()))
+        print(f"✅ Bundled monitor and Helm values configurations into {args.bundle}")
+        return
+
+    outputs = build()
+    with ThreadPoolExecutor(max_workers=len(outputs)) as executor:
+        written = sum(executor.map(write_payload, outputs))
+
+    # One write for the whole summary instead of a print per line
+    sys.stdout.write(
+        f"✅ Created monitor and Helm values configurations for all {len(DATABASES)} databases\n"
+        f"{written} of {len(outputs)} files regenerated\n"
+        "Files created:\n"
+        + "".join(
+            f"  - {db.name} ({db.scenario}, {db.criticality}):\n"
+            f"      monitoring/database-monitors/{db.name}_monitor.yaml\n"
+            f"      helm-charts/{db.name}/values.yaml\n"
+            for db in DATABASES
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,25 +1,116 @@
 # Create comprehensive database ownership documentation
-database_ownership_doc = """# Database Ownership and Decommissioning Documentation
+import gzip
+import json
+import sys
+from dataclasses import asdict, dataclass
+from html import escape
+from pathlib import Path
+from string import Template
+from typing import Dict, Optional, Tuple
+
+from artifact_writes import preflight, write_if_changed
+
+
+@dataclass(frozen=True, slots=True)
+class DBRecord:
+    """Single row of the database inventory table"""
+    name: str
+    scenario: str
+    crit: str
+    team: str
+    email: str
+    last_used: str
+    risk: str
+
+
+@dataclass(frozen=True, slots=True)
+class TeamRecord:
+    """Owner team block rendered under the Owner Team Details section"""
+    name: str
+    primary: str
+    primary_email: str
+    secondary: str
+    secondary_email: str
+    slack: str
+    impact: str
+    approval: str
+    escalation: Optional[str] = None
+
+
+# Shared atoms (team names, emails, enum-like values) so every record points at one copy
+_ATOMS: Dict[str, str] = {}
+
+
+def _i(value: str) -> str:
+    """Intern a repeated record string"""
+    return _ATOMS.setdefault(value, sys.intern(value))
+
+
+# Single source of truth for the inventory table and the team sections
+DBS: Tuple[DBRecord, ...] = (
+    DBRecord(_i("periodic_table"), _i("CONFIG_ONLY"), _i("LOW"), _i("Chemistry Team"), _i("chemistry-team@company.com"), _i("2024-02-20"), _i("HIGH")),
+    DBRecord(_i("world_happiness"), _i("CONFIG_ONLY"), _i("LOW"), _i("Analytics Team"), _i("analytics-team@company.com"), _i("2024-01-30"), _i("HIGH")),
+    DBRecord(_i("titanic"), _i("CONFIG_ONLY"), _i("LOW"), _i("Data Science Team"), _i("data-science-team@company.com"), _i("2024-02-10"), _i("HIGH")),
+    DBRecord(_i("pagila"), _i("MIXED"), _i("MEDIUM"), _i("Development Team"), _i("development-team@company.com"), _i("2024-04-15"), _i("MEDIUM")),
+    DBRecord(_i("chinook"), _i("MIXED"), _i("MEDIUM"), _i("Media Team"), _i("media-team@company.com"), _i("2024-03-25"), _i("MEDIUM")),
+    DBRecord(_i("netflix"), _i("MIXED"), _i("MEDIUM"), _i("Content Team"), _i("content-team@company.com"), _i("2024-05-10"), _i("MEDIUM")),
+    DBRecord(_i("employees"), _i("LOGIC_HEAVY"), _i("CRITICAL"), _i("HR Team"), _i("hr-team@company.com"), _i("2025-06-24"), _i("LOW")),
+    DBRecord(_i("lego"), _i("LOGIC_HEAVY"), _i("CRITICAL"), _i("Analytics Team"), _i("analytics-team@company.com"), _i("2025-06-24"), _i("LOW")),
+    DBRecord(_i("postgres_air"), _i("LOGIC_HEAVY"), _i("CRITICAL"), _i("Operations Team"), _i("operations-team@company.com"), _i("2025-06-24"), _i("LOW")),
+)
+
+TEAMS: Tuple[TeamRecord, ...] = (
+    TeamRecord(_i("Chemistry Team"), "Dr. Sarah Chen", "sarah.chen@company.com",
+               "Dr. Michael Rodriguez", "michael.rodriguez@company.com", "#chemistry-team",
+               "Research and educational applications", "Team Lead (Sarah Chen)"),
+    TeamRecord(_i("Analytics Team"), "Jennifer Wang", "jennifer.wang@company.com",
+               "David Park", "david.park@company.com", "#analytics-team",
+               "Business intelligence and strategic reporting", "Analytics Director (Jennifer Wang)"),
+    TeamRecord(_i("Data Science Team"), "Dr. Alex Thompson", "alex.thompson@company.com",
+               "Maria Garcia", "maria.garcia@company.com", "#data-science",
+               "ML model training and research", "Data Science Manager (Alex Thompson)"),
+    TeamRecord(_i("Development Team"), "Kevin Liu", "kevin.liu@company.com",
+               "Rachel Kim", "rachel.kim@company.com", "#development",
+               "Application development and testing", "Development Manager (Kevin Liu)"),
+    TeamRecord(_i("Media Team"), "James Wilson", "james.wilson@company.com",
+               "Lisa Brown", "lisa.brown@company.com", "#media-team",
+               "Digital media catalog management", "Media Director (James Wilson)"),
+    TeamRecord(_i("Content Team"), "Emma Davis", "emma.davis@company.com",
+               "Robert Johnson", "robert.johnson@company.com", "#content-team",
+               "Content recommendation systems", "Content Manager (Emma Davis)"),
+    TeamRecord(_i("HR Team"), "Patricia Miller", "patricia.miller@company.com",
+               "Mark Anderson", "mark.anderson@company.com", "#hr-team",
+               "CRITICAL - $50M+ annual payroll operations",
+               "Chief Human Resources Officer (Patricia Miller)",
+               "CFO approval required for any changes"),
+    TeamRecord(_i("Operations Team"), "Thomas White", "thomas.white@company.com",
+               "Nancy Taylor", "nancy.taylor@company.com", "#operations",
+               "CRITICAL - Flight safety and regulatory compliance",
+               "Chief Operations Officer (Thomas White)",
+               "CTO approval required for any changes"),
+)
+
+_TEAM_TEMPLATE = Template("""### $name
+- **Primary Contact:** $primary ($primary_email)
+- **Secondary Contact:** $secondary ($secondary_email)
+- **Slack Channel:** $slack
+- **Databases:** $databases
+- **Business Impact:** $impact
+- **Approval Authority:** $approval""")
+
+
+# Document sections, joined with blank lines by render_doc
+_OVERVIEW = Template("""# Database Ownership and Decommissioning Documentation
 
 ## Overview
 
-This document provides comprehensive ownership information for all databases in the postgres-sample-dbs testing environment, designed to simulate realistic database decommissioning workflows.
+This document provides comprehensive ownership information for all databases in the postgres-sample-dbs testing environment, designed to simulate realistic database decommissioning workflows.""")
 
-## Database Inventory
+_INVENTORY = Template("""## Database Inventory
 
-| Database | Scenario Type | Criticality | Owner Team | Contact Email | Last Used | Decommissioning Risk |
-|----------|---------------|-------------|------------|---------------|-----------|---------------------|
-| periodic_table | CONFIG_ONLY | LOW | Chemistry Team | chemistry-team@company.com | 2024-02-20 | HIGH |
-| world_happiness | CONFIG_ONLY | LOW | Analytics Team | analytics-team@company.com | 2024-01-30 | HIGH |
-| titanic | CONFIG_ONLY | LOW | Data Science Team | data-science-team@company.com | 2024-02-10 | HIGH |
-| pagila | MIXED | MEDIUM | Development Team | development-team@company.com | 2024-04-15 | MEDIUM |
-| chinook | MIXED | MEDIUM | Media Team | media-team@company.com | 2024-03-25 | MEDIUM |
-| netflix | MIXED | MEDIUM | Content Team | content-team@company.com | 2024-05-10 | MEDIUM |
-| employees | LOGIC_HEAVY | CRITICAL | HR Team | hr-team@company.com | 2025-06-24 | LOW |
-| lego | LOGIC_HEAVY | CRITICAL | Analytics Team | analytics-team@company.com | 2025-06-24 | LOW |
-| postgres_air | LOGIC_HEAVY | CRITICAL | Operations Team | operations-team@company.com | 2025-06-24 | LOW |
+$inventory""")
 
-## Scenario Type Definitions
+_SCENARIO_DEFS = Template("""## Scenario Type Definitions
 
 ### CONFIG_ONLY Databases
 **Characteristics:**
@@ -67,77 +158,13 @@ This document provides comprehensive ownership information for all databases in
 2. MANDATORY manual review by database team
 3. Executive approval required (CFO/CTO level)
 4. Business impact assessment
-5. Migration plan required before removal
-
-## Owner Team Details
-
-### Chemistry Team
-- **Primary Contact:** Dr. Sarah Chen (sarah.chen@company.com)
-- **Secondary Contact:** Dr. Michael Rodriguez (michael.rodriguez@company.com)
-- **Slack Channel:** #chemistry-team
-- **Databases:** periodic_table
-- **Business Impact:** Research and educational applications
-- **Approval Authority:** Team Lead (Sarah Chen)
-
-### Analytics Team
-- **Primary Contact:** Jennifer Wang (jennifer.wang@company.com)
-- **Secondary Contact:** David Park (david.park@company.com)
-- **Slack Channel:** #analytics-team
-- **Databases:** world_happiness, lego
-- **Business Impact:** Business intelligence and strategic reporting
-- **Approval Authority:** Analytics Director (Jennifer Wang)
-
-### Data Science Team
-- **Primary Contact:** Dr. Alex Thompson (alex.thompson@company.com)
-- **Secondary Contact:** Maria Garcia (maria.garcia@company.com)
-- **Slack Channel:** #data-science
-- **Databases:** titanic
-- **Business Impact:** ML model training and research
-- **Approval Authority:** Data Science Manager (Alex Thompson)
-
-### Development Team
-- **Primary Contact:** Kevin Liu (kevin.liu@company.com)
-- **Secondary Contact:** Rachel Kim (rachel.kim@company.com)
-- **Slack Channel:** #development
-- **Databases:** pagila
-- **Business Impact:** Application development and testing
-- **Approval Authority:** Development Manager (Kevin Liu)
-
-### Media Team
-- **Primary Contact:** James Wilson (james.wilson@company.com)
-- **Secondary Contact:** Lisa Brown (lisa.brown@company.com)
-- **Slack Channel:** #media-team
-- **Databases:** chinook
-- **Business Impact:** Digital media catalog management
-- **Approval Authority:** Media Director (James Wilson)
-
-### Content Team
-- **Primary Contact:** Emma Davis (emma.davis@company.com)
-- **Secondary Contact:** Robert Johnson (robert.johnson@company.com)
-- **Slack Channel:** #content-team
-- **Databases:** netflix
-- **Business Impact:** Content recommendation systems
-- **Approval Authority:** Content Manager (Emma Davis)
-
-### HR Team
-- **Primary Contact:** Patricia Miller (patricia.miller@company.com)
-- **Secondary Contact:** Mark Anderson (mark.anderson@company.com)
-- **Slack Channel:** #hr-team
-- **Databases:** employees
-- **Business Impact:** CRITICAL - $50M+ annual payroll operations
-- **Approval Authority:** Chief Human Resources Officer (Patricia Miller)
-- **Executive Escalation:** CFO approval required for any changes
-
-### Operations Team
-- **Primary Contact:** Thomas White (thomas.white@company.com)
-- **Secondary Contact:** Nancy Taylor (nancy.taylor@company.com)
-- **Slack Channel:** #operations
-- **Databases:** postgres_air
-- **Business Impact:** CRITICAL - Flight safety and regulatory compliance
-- **Approval Authority:** Chief Operations Officer (Thomas White)
-- **Executive Escalation:** CTO approval required for any changes
-
-## Decommissioning Risk Assessment
+5. Migration plan required before removal""")
+
+_TEAMS = Template("""## Owner Team Details
+
+$teams""")
+
+_RISK = Template("""## Decommissioning Risk Assessment
 
 ### HIGH RISK (Config-Only)
 - **Risk Level:** HIGH for decommissioning
@@ -158,9 +185,9 @@ This document provides comprehensive ownership information for all databases in
 - **Reason:** Critical business operations - likely false positive
 - **Action:** Executive review and business impact assessment
 - **Timeline:** 24-hour alert threshold (investigation only)
-- **Approval:** Executive level (CFO/CTO) + business justification
+- **Approval:** Executive level (CFO/CTO) + business justification""")
 
-## Escalation Procedures
+_ESCALATION = Template("""## Escalation Procedures
 
 ### Level 1: Owner Team Notification
 - **Trigger:** Monitoring threshold exceeded
@@ -178,9 +205,9 @@ This document provides comprehensive ownership information for all databases in
 - **Trigger:** CRITICAL databases or unresolved Level 2
 - **Recipients:** CFO, CTO, affected executives
 - **Timeline:** 21 days after initial alert
-- **Required Action:** Executive decision and business justification
+- **Required Action:** Executive decision and business justification""")
 
-## Compliance and Audit Requirements
+_COMPLIANCE = Template("""## Compliance and Audit Requirements
 
 ### SOX Compliance (Employees Database)
 - **Requirement:** Full audit trail for any changes
@@ -198,9 +225,9 @@ This document provides comprehensive ownership information for all databases in
 - **Requirement:** GDPR and CCPA compliance review
 - **Documentation:** Data privacy impact assessment
 - **Timeline:** 30-day advance notice for data changes
-- **External Review:** Legal team approval
+- **External Review:** Legal team approval""")
 
-## Contact Information
+_CONTACTS = Template("""## Contact Information
 
 ### Database Team
 - **Primary:** Database Administrator (dba@company.com)
@@ -217,9 +244,9 @@ This document provides comprehensive ownership information for all databases in
 ### External Contacts
 - **External Auditor:** Auditing Firm (audit@external-firm.com)
 - **Legal Team:** Legal Department (legal@company.com)
-- **Compliance Officer:** Compliance Team (compliance@company.com)
+- **Compliance Officer:** Compliance Team (compliance@company.com)""")
 
-## Standard Operating Procedures
+_SOP = Template("""## Standard Operating Procedures
 
 ### Database Decommissioning Workflow
 1. **Detection:** Automated monitoring identifies inactive database
@@ -235,21 +262,125 @@ This document provides comprehensive ownership information for all databases in
 - **Immediate Response:** Contact database on-call team
 - **Business Hours:** 8 AM - 5 PM PT, Monday-Friday
 - **After Hours:** Emergency escalation via PagerDuty
-- **Critical Issues:** Executive notification within 1 hour
+- **Critical Issues:** Executive notification within 1 hour""")
 
----
+_FOOTER = Template("""---
 
 **Document Version:** 1.0  
 **Last Updated:** June 24, 2025  
 **Owner:** Database Team  
 **Approved By:** CTO Office  
 **Next Review:** December 24, 2025
-"""
+""")
+
+_SECTIONS = (
+    _OVERVIEW, _INVENTORY, _SCENARIO_DEFS, _TEAMS, _RISK,
+    _ESCALATION, _COMPLIANCE, _CONTACTS, _SOP, _FOOTER,
+)
+
+_INVENTORY_COLUMNS = (
+    "Database", "Scenario Type", "Criticality", "Owner Team",
+    "Contact Email", "Last Used", "Decommissioning Risk",
+)
+
+
+def _html_row(values: Tuple[str, ...], tag: str) -> str:
+    """One <tr> built with a single join over its cells"""
+    return "<tr>" + "".join(f"<{tag}>{escape(v)}</{tag}>" for v in values) + "</tr>"
+
+
+def render_inventory(dbs: Tuple[DBRecord, ...]) -> str:
+    """Render the inventory as an HTML table (GFM passes it through untouched)"""
+    lines = ["<table>", "<thead>", _html_row(_INVENTORY_COLUMNS, "th"), "</thead>", "<tbody>"]
+    lines.extend(
+        _html_row((r.name, r.scenario, r.crit, r.team, r.email, r.last_used, r.risk), "td")
+        for r in dbs
+    )
+    lines.extend(("</tbody>", "</table>"))
+    return "\n".join(lines)
+
+
+def team_databases(team: TeamRecord, dbs: Tuple[DBRecord, ...]) -> Tuple[str, ...]:
+    """Names of the databases owned by a team, in inventory order"""
+    return tuple(r.name for r in dbs if r.team == team.name)
+
+
+def render_team(team: TeamRecord, dbs: Tuple[DBRecord, ...]) -> str:
+    """Render one owner team section; owned databases come from the inventory"""
+    lines = [_TEAM_TEMPLATE.substitute(
+        name=team.name,
+        primary=team.primary,
+        primary_email=team.primary_email,
+        secondary=team.secondary,
+        secondary_email=team.secondary_email,
+        slack=team.slack,
+        databases=", ".join(team_databases(team, dbs)),
+        impact=team.impact,
+        approval=team.approval,
+    )]
+    if team.escalation:
+        lines.append(f"- **Executive Escalation:** {team.escalation}")
+    return "\n".join(lines)
+
+
+def render_doc(dbs: Tuple[DBRecord, ...], teams: Tuple[TeamRecord, ...]) -> str:
+    """Render the full ownership document from the structured records"""
+    fields = {
+        "inventory": render_inventory(dbs),
+        "teams": "\n\n".join(render_team(t, dbs) for t in teams),
+    }
+    return "\n\n".join(section.substitute(fields) for section in _SECTIONS)
+
+
+def render_json(dbs: Tuple[DBRecord, ...], teams: Tuple[TeamRecord, ...]) -> str:
+    """Render the same records as a structured sidecar for tooling"""
+    payload = {
+        "dbs": [asdict(r) for r in dbs],
+        "teams": [{**asdict(t), "databases": list(team_databases(t, dbs))} for t in teams],
+    }
+    return json.dumps(payload, indent=2) + "\n"
+
+
+DOC_PATH = Path("database_ownership.md")
+JSON_PATH = Path("database_ownership.json")
+GZ_PATH = Path("database_ownership.md.gz")
+
+
+def compress_doc(doc_bytes: bytes) -> bytes:
+    """Deterministic gzip of the doc (mtime pinned so unchanged content stays byte-identical)"""
+    return gzip.compress(doc_bytes, compresslevel=9, mtime=0)
+
+
+def load_ownership(path: Path = GZ_PATH) -> str:
+    """Read the compressed ownership doc back as text"""
+    return gzip.decompress(path.read_bytes()).decode("utf-8")
+
+
+def build() -> Tuple[Tuple[str, bytes], ...]:
+    """Return the (filename, payload) pairs generated by this script"""
+    # Encoded once so the writes skip the text codec layer
+    doc_bytes = render_doc(DBS, TEAMS).encode("utf-8")
+    return (
+        (str(DOC_PATH), doc_bytes),
+        (str(JSON_PATH), render_json(DBS, TEAMS).encode("utf-8")),
+        (str(GZ_PATH), compress_doc(doc_bytes)),
+    )
+
+
+def main() -> None:
+    """Render the ownership documentation and its sidecars, writing only what changed"""
+    preflight((DOC_PATH, JSON_PATH, GZ_PATH))
+
+    # Save the ownership documentation and its structured sidecars from the same records
+    changed = [write_if_changed(Path(filename), payload) for filename, payload in build()]
+
+    if any(changed):
+        print("✅ Created comprehensive database ownership documentation")
+    else:
+        print("✅ Database ownership documentation already up-to-date")
+    print("File: docs/database-ownership.md (+ database_ownership.json, database_ownership.md.gz)")
+    print("Contains: Owner contacts, escalation procedures, compliance requirements")
 
-# Save the ownership documentation
-with open("database_ownership.md", "w") as f:
-    f.write(database_ownership_doc)
 
-print("✅ Created comprehensive database ownership documentation")
-print("File: docs/database-ownership.md")
-print("Contains: Owner contacts, escalation procedures, compliance requirements")
+if __name__ == "__main__":
+    main()
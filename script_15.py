@@ -252,27 +252,36 @@ This implementation provides a comprehensive, realistic testing environment for
 **Quality Level**: Enterprise-Grade Implementation
 """
 
-# Save the implementation summary
-with open("implementation_summary.md", "w") as f:
-    f.write(implementation_summary)
-
-print("🎉 IMPLEMENTATION COMPLETE!")
-print("=" * 60)
-print("✅ All requirements fulfilled")
-print("✅ 9 databases across 3 scenarios implemented")
-print("✅ Infrastructure as Code ready")
-print("✅ Application logic properly separated")
-print("✅ Monitoring with 30+ day thresholds")
-print("✅ Comprehensive documentation")
-print("✅ Automated validation and deployment")
-print("✅ Enterprise-grade quality")
-print()
-print("📁 Files created: 27 configuration files")
-print("📊 Database scenarios: 9 databases, 3 scenario types")
-print("🏗️  Infrastructure: Terraform + Helm + Monitoring")
-print("💻 Application code: Service layers + Business logic")
-print("📚 Documentation: Ownership + Deployment guides")
-print("🔍 Validation: Automated testing and compliance")
-print()
-print("🚀 Ready for deployment to postgres-sample-dbs repository!")
-print("📋 See implementation_summary.md for complete details")
+def build():
+    """Return the (filename, payload) pairs generated by this script"""
+    return (
+        ("implementation_summary.md", implementation_summary.encode("utf-8")),
+    )
+
+
+if __name__ == "__main__":
+    # Save the implementation summary
+    for filename, payload in build():
+        with open(filename, "wb") as f:
+            f.write(payload)
+
+    print("🎉 IMPLEMENTATION COMPLETE!")
+    print("=" * 60)
+    print("✅ All requirements fulfilled")
+    print("✅ 9 databases across 3 scenarios implemented")
+    print("✅ Infrastructure as Code ready")
+    print("✅ Application logic properly separated")
+    print("✅ Monitoring with 30+ day thresholds")
+    print("✅ Comprehensive documentation")
+    print("✅ Automated validation and deployment")
+    print("✅ Enterprise-grade quality")
+    print()
+    print("📁 Files created: 27 configuration files")
+    print("📊 Database scenarios: 9 databases, 3 scenario types")
+    print("🏗️  Infrastructure: Terraform + Helm + Monitoring")
+    print("💻 Application code: Service layers + Business logic")
+    print("📚 Documentation: Ownership + Deployment guides")
+    print("🔍 Validation: Automated testing and compliance")
+    print()
+    print("🚀 Ready for deployment to postgres-sample-dbs repository!")
+    print("📋 See implementation_summary.md for complete details")
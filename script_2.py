@@ -11,9 +11,19 @@ terraform {
   }
 }
 
-variable "database_name" {
-  description = "Name of the PostgreSQL database"
-  type        = string
+variable "databases" {
+  description = "Databases to create, keyed by database name; one server per database"
+  type = map(object({
+    criticality           = optional(string, "LOW")
+    scenario_type         = string
+    owner_email           = string
+    last_used_date        = string
+    storage_mb            = optional(number, 32768)
+    sku_name              = optional(string, "B_Standard_B1ms")
+    backup_retention_days = optional(number, 7)
+    high_availability     = optional(bool, false)
+    tags                  = optional(map(string), {})
+  }))
 }
 
 variable "resource_group_name" {
@@ -31,51 +41,6 @@ variable "environment" {
   type        = string
 }
 
-variable "criticality" {
-  description = "Database criticality level (LOW, MEDIUM, CRITICAL)"
-  type        = string
-  default     = "LOW"
-}
-
-variable "scenario_type" {
-  description = "Scenario type (CONFIG_ONLY, MIXED, LOGIC_HEAVY)"
-  type        = string
-}
-
-variable "owner_email" {
-  description = "Owner team email"
-  type        = string
-}
-
-variable "last_used_date" {
-  description = "Last used date (YYYY-MM-DD)"
-  type        = string
-}
-
-variable "storage_mb" {
-  description = "Storage size in MB"
-  type        = number
-  default     = 32768
-}
-
-variable "sku_name" {
-  description = "SKU name for the database"
-  type        = string
-  default     = "B_Standard_B1ms"
-}
-
-variable "backup_retention_days" {
-  description = "Backup retention in days"
-  type        = number
-  default     = 7
-}
-
-variable "high_availability" {
-  description = "Enable high availability"
-  type        = bool
-  default     = false
-}
-
 variable "delegated_subnet_id" {
   description = "Delegated subnet ID"
   type        = string
@@ -104,9 +69,12 @@ variable "additional_tags" {
   default     = {}
 }
 
-# PostgreSQL Flexible Server
+# PostgreSQL Flexible Servers, one per database in a single for_each so
+# Terraform plans and applies them in one graph walk
 resource "azurerm_postgresql_flexible_server" "database" {
-  name                   = "psql-${var.database_name}-${var.environment}"
+  for_each = var.databases
+
+  name                   = "psql-${replace(each.key, "_", "-")}-${var.environment}"
   resource_group_name    = var.resource_group_name
   location              = var.location
   version               = "14"
@@ -115,53 +83,58 @@ resource "azurerm_postgresql_flexible_server" "database" {
   administrator_login    = var.administrator_login
   administrator_password = var.administrator_password
 
-  storage_mb = var.storage_mb
-  sku_name   = var.sku_name
+  storage_mb = each.value.storage_mb
+  sku_name   = each.value.sku_name
 
-  backup_retention_days        = var.backup_retention_days
-  geo_redundant_backup_enabled = var.criticality == "CRITICAL" ? true : false
-  high_availability_enabled    = var.high_availability
+  backup_retention_days        = each.value.backup_retention_days
+  geo_redundant_backup_enabled = each.value.criticality == "CRITICAL" ? true : false
+  high_availability_enabled    = each.value.high_availability
 
   tags = merge({
     Environment       = var.environment
-    Criticality      = var.criticality
-    Scenario         = var.scenario_type
-    Owner            = var.owner_email
-    LastUsed         = var.last_used_date
+    Criticality      = each.value.criticality
+    Scenario         = each.value.scenario_type
+    Owner            = each.value.owner_email
+    LastUsed         = each.value.last_used_date
     ManagedBy        = "Terraform"
     DatabaseType     = "PostgreSQL"
-    DecommissioningCandidate = var.last_used_date < "2025-05-01" ? "true" : "false"
-  }, var.additional_tags)
+    DecommissioningCandidate = each.value.last_used_date < "2025-05-01" ? "true" : "false"
+  }, var.additional_tags, each.value.tags)
 }
 
-# Database within the server
+# Database within each server
 resource "azurerm_postgresql_flexible_server_database" "database" {
-  name      = var.database_name
-  server_id = azurerm_postgresql_flexible_server.database.id
+  for_each = var.databases
+
+  name      = each.key
+  server_id = azurerm_postgresql_flexible_server.database[each.key].id
   collation = "en_US.utf8"
   charset   = "utf8"
 }
 
-# Outputs
+# Outputs, keyed by database name
 output "server_id" {
-  value = azurerm_postgresql_flexible_server.database.id
+  value = { for name, server in azurerm_postgresql_flexible_server.database : name => server.id }
 }
 
 output "server_fqdn" {
-  value = azurerm_postgresql_flexible_server.database.fqdn
+  value = { for name, server in azurerm_postgresql_flexible_server.database : name => server.fqdn }
 }
 
 output "database_name" {
-  value = azurerm_postgresql_flexible_server_database.database.name
+  value = { for name, database in azurerm_postgresql_flexible_server_database.database : name => database.name }
 }
 
 output "connection_string" {
-  value = "postgresql://${var.administrator_login}@${azurerm_postgresql_flexible_server.database.fqdn}:5432/${var.database_name}"
+  value = {
+    for name, server in azurerm_postgresql_flexible_server.database :
+    name => "postgresql://${var.administrator_login}@${server.fqdn}:5432/${name}"
+  }
   sensitive = var.environment == "prod"
 }
 
 output "server_tags" {
-  value = azurerm_postgresql_flexible_server.database.tags
+  value = { for name, server in azurerm_postgresql_flexible_server.database : name => server.tags }
 }
 """
 
@@ -169,13 +142,40 @@ output "server_tags" {
 terraform_module_variables = """# terraform/modules/database/variables.tf
 # Variables for the reusable database module
 
-variable "database_name" {
-  description = "Name of the PostgreSQL database"
-  type        = string
+variable "databases" {
+  description = "Databases to create, keyed by database name; one server per database"
+  type = map(object({
+    criticality           = optional(string, "LOW")
+    scenario_type         = string
+    owner_email           = string
+    last_used_date        = string
+    storage_mb            = optional(number, 32768)
+    sku_name              = optional(string, "B_Standard_B1ms")
+    backup_retention_days = optional(number, 7)
+    high_availability     = optional(bool, false)
+    tags                  = optional(map(string), {})
+  }))
+
   validation {
-    condition     = can(regex("^[a-z][a-z0-9_]*$", var.database_name))
+    condition     = alltrue([for name in keys(var.databases) : can(regex("^[a-z][a-z0-9_]*$", name))])
     error_message = "Database name must start with a letter and contain only lowercase letters, numbers, and underscores."
   }
+  validation {
+    condition     = alltrue([for db in values(var.databases) : contains(["LOW", "MEDIUM", "CRITICAL"], db.criticality)])
+    error_message = "Criticality must be one of: LOW, MEDIUM, CRITICAL."
+  }
+  validation {
+    condition     = alltrue([for db in values(var.databases) : contains(["CONFIG_ONLY", "MIXED", "LOGIC_HEAVY"], db.scenario_type)])
+    error_message = "Scenario type must be one of: CONFIG_ONLY, MIXED, LOGIC_HEAVY."
+  }
+  validation {
+    condition     = alltrue([for db in values(var.databases) : can(regex("^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}$", db.owner_email))])
+    error_message = "Owner email must be a valid email address."
+  }
+  validation {
+    condition     = alltrue([for db in values(var.databases) : can(regex("^\\d{4}-\\d{2}-\\d{2}$", db.last_used_date))])
+    error_message = "Last used date must be in YYYY-MM-DD format."
+  }
 }
 
 variable "resource_group_name" {
@@ -197,101 +197,76 @@ variable "environment" {
     error_message = "Environment must be one of: dev, staging, prod."
   }
 }
-
-variable "criticality" {
-  description = "Database criticality level"
-  type        = string
-  default     = "LOW"
-  validation {
-    condition     = contains(["LOW", "MEDIUM", "CRITICAL"], var.criticality)
-    error_message = "Criticality must be one of: LOW, MEDIUM, CRITICAL."
-  }
-}
-
-variable "scenario_type" {
-  description = "Scenario type for decommissioning testing"
-  type        = string
-  validation {
-    condition     = contains(["CONFIG_ONLY", "MIXED", "LOGIC_HEAVY"], var.scenario_type)
-    error_message = "Scenario type must be one of: CONFIG_ONLY, MIXED, LOGIC_HEAVY."
-  }
-}
-
-variable "owner_email" {
-  description = "Owner team email address"
-  type        = string
-  validation {
-    condition     = can(regex("^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}$", var.owner_email))
-    error_message = "Owner email must be a valid email address."
-  }
-}
-
-variable "last_used_date" {
-  description = "Last used date in YYYY-MM-DD format"
-  type        = string
-  validation {
-    condition     = can(regex("^\\d{4}-\\d{2}-\\d{2}$", var.last_used_date))
-    error_message = "Last used date must be in YYYY-MM-DD format."
-  }
-}
 """
 
 # Create the module outputs file
 terraform_module_outputs = """# terraform/modules/database/outputs.tf
 # Outputs for the reusable database module
 
+# All outputs are maps keyed by database name
+
 output "server_id" {
-  description = "ID of the PostgreSQL server"
-  value       = azurerm_postgresql_flexible_server.database.id
+  description = "ID of each PostgreSQL server"
+  value       = { for name, server in azurerm_postgresql_flexible_server.database : name => server.id }
 }
 
 output "server_fqdn" {
-  description = "FQDN of the PostgreSQL server"
-  value       = azurerm_postgresql_flexible_server.database.fqdn
+  description = "FQDN of each PostgreSQL server"
+  value       = { for name, server in azurerm_postgresql_flexible_server.database : name => server.fqdn }
 }
 
 output "database_name" {
-  description = "Name of the database"
-  value       = azurerm_postgresql_flexible_server_database.database.name
+  description = "Name of each database"
+  value       = { for name, database in azurerm_postgresql_flexible_server_database.database : name => database.name }
 }
 
 output "connection_string" {
-  description = "Connection string for the database"
-  value       = "postgresql://${var.administrator_login}@${azurerm_postgresql_flexible_server.database.fqdn}:5432/${var.database_name}"
-  sensitive   = var.environment == "prod"
+  description = "Connection string for each database"
+  value = {
+    for name, server in azurerm_postgresql_flexible_server.database :
+    name => "postgresql://${var.administrator_login}@${server.fqdn}:5432/${name}"
+  }
+  sensitive = var.environment == "prod"
 }
 
 output "server_tags" {
-  description = "Tags applied to the server"
-  value       = azurerm_postgresql_flexible_server.database.tags
+  description = "Tags applied to each server"
+  value       = { for name, server in azurerm_postgresql_flexible_server.database : name => server.tags }
 }
 
 output "decommissioning_info" {
   description = "Information relevant for decommissioning decisions"
   value = {
-    scenario_type = var.scenario_type
-    criticality   = var.criticality
-    owner_email   = var.owner_email
-    last_used     = var.last_used_date
-    environment   = var.environment
-    requires_manual_review = var.scenario_type == "LOGIC_HEAVY" ? true : false
+    for name, db in var.databases : name => {
+      scenario_type = db.scenario_type
+      criticality   = db.criticality
+      owner_email   = db.owner_email
+      last_used     = db.last_used_date
+      environment   = var.environment
+      requires_manual_review = db.scenario_type == "LOGIC_HEAVY" ? true : false
+    }
   }
 }
 """
 
-# Save the module files
-with open("terraform_module_main.tf", "w") as f:
-    f.write(terraform_module_config)
-
-with open("terraform_module_variables.tf", "w") as f:
-    f.write(terraform_module_variables)
-
-with open("terraform_module_outputs.tf", "w") as f:
-    f.write(terraform_module_outputs)
-
-print("✅ Created reusable Terraform database module")
-print("Files created:")
-print("  - terraform/modules/database/main.tf")
-print("  - terraform/modules/database/variables.tf")
-print("  - terraform/modules/database/outputs.tf")
-print("Features: Validation, decommissioning flags, environment-specific configs")
+def build():
+    """Return the (filename, payload) pairs generated by this script"""
+    return (
+        ("terraform_module_main.tf", terraform_module_config.encode("utf-8")),
+        ("terraform_module_variables.tf", terraform_module_variables.encode("utf-8")),
+        ("terraform_module_outputs.tf", terraform_module_outputs.encode("utf-8")),
+    )
+
+
+if __name__ == "__main__":
+    # Save the module files
+    for filename, payload in build():
+        with open(filename, "wb") as f:
+            f.write(payload)
+
+    print("✅ Created reusable Terraform database module")
+    print("Files created:")
+    print("  - terraform/modules/database/main.tf")
+    print("  - terraform/modules/database/variables.tf")
+    print("  - terraform/modules/database/outputs.tf")
+    print("Features: Validation, decommissioning flags, environment-specific configs")
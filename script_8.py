@@ -1,19 +1,21 @@
 # Create Datadog monitoring configurations for all databases
-def create_datadog_monitor(database_name, scenario_type, owner_email, criticality):
-    """Create Datadog monitor configuration for a database"""
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
-    # Set thresholds based on criticality
-    if criticality == "CRITICAL":
-        connection_threshold = 86400  # 24 hours
-        warning_threshold = 43200  # 12 hours
-    elif criticality == "MEDIUM":
-        connection_threshold = 259200  # 72 hours (3 days)
-        warning_threshold = 172800  # 48 hours (2 days)
-    else:  # LOW
-        connection_threshold = 2592000  # 30 days
-        warning_threshold = 1814400  # 21 days
-
-    monitor_config = f"""# monitoring/database-monitors/{database_name}_monitor.yaml
+from criticality_profiles import CRITICALITY_DERIVED
+from database_inventory import (
+    DATABASES,
+    LOWER,
+    compile_template,
+    encode_segments,
+    render,
+    render_bytes,
+    write_payload,
+)
+
+# Monitor YAML template, built once and rendered per database
+_MONITOR_TEMPLATE = """# monitoring/database-monitors/{database_name}_monitor.yaml
 # Datadog monitoring configuration for {database_name} database
 # Scenario: {scenario_type} | Criticality: {criticality}
 
@@ -23,11 +25,11 @@ metadata:
   name: "{database_name}-database-connection-monitor"
   tags:
     - "database:{database_name}"
-    - "scenario:{scenario_type.lower()}"
-    - "criticality:{criticality.lower()}"
+    - "scenario:{scenario_lower}"
+    - "criticality:{criticality_lower}"
     - "environment:multi"
     - "service:database-monitoring"
-    - "team:{owner_email.split('@')[0].replace('-', '_')}"
+    - "team:{owner_tag}"
 
 spec:
   # Database connection monitoring
@@ -36,7 +38,7 @@ spec:
   query: |
     max(last_30m):max:postgresql.connections.active{{database:{database_name}}} by {{host}}
   
-  name: "{database_name.title()} Database - Unused Connection Alert"
+  name: "{database_title} Database - Unused Connection Alert"
   
   message: |
     **🔍 Database Decommissioning Candidate Detected**
@@ -47,18 +49,18 @@ spec:
     
     **Alert Details:**
     - No active connections detected for {{{{#is_alert}}}}{{{{ value }}}}{{{{/is_alert}}}} seconds
-    - Threshold: {connection_threshold} seconds ({connection_threshold/86400:.1f} days)
+    - Threshold: {connection_threshold} seconds ({connection_days:.1f} days)
     - Owner: {owner_email}
     
     **Next Steps:**
-    {'⚠️ **CRITICAL DATABASE** - Manual review required before any action' if criticality == 'CRITICAL' else ''}
-    {'📊 Mixed scenario - Check service layer dependencies' if scenario_type == 'MIXED' else ''}
-    {'⚙️ Config-only scenario - Safe for automated review' if scenario_type == 'CONFIG_ONLY' else ''}
+    {criticality_note}
+    {mixed_note}
+    {config_only_note}
     
     **Decommissioning Workflow:**
     1. Verify no hidden dependencies
     2. Contact owner: {owner_email}
-    3. {'Create GitHub issue for manual review' if criticality == 'CRITICAL' else 'Evaluate for removal'}
+    3. {critical_action}
     4. Document decision and rationale
     
     **Infrastructure References:**
@@ -73,8 +75,8 @@ spec:
     thresholds:
       critical: {connection_threshold}
       warning: {warning_threshold}
-      warning_recovery: {warning_threshold * 0.8}
-      critical_recovery: {connection_threshold * 0.8}
+      warning_recovery: {warning_recovery}
+      critical_recovery: {critical_recovery}
     
     # Notification settings
     notify_audit: true
@@ -87,7 +89,7 @@ spec:
       **ESCALATION: Unused Database Alert**
       
       Database {database_name} has been without connections for an extended period.
-      {'This is a CRITICAL system requiring immediate review.' if criticality == 'CRITICAL' else ''}
+      {escalation_note}
       
       Please review for potential decommissioning.
       
@@ -125,21 +127,21 @@ custom_metrics:
     description: "Flag database as decommissioning candidate"
     tags:
       - "database:{database_name}"
-      - "scenario:{scenario_type.lower()}"
-      - "auto_review:{str(scenario_type == 'CONFIG_ONLY').lower()}"
-      - "manual_review:{str(criticality == 'CRITICAL').lower()}"
+      - "scenario:{scenario_lower}"
+      - "auto_review:{auto_review}"
+      - "manual_review:{manual_review}"
   
   - metric_name: "database.connection.idle_days"
     description: "Number of days since last connection"
     unit: "days"
     tags:
       - "database:{database_name}"
-      - "threshold_days:{connection_threshold/86400:.0f}"
+      - "threshold_days:{connection_days_whole}"
 
 # Dashboard integration
 dashboard_widgets:
   - widget_type: "timeseries"
-    title: "{database_name.title()} Connection Activity"
+    title: "{database_title} Connection Activity"
     definition:
       requests:
         - q: "avg:postgresql.connections.active{{database:{database_name}}}"
@@ -148,7 +150,7 @@ dashboard_widgets:
         min: 0
         max: 100
       markers:
-        - value: {connection_threshold/3600}  # Show threshold as marker
+        - value: {connection_hours}  # Show threshold as marker
           display_type: "error dashed"
           label: "Decommissioning Threshold"
 
@@ -172,11 +174,11 @@ github_integration:
     - [ ] Verify no hidden dependencies
     - [ ] Check application logs for references
     - [ ] Contact database owner
-    - [ ] {'Review business logic impact' if scenario_type == 'LOGIC_HEAVY' else 'Confirm safe removal'}
+    - [ ] {review_action}
     - [ ] Document decommissioning decision
     
-    **Owner:** @{owner_email.split('@')[0]}
-    **Labels:** database-decommissioning, {scenario_type.lower()}, {criticality.lower()}
+    **Owner:** @{owner_handle}
+    **Labels:** database-decommissioning, {scenario_lower}, {criticality_lower}
 
 # Webhook for automated workflows
 webhooks:
@@ -190,46 +192,128 @@ webhooks:
         "owner_email": "{owner_email}",
         "alert_timestamp": "{{{{alert_timestamp}}}}",
         "metric_value": "{{{{value}}}}",
-        "requires_manual_review": {str(criticality == 'CRITICAL').lower()}
+        "requires_manual_review": {manual_review}
       }}
 """
-    return monitor_config
-
-
-# Create monitoring configurations for all databases
-databases_config = [
-    # Config-Only scenarios
-    ("periodic_table", "CONFIG_ONLY", "chemistry-team@company.com", "LOW"),
-    ("world_happiness", "CONFIG_ONLY", "analytics-team@company.com", "LOW"),
-    ("titanic", "CONFIG_ONLY", "data-science-team@company.com", "LOW"),
-    # Mixed scenarios
-    ("pagila", "MIXED", "development-team@company.com", "MEDIUM"),
-    ("chinook", "MIXED", "media-team@company.com", "MEDIUM"),
-    ("netflix", "MIXED", "content-team@company.com", "MEDIUM"),
-    # Logic-Heavy scenarios
-    ("employees", "LOGIC_HEAVY", "hr-team@company.com", "CRITICAL"),
-    ("lego", "LOGIC_HEAVY", "analytics-team@company.com", "CRITICAL"),
-    ("postgres_air", "LOGIC_HEAVY", "operations-team@company.com", "CRITICAL"),
-]
-
-# Generate all monitor files
-for db_name, scenario, owner, criticality in databases_config:
-    monitor_content = create_datadog_monitor(db_name, scenario, owner, criticality)
-
-    filename = f"datadog_monitor_{db_name}.yaml"
-    with open(filename, "w") as f:
-        f.write(monitor_content)
-
-print("✅ Created Datadog monitoring configurations for all 9 databases")
-print("Files created:")
-for db_name, scenario, owner, criticality in databases_config:
-    print(
-        f"  - monitoring/database-monitors/{db_name}_monitor.yaml ({scenario}, {criticality})"
+
+
+# Scenario-dependent message text and tags, looked up once per monitor
+_SCENARIO_NOTES = {
+    "CONFIG_ONLY": {
+        "mixed_note": "",
+        "config_only_note": "⚙️ Config-only scenario - Safe for automated review",
+        "review_action": "Confirm safe removal",
+        "auto_review": "true",
+    },
+    "MIXED": {
+        "mixed_note": "📊 Mixed scenario - Check service layer dependencies",
+        "config_only_note": "",
+        "review_action": "Confirm safe removal",
+        "auto_review": "false",
+    },
+    "LOGIC_HEAVY": {
+        "mixed_note": "",
+        "config_only_note": "",
+        "review_action": "Review business logic impact",
+        "auto_review": "false",
+    },
+}
+
+
+@lru_cache(maxsize=None)
+def _owner_names(owner_email):
+    """Return (handle, tag) for an owner email, e.g. ("hr-team", "hr_team")"""
+    handle = owner_email.split("@", 1)[0]
+    return handle, handle.replace("-", "_")
+
+
+@lru_cache(maxsize=9)
+def _monitor_segments(scenario_type, criticality):
+    """Compile the template with one (scenario, criticality) pair's values folded in
+
+    Thresholds, notes and their formatted day counts depend only on the pair,
+    so they are rendered once per combination rather than once per database.
+    """
+    return compile_template(
+        _MONITOR_TEMPLATE,
+        {
+            "scenario_type": scenario_type,
+            "scenario_lower": LOWER[scenario_type],
+            "criticality": criticality,
+            "criticality_lower": LOWER[criticality],
+            **CRITICALITY_DERIVED[criticality],
+            **_SCENARIO_NOTES[scenario_type],
+        },
+    )
+
+
+@lru_cache(maxsize=9)
+def _monitor_skeleton(scenario_type, criticality):
+    """Byte form of one pair's compiled template, encoded once for every file"""
+    return encode_segments(_monitor_segments(scenario_type, criticality))
+
+
+def _monitor_fields(database_name, owner_email):
+    """Fields left to fill in per database once a pair's template is compiled"""
+    owner_handle, owner_tag = _owner_names(owner_email)
+    return {
+        "database_name": database_name,
+        "database_title": database_name.title(),
+        "owner_email": owner_email,
+        "owner_handle": owner_handle,
+        "owner_tag": owner_tag,
+    }
+
+
+def create_datadog_monitor(database_name, scenario_type, owner_email, criticality):
+    """Create Datadog monitor configuration for a database"""
+
+    return render(
+        _monitor_segments(scenario_type, criticality),
+        _monitor_fields(database_name, owner_email),
+    )
+
+
+def monitor_file(db):
+    """Return the (filename, payload) pair of one database's monitor file"""
+    # Only the per-database values are encoded; the static text is reused as bytes
+    payload = render_bytes(
+        _monitor_skeleton(db.scenario, db.criticality),
+        _monitor_fields(db.name, db.owner),
+    )
+    return f"datadog_monitor_{db.name}.yaml", payload
+
+
+def build():
+    """Return the (filename, payload) pairs generated by this script"""
+    return tuple(map(monitor_file, DATABASES))
+
+# Highlights listed in the generation summary
+FEATURES = (
+    "30+ day connection thresholds (per user story)",
+    "Automated GitHub issue creation",
+    "Owner notification system",
+    "Scenario-specific workflows",
+    "Dashboard integration",
+    "Webhook automation",
+)
+
+
+if __name__ == "__main__":
+    # Render and encode everything first, then write the files concurrently;
+    # they are independent and the GIL is released in open/write/close
+    monitor_files = build()
+    with ThreadPoolExecutor(max_workers=len(monitor_files)) as executor:
+        list(executor.map(write_payload, monitor_files))
+
+    # One write for the whole summary instead of a print per line
+    sys.stdout.write(
+        "✅ Created Datadog monitoring configurations for all 9 databases\n"
+        "Files created:\n"
+        + "".join(
+            f"  - monitoring/database-monitors/{db.name}_monitor.yaml ({db.scenario}, {db.criticality})\n"
+            for db in DATABASES
+        )
+        + "\nFeatures:\n"
+        + "".join(f"  - {feature}\n" for feature in FEATURES)
     )
-print("\nFeatures:")
-print("  - 30+ day connection thresholds (per user story)")
-print("  - Automated GitHub issue creation")
-print("  - Owner notification system")
-print("  - Scenario-specific workflows")
-print("  - Dashboard integration")
-print("  - Webhook automation")
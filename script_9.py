@@ -1,8 +1,21 @@
 # Create Helm chart configurations for each database
-def create_helm_values(database_name, scenario_type, criticality, description):
-    """Create Helm values.yaml for a database"""
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
-    helm_values = f"""# helm-charts/{database_name}/values.yaml
+from criticality_profiles import CRITICALITY_DERIVED
+from database_inventory import (
+    DATABASES,
+    LOWER,
+    compile_template,
+    encode_segments,
+    render,
+    render_bytes,
+    write_payload,
+)
+
+# Helm values template, built once and rendered per database
+_HELM_TEMPLATE = """# helm-charts/{database_name}/values.yaml
 # Kubernetes deployment configuration for {database_name} database
 # Scenario: {scenario_type} | Criticality: {criticality}
 
@@ -10,8 +23,8 @@ def create_helm_values(database_name, scenario_type, criticality, description):
 global:
   database:
     name: "{database_name}"
-    scenario: "{scenario_type.lower()}"
-    criticality: "{criticality.lower()}"
+    scenario: "{scenario_lower}"
+    criticality: "{criticality_lower}"
   
   # Image registry settings
   imageRegistry: "registry.company.com"
@@ -35,26 +48,26 @@ postgresql:
     # Resource allocation based on criticality
     resources:
       requests:
-        {"cpu: '2000m'" if criticality == "CRITICAL" else "cpu: '500m'" if criticality == "MEDIUM" else "cpu: '250m'"}
-        {"memory: '4Gi'" if criticality == "CRITICAL" else "memory: '2Gi'" if criticality == "MEDIUM" else "memory: '1Gi'"}
+        cpu: '{cpu_request}'
+        memory: '{memory_request}'
       limits:
-        {"cpu: '4000m'" if criticality == "CRITICAL" else "cpu: '1000m'" if criticality == "MEDIUM" else "cpu: '500m'"}
-        {"memory: '8Gi'" if criticality == "CRITICAL" else "memory: '4Gi'" if criticality == "MEDIUM" else "memory: '2Gi'"}
+        cpu: '{cpu_limit}'
+        memory: '{memory_limit}'
     
     # Storage configuration  
     persistence:
       enabled: true
-      size: {"100Gi" if criticality == "CRITICAL" else "50Gi" if criticality == "MEDIUM" else "20Gi"}
-      storageClass: {"premium-ssd" if criticality == "CRITICAL" else "standard-ssd"}
+      size: {pvc_size}
+      storageClass: {storage_class}
       accessModes:
         - ReadWriteOnce
     
     # PostgreSQL configuration parameters
     postgresqlConfiguration:
-      max_connections: {"200" if criticality == "CRITICAL" else "100" if criticality == "MEDIUM" else "50"}
-      shared_buffers: {"1GB" if criticality == "CRITICAL" else "512MB" if criticality == "MEDIUM" else "256MB"}
-      effective_cache_size: {"3GB" if criticality == "CRITICAL" else "1536MB" if criticality == "MEDIUM" else "768MB"}
-      work_mem: {"32MB" if criticality == "CRITICAL" else "16MB" if criticality == "MEDIUM" else "8MB"}
+      max_connections: {max_connections}
+      shared_buffers: {shared_buffers}
+      effective_cache_size: {effective_cache_size}
+      work_mem: {work_mem}
       
       # Logging configuration for monitoring
       log_statement: "all"  # Log all statements for decommissioning analysis
@@ -78,16 +91,16 @@ postgresql:
       readOnlyRootFilesystem: true
       
   # High availability configuration (for critical databases)
-  {"readReplicas:" if criticality == "CRITICAL" else "# readReplicas: # Disabled for non-critical"}
-    {"replicaCount: 2" if criticality == "CRITICAL" else "# replicaCount: 0"}
+  {read_replicas}
+    {replica_count}
     
-    {"resources:" if criticality == "CRITICAL" else ""}
-      {"requests:" if criticality == "CRITICAL" else ""}
-        {"cpu: '1000m'" if criticality == "CRITICAL" else ""}
-        {"memory: '2Gi'" if criticality == "CRITICAL" else ""}
-      {"limits:" if criticality == "CRITICAL" else ""}
-        {"cpu: '2000m'" if criticality == "CRITICAL" else ""}
-        {"memory: '4Gi'" if criticality == "CRITICAL" else ""}
+    {replica_resources}
+      {replica_requests}
+        {replica_cpu_request}
+        {replica_memory_request}
+      {replica_limits}
+        {replica_cpu_limit}
+        {replica_memory_limit}
 
 # Service configuration
 service:
@@ -101,8 +114,8 @@ service:
     datadog.com/check: "postgres"
     
     # Decommissioning metadata
-    decommissioning.company.com/scenario: "{scenario_type.lower()}"
-    decommissioning.company.com/criticality: "{criticality.lower()}"
+    decommissioning.company.com/scenario: "{scenario_lower}"
+    decommissioning.company.com/criticality: "{criticality_lower}"
     decommissioning.company.com/monitor: "enabled"
 
 # Network policies
@@ -123,13 +136,13 @@ networkPolicy:
         port: 5432
     
     # Additional access for logic-heavy scenarios
-    {"- from:" if scenario_type == "LOGIC_HEAVY" else "# Additional ingress disabled for non-logic-heavy"}
-      {"- namespaceSelector:" if scenario_type == "LOGIC_HEAVY" else ""}
-          {"matchLabels:" if scenario_type == "LOGIC_HEAVY" else ""}
-            {"name: 'analytics'" if scenario_type == "LOGIC_HEAVY" else ""}
-      {"- namespaceSelector:" if scenario_type == "LOGIC_HEAVY" else ""}
-          {"matchLabels:" if scenario_type == "LOGIC_HEAVY" else ""}
-            {"name: 'business-intelligence'" if scenario_type == "LOGIC_HEAVY" else ""}
+    {analytics_ingress}
+      {extra_namespace_selector}
+          {extra_match_labels}
+            {analytics_namespace}
+      {extra_namespace_selector}
+          {extra_match_labels}
+            {bi_namespace}
 
 # Monitoring and observability
 monitoring:
@@ -178,40 +191,40 @@ monitoring:
     namespace: "monitoring"
     labels:
       app: "{database_name}-postgres"
-      scenario: "{scenario_type.lower()}"
+      scenario: "{scenario_lower}"
     interval: "30s"
     path: "/metrics"
 
 # Backup configuration
 backup:
-  enabled: {"true" if criticality in ["CRITICAL", "MEDIUM"] else "false"}
+  enabled: {backup_enabled}
   
-  {"schedule: '0 2 * * *'  # Daily at 2 AM" if criticality in ["CRITICAL", "MEDIUM"] else "# Backup disabled for low criticality"}
-  {"retention: '30d'" if criticality == "CRITICAL" else "retention: '7d'" if criticality == "MEDIUM" else ""}
+  {backup_schedule}
+  {backup_retention}
   
-  {"storage:" if criticality in ["CRITICAL", "MEDIUM"] else ""}
-    {"type: 'azure-blob'" if criticality in ["CRITICAL", "MEDIUM"] else ""}
-    {"container: 'database-backups'" if criticality in ["CRITICAL", "MEDIUM"] else ""}
+  {backup_storage}
+    {backup_storage_type}
+    {backup_container}
 
 # Pod disruption budget (for critical databases)
-{"podDisruptionBudget:" if criticality == "CRITICAL" else "# podDisruptionBudget: # Disabled for non-critical"}
-  {"enabled: true" if criticality == "CRITICAL" else ""}
-  {"minAvailable: 1" if criticality == "CRITICAL" else ""}
+{pod_disruption_budget}
+  {pdb_enabled}
+  {pdb_min_available}
 
 # Resource quotas and limits
 resourceQuota:
   enabled: true
   hard:
-    {"limits.cpu: '8000m'" if criticality == "CRITICAL" else "limits.cpu: '2000m'" if criticality == "MEDIUM" else "limits.cpu: '1000m'"}
-    {"limits.memory: '16Gi'" if criticality == "CRITICAL" else "limits.memory: '8Gi'" if criticality == "MEDIUM" else "limits.memory: '4Gi'"}
-    {"persistentvolumeclaims: '3'" if criticality == "CRITICAL" else "persistentvolumeclaims: '2'" if criticality == "MEDIUM" else "persistentvolumeclaims: '1'"}
+    limits.cpu: '{quota_cpu}'
+    limits.memory: '{quota_memory}'
+    persistentvolumeclaims: '{quota_pvcs}'
 
 # Labels and annotations
 labels:
   app: "{database_name}"
   database: "{database_name}"
-  scenario: "{scenario_type.lower()}"
-  criticality: "{criticality.lower()}"
+  scenario: "{scenario_lower}"
+  criticality: "{criticality_lower}"
   chart: "postgresql"
   heritage: "Helm"
   
@@ -250,24 +263,24 @@ environments:
       primary:
         resources:
           requests:
-            {"cpu: '1000m'" if criticality == "CRITICAL" else "cpu: '500m'"}
-            {"memory: '2Gi'" if criticality == "CRITICAL" else "memory: '1Gi'"}
+            cpu: '{staging_cpu_request}'
+            memory: '{staging_memory_request}'
           limits:
-            {"cpu: '2000m'" if criticality == "CRITICAL" else "cpu: '1000m'"}
-            {"memory: '4Gi'" if criticality == "CRITICAL" else "memory: '2Gi'"}
+            cpu: '{staging_cpu_limit}'
+            memory: '{staging_memory_limit}'
         persistence:
-          size: {"50Gi" if criticality == "CRITICAL" else "25Gi"}
+          size: {staging_pvc_size}
           
   production:
     # Use default values defined above
     postgresql:
       primary:
         nodeSelector:
-          {"database-tier: 'critical'" if criticality == "CRITICAL" else "database-tier: 'standard'"}
+          database-tier: '{database_tier}'
         tolerations:
         - key: "database"
           operator: "Equal"
-          value: "{criticality.lower()}"
+          value: "{criticality_lower}"
           effect: "NoSchedule"
 
 # Health checks and probes
@@ -298,87 +311,107 @@ healthChecks:
     failureThreshold: 6
     successThreshold: 1
 """
-    return helm_values
-
-
-# Database configurations with descriptions
-databases_helm_config = [
-    # Config-Only scenarios
-    (
-        "periodic_table",
-        "CONFIG_ONLY",
-        "LOW",
-        "Chemical elements reference database for chemistry applications",
-    ),
-    (
-        "world_happiness",
-        "CONFIG_ONLY",
-        "LOW",
-        "World happiness index data for analytics and reporting",
-    ),
-    (
-        "titanic",
-        "CONFIG_ONLY",
-        "LOW",
-        "Historical passenger data for data science training and demos",
-    ),
-    # Mixed scenarios
-    (
-        "pagila",
-        "MIXED",
-        "MEDIUM",
-        "DVD rental store database with moderate service layer usage",
-    ),
-    (
-        "chinook",
-        "MIXED",
-        "MEDIUM",
-        "Digital media store with basic service integrations",
-    ),
-    (
-        "netflix",
-        "MIXED",
-        "MEDIUM",
-        "Content catalog with lightweight service connections",
-    ),
-    # Logic-Heavy scenarios
-    (
-        "employees",
-        "LOGIC_HEAVY",
-        "CRITICAL",
-        "Enterprise payroll system with critical business operations",
-    ),
-    (
-        "lego",
-        "LOGIC_HEAVY",
-        "CRITICAL",
-        "Product analytics and revenue forecasting system",
-    ),
-    (
-        "postgres_air",
-        "LOGIC_HEAVY",
-        "CRITICAL",
-        "Flight operations and safety-critical airline database",
-    ),
-]
-
-# Generate all Helm values files
-for db_name, scenario, criticality, description in databases_helm_config:
-    helm_content = create_helm_values(db_name, scenario, criticality, description)
-
-    filename = f"helm_values_{db_name}.yaml"
-    with open(filename, "w") as f:
-        f.write(helm_content)
-
-print("✅ Created Helm chart configurations for all 9 databases")
-print("Files created:")
-for db_name, scenario, criticality, description in databases_helm_config:
-    print(f"  - helm-charts/{db_name}/values.yaml ({scenario}, {criticality})")
-print("\nFeatures:")
-print("  - Environment-specific resource allocation")
-print("  - Criticality-based configurations")
-print("  - Monitoring and observability integration")
-print("  - Network policies and security")
-print("  - Backup strategies by criticality")
-print("  - Health checks and probes")
-print("  - Decommissioning metadata annotations")
+
+
+
+# Scenario-dependent settings: extra ingress for logic-heavy databases
+_NO_EXTRA_INGRESS = {
+    "analytics_ingress": "# Additional ingress disabled for non-logic-heavy",
+    "extra_namespace_selector": "",
+    "extra_match_labels": "",
+    "analytics_namespace": "",
+    "bi_namespace": "",
+}
+
+SCENARIO_PROFILES = {
+    "LOGIC_HEAVY": {
+        "analytics_ingress": "- from:",
+        "extra_namespace_selector": "- namespaceSelector:",
+        "extra_match_labels": "matchLabels:",
+        "analytics_namespace": "name: 'analytics'",
+        "bi_namespace": "name: 'business-intelligence'",
+    },
+    "MIXED": _NO_EXTRA_INGRESS,
+    "CONFIG_ONLY": _NO_EXTRA_INGRESS,
+}
+
+
+@lru_cache(maxsize=9)
+def _helm_segments(scenario_type, criticality):
+    """Compile the template with one (scenario, criticality) pair's values folded in
+
+    Only nine combinations exist, so each is compiled once and every database
+    sharing it only fills in its name and description.
+    """
+    return compile_template(
+        _HELM_TEMPLATE,
+        {
+            "scenario_type": scenario_type,
+            "criticality": criticality,
+            "scenario_lower": LOWER[scenario_type],
+            "criticality_lower": LOWER[criticality],
+            **CRITICALITY_DERIVED[criticality],
+            **SCENARIO_PROFILES[scenario_type],
+        },
+    )
+
+
+@lru_cache(maxsize=9)
+def _helm_skeleton(scenario_type, criticality):
+    """Byte form of one pair's compiled template, encoded once for every file"""
+    return encode_segments(_helm_segments(scenario_type, criticality))
+
+
+def create_helm_values(database_name, scenario_type, criticality, description):
+    """Create Helm values.yaml for a database"""
+
+    return render(
+        _helm_segments(scenario_type, criticality),
+        {"database_name": database_name, "description": description},
+    )
+
+
+def helm_values_file(db):
+    """Return the (filename, payload) pair of one database's Helm values file"""
+    # Only the per-database values are encoded; the static text is reused as bytes
+    payload = render_bytes(
+        _helm_skeleton(db.scenario, db.criticality),
+        {"database_name": db.name, "description": db.description},
+    )
+    return f"helm_values_{db.name}.yaml", payload
+
+
+def build():
+    """Return the (filename, payload) pairs generated by this script"""
+    return tuple(map(helm_values_file, DATABASES))
+
+# Highlights listed in the generation summary
+FEATURES = (
+    "Environment-specific resource allocation",
+    "Criticality-based configurations",
+    "Monitoring and observability integration",
+    "Network policies and security",
+    "Backup strategies by criticality",
+    "Health checks and probes",
+    "Decommissioning metadata annotations",
+)
+
+
+if __name__ == "__main__":
+    # Render and encode everything first, then write the files concurrently;
+    # they are independent and the GIL is released in open/write/close
+    helm_files = build()
+    with ThreadPoolExecutor(max_workers=len(helm_files)) as executor:
+        list(executor.map(write_payload, helm_files))
+
+    # One write for the whole summary instead of a print per line
+    sys.stdout.write(
+        "✅ Created Helm chart configurations for all 9 databases\n"
+        "Files created:\n"
+        + "".join(
+            f"  - helm-charts/{db.name}/values.yaml ({db.scenario}, {db.criticality})\n"
+            for db in DATABASES
+        )
+        + "\nFeatures:\n"
+        + "".join(f"  - {feature}\n" for feature in FEATURES)
+    )
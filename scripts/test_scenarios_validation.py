@@ -0,0 +1,620 @@
+#!/usr/bin/env python3
+"""
+Test Scenarios Validation Script
+================================
+
+Validates that database decommissioning test scenarios are properly implemented
+according to the separation rules defined in the requirements.
+
+Scenario Rules:
+- CONFIG_ONLY: References ONLY in Terraform, Helm, Docker, environment files
+- MIXED: Terraform + basic service connections (NO business logic)
+- LOGIC_HEAVY: Terraform + complex business operations + analytics
+
+Author: Database Team
+Version: 1.0
+"""
+
+import argparse
+import os
+import re
+import sys
+import threading
+import json
+import mmap
+import yaml
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate, chain
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Set, TextIO, Tuple, Union
+from dataclasses import dataclass
+from enum import Enum
+
+try:
+    import ahocorasick  # pyahocorasick, optional multi-pattern matcher
+except ImportError:
+    ahocorasick = None
+
+class ScenarioType(Enum):
+    CONFIG_ONLY = "CONFIG_ONLY"
+    MIXED = "MIXED"
+    LOGIC_HEAVY = "LOGIC_HEAVY"
+
+class ViolationType(Enum):
+    CRITICAL = "CRITICAL"
+    WARNING = "WARNING"
+    INFO = "INFO"
+
+@dataclass
+class ValidationResult:
+    """Validation result for a specific check"""
+    database: str
+    scenario: str  # ScenarioType value
+    check_name: str
+    status: str  # PASS, FAIL, WARNING
+    violation_type: str  # ViolationType value
+    message: str
+    details: List[str]
+    file_references: List[str]
+
+@dataclass
+class ScenarioDefinition:
+    """Database scenario definition"""
+    name: str
+    scenario_type: ScenarioType
+    criticality: str
+    owner_email: str
+    description: str
+
+TERRAFORM_FILES = (
+    "terraform/environments/dev/databases.tf",
+    "terraform/environments/prod/critical_databases.tf",
+    "terraform/modules/database/main.tf",
+)
+
+# src/ subdirectory -> application code category
+CODE_CATEGORIES = {
+    "config": "configuration",
+    "services": "service_layer",
+    "business": "business_logic",
+    "analytics": "analytics",
+}
+
+# Code categories a MIXED database must not touch / a LOGIC_HEAVY database must have
+MIXED_FORBIDDEN_TYPES = frozenset({"business_logic", "analytics"})
+LOGIC_HEAVY_REQUIRED_TYPES = frozenset({"business_logic", "analytics"})
+
+def _walk_py(root: str) -> Iterator[str]:
+    """Yield paths of .py files under root using os.scandir and an explicit stack"""
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".py") and entry.is_file():
+                        yield entry.path
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+
+class DatabaseScenarioValidator:
+    """Main validator for database scenarios"""
+    
+    def __init__(self, repo_root: str = ".", verbose: bool = True):
+        self.repo_root = Path(repo_root)
+        self.verbose = verbose
+        self.results: List[ValidationResult] = []
+        self._log_lines: List[str] = []
+        self._local = threading.local()
+        
+        # Database scenario definitions
+        self.scenarios = {
+            # Config-Only scenarios
+            "periodic_table": ScenarioDefinition(
+                "periodic_table", ScenarioType.CONFIG_ONLY, "LOW",
+                "chemistry-team@company.com", "Chemical elements reference"
+            ),
+            "world_happiness": ScenarioDefinition(
+                "world_happiness", ScenarioType.CONFIG_ONLY, "LOW",
+                "analytics-team@company.com", "World happiness index data"
+            ),
+            "titanic": ScenarioDefinition(
+                "titanic", ScenarioType.CONFIG_ONLY, "LOW",
+                "data-science-team@company.com", "Historical passenger data"
+            ),
+            
+            # Mixed scenarios
+            "pagila": ScenarioDefinition(
+                "pagila", ScenarioType.MIXED, "MEDIUM",
+                "development-team@company.com", "DVD rental store database"
+            ),
+            "chinook": ScenarioDefinition(
+                "chinook", ScenarioType.MIXED, "MEDIUM",
+                "media-team@company.com", "Digital media store"
+            ),
+            "netflix": ScenarioDefinition(
+                "netflix", ScenarioType.MIXED, "MEDIUM", 
+                "content-team@company.com", "Content catalog database"
+            ),
+            
+            # Logic-Heavy scenarios
+            "employees": ScenarioDefinition(
+                "employees", ScenarioType.LOGIC_HEAVY, "CRITICAL",
+                "hr-team@company.com", "Enterprise payroll system"
+            ),
+            "lego": ScenarioDefinition(
+                "lego", ScenarioType.LOGIC_HEAVY, "CRITICAL",
+                "analytics-team@company.com", "Product analytics system"
+            ),
+            "postgres_air": ScenarioDefinition(
+                "postgres_air", ScenarioType.LOGIC_HEAVY, "CRITICAL",
+                "operations-team@company.com", "Flight operations database"
+            )
+        }
+
+        # Struct-of-arrays view of the scenario table for the hot loops
+        self._db_names: Tuple[str, ...] = tuple(self.scenarios)
+        self._db_types: Tuple[ScenarioType, ...] = tuple(d.scenario_type for d in self.scenarios.values())
+        
+        # Application code files by category, from a single walk of src/ (plain str paths)
+        self._code_files: Dict[str, List[str]] = {code_type: [] for code_type in CODE_CATEGORIES.values()}
+        src_root = str(self.repo_root / "src")
+        prefix_len = len(src_root) + len(os.sep)
+        for file_path in sorted(_walk_py(src_root)):
+            code_type = CODE_CATEGORIES.get(file_path[prefix_len:].split(os.sep, 1)[0])
+            if code_type:
+                self._code_files[code_type].append(file_path)
+
+        # File contents are read at most once per run
+        self._file_contents: Dict[Union[str, Path], str] = {}
+        
+        # Multi-pattern matcher for all database names
+        self._db_automaton = None
+        if ahocorasick is not None:
+            self._db_automaton = ahocorasick.Automaton()
+            for name in self._db_names:
+                self._db_automaton.add_word(name, name)
+            self._db_automaton.make_automaton()
+        # Fallback: one compiled alternation; the lookahead also reports overlapping names
+        self._db_regex = re.compile(
+            "(?=(" + "|".join(re.escape(name) for name in sorted(self._db_names, key=len, reverse=True)) + "))"
+        )
+        # Same pattern over raw bytes, for searching memory-mapped files in place
+        self._db_regex_bytes = re.compile(self._db_regex.pattern.encode())
+        self._mmaps: Dict[Path, Union[mmap.mmap, bytes]] = {}
+        
+        # Per scenario type: required monitor elements and one regex matching any of them
+        self._monitor_checks: Dict[ScenarioType, Tuple[Tuple[str, ...], "re.Pattern[str]"]] = {}
+        for scenario_type in ScenarioType:
+            required = ("threshold", "alert", "owner", scenario_type.value)
+            self._monitor_checks[scenario_type] = (
+                required,
+                re.compile("(?=(" + "|".join(re.escape(elem) for elem in required) + "))", re.IGNORECASE),
+            )
+        
+        # Per category: databases referenced anywhere, and database -> files
+        self._category_dbs: Dict[str, Set[str]] = {}
+        self._code_refs: Dict[str, Dict[str, List[str]]] = {}
+        # Terraform file -> databases it defines, resolved once for all databases
+        self._tf_hits: Dict[str, Set[str]] = {}
+        self._prebuild_index()
+    
+    def _prebuild_index(self):
+        """Scan each category once as a NUL-joined corpus and attribute hits back to files"""
+        for code_type, files in self._code_files.items():
+            contents = [self._read(f) for f in files]
+            # Start offset of every file inside the corpus (each separator adds one char)
+            starts = list(accumulate((len(c) + 1 for c in contents[:-1]), initial=0))
+            corpus = "\x00".join(contents)
+            
+            refs: Dict[str, List[str]] = {}
+            for position, name in self._matches(corpus):
+                file_path = files[bisect_right(starts, position) - 1]
+                paths = refs.setdefault(name, [])
+                if not paths or paths[-1] != file_path:
+                    paths.append(file_path)
+            self._code_refs[code_type] = refs
+            self._category_dbs[code_type] = set(refs)
+        
+        for tf_file in TERRAFORM_FILES:
+            try:
+                mapped = self._mapped(self.repo_root / tf_file)
+            except FileNotFoundError:
+                continue
+            self._tf_hits[tf_file] = {m.group(1).decode() for m in self._db_regex_bytes.finditer(mapped)}
+    
+    def _mapped(self, path: Path) -> Union[mmap.mmap, bytes]:
+        """Read-only memory map of path, created once; searches run on the page cache without copying"""
+        mapped = self._mmaps.get(path)
+        if mapped is None:
+            with open(path, "rb") as f:
+                try:
+                    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:  # empty files cannot be mapped
+                    mapped = b""
+            self._mmaps[path] = mapped
+        return mapped
+    
+    def _mmap_contains(self, path: Path, needle: bytes) -> bool:
+        """Whether needle occurs in path, searched in place on the memory map"""
+        return self._mapped(path).find(needle) != -1
+    
+    def _read(self, path: Union[str, Path]) -> str:
+        """Return the contents of path, reading it from disk only the first time"""
+        content = self._file_contents.get(path)
+        if content is None:
+            with open(path, encoding="utf-8", errors="ignore") as f:
+                content = f.read()
+            self._file_contents[path] = content
+        return content
+    
+    def _matches(self, content: str) -> Iterator[Tuple[int, str]]:
+        """(start offset, database name) for every occurrence, in order of position"""
+        if self._db_automaton is not None:
+            for end, name in self._db_automaton.iter(content):
+                yield end - len(name) + 1, name
+        else:
+            for match in self._db_regex.finditer(content):
+                yield match.start(), match.group(1)
+    
+    def _databases_in(self, content: str) -> Set[str]:
+        """All scenario database names occurring in content"""
+        return {name for _, name in self._matches(content)}
+    
+    def validate_all_scenarios(self) -> List[ValidationResult]:
+        """Run all validation checks"""
+        print("🔍 Starting database scenario validation...")
+        print("=" * 60)
+        
+        # Databases are independent and the src index is prebuilt, so check them concurrently;
+        # map() keeps the per-database results (and their output) in definition order
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            per_database = list(executor.map(self._validate_one, range(len(self._db_names))))
+        
+        status_emoji = {"PASS": "✅", "FAIL": "❌", "WARNING": "⚠️"}
+        for i, results in enumerate(per_database):
+            self._log_lines.append(f"\n📊 Validating {self._db_names[i]} ({self._db_types[i].value})")
+            for result in results:
+                self._log_lines.append(
+                    f"  {status_emoji.get(result.status, '❓')} {result.check_name}: {result.message}"
+                )
+            self.results.extend(results)
+        
+        # Per-check feedback goes out in one write instead of one print per check
+        if self.verbose and self._log_lines:
+            sys.stdout.write("\n".join(self._log_lines) + "\n")
+        
+        self._generate_validation_report()
+        return self.results
+    
+    def _validate_one(self, index: int) -> List[ValidationResult]:
+        """Run every check for one database, collecting results in a thread-local buffer"""
+        database = self._db_names[index]
+        scenario_def = self.scenarios[database]
+        self._local.results = []
+        
+        # Core validation checks
+        self._validate_terraform_configuration(database, scenario_def)
+        code_references = self._validate_application_code_rules(database, scenario_def)
+        self._validate_monitoring_configuration(database, scenario_def)
+        self._validate_helm_configuration(database, scenario_def)
+        self._validate_documentation(database, scenario_def)
+        
+        # Scenario-specific validation
+        scenario_type = self._db_types[index]
+        if scenario_type == ScenarioType.CONFIG_ONLY:
+            self._validate_config_only_rules(database, scenario_def, code_references)
+        elif scenario_type == ScenarioType.MIXED:
+            self._validate_mixed_scenario_rules(database, scenario_def, code_references)
+        elif scenario_type == ScenarioType.LOGIC_HEAVY:
+            self._validate_logic_heavy_rules(database, scenario_def, code_references)
+        
+        return self._local.results
+    
+    def _validate_terraform_configuration(self, database: str, scenario_def: ScenarioDefinition):
+        """Validate Terraform configurations exist and are properly configured"""
+        found_references = [tf_file for tf_file, found_in in self._tf_hits.items() if database in found_in]
+        
+        if found_references:
+            self._add_result(database, scenario_def.scenario_type, "terraform_config", "PASS",
+                           ViolationType.INFO, f"Terraform configurations found",
+                           [f"Found in {len(found_references)} files"], found_references)
+        else:
+            self._add_result(database, scenario_def.scenario_type, "terraform_config", "FAIL",
+                           ViolationType.CRITICAL, f"No Terraform configurations found",
+                           ["Database must have infrastructure definitions"], [])
+    
+    def _validate_application_code_rules(self, database: str,
+                                         scenario_def: ScenarioDefinition) -> Dict[str, List[str]]:
+        """Validate application code follows scenario rules; returns code type -> referencing files"""
+        code_references = {}
+        for code_type, found_in in self._category_dbs.items():
+            if database in found_in:
+                code_references[code_type] = list(self._code_refs[code_type][database])
+        
+        # Validate based on scenario type
+        if scenario_def.scenario_type == ScenarioType.CONFIG_ONLY:
+            if code_references:
+                self._add_result(database, scenario_def.scenario_type, "code_separation", "FAIL",
+                               ViolationType.CRITICAL, 
+                               "Config-only database has application code references",
+                               [f"Found in: {list(code_references.keys())}"],
+                               list(chain.from_iterable(code_references.values())))
+            else:
+                self._add_result(database, scenario_def.scenario_type, "code_separation", "PASS",
+                               ViolationType.INFO, "No application code references (correct)",
+                               ["Config-only scenario properly implemented"], [])
+        
+        elif scenario_def.scenario_type == ScenarioType.MIXED:
+            violations = [f"Found {code_type} references"
+                          for code_type in code_references if code_type in MIXED_FORBIDDEN_TYPES]
+            
+            if violations:
+                self._add_result(database, scenario_def.scenario_type, "code_separation", "FAIL",
+                               ViolationType.CRITICAL,
+                               "Mixed scenario has forbidden business logic",
+                               violations, list(chain.from_iterable(code_references.values())))
+            else:
+                self._add_result(database, scenario_def.scenario_type, "code_separation", "PASS",
+                               ViolationType.INFO, "Mixed scenario properly implemented",
+                               [f"Found allowed types: {list(code_references.keys())}"], [])
+        
+        elif scenario_def.scenario_type == ScenarioType.LOGIC_HEAVY:
+            missing_types = sorted(LOGIC_HEAVY_REQUIRED_TYPES - code_references.keys())
+            
+            if missing_types:
+                self._add_result(database, scenario_def.scenario_type, "code_separation", "FAIL",
+                               ViolationType.WARNING,
+                               "Logic-heavy scenario missing required code types",
+                               [f"Missing: {missing_types}"], [])
+            else:
+                self._add_result(database, scenario_def.scenario_type, "code_separation", "PASS",
+                               ViolationType.INFO, "Logic-heavy scenario properly implemented",
+                               [f"Found all required types: {list(code_references.keys())}"], [])
+        
+        return code_references
+    
+    def _validate_config_only_rules(self, database: str, scenario_def: ScenarioDefinition,
+                                    code_references: Dict[str, List[str]]):
+        """Validate config-only specific rules"""
+        # Check that database is not referenced in service layer
+        violations = []
+        for code_type, group_name in [("service_layer", "service"), 
+                                      ("business_logic", "business"), 
+                                      ("analytics", "analytics")]:
+            for file_path in code_references.get(code_type, []):
+                violations.append(f"Found reference in {group_name}: {file_path}")
+        
+        if violations:
+            self._add_result(database, scenario_def.scenario_type, "config_only_purity", "FAIL",
+                           ViolationType.CRITICAL,
+                           "Config-only database has code references",
+                           violations, [])
+        else:
+            self._add_result(database, scenario_def.scenario_type, "config_only_purity", "PASS",
+                           ViolationType.INFO, "Config-only purity maintained", [], [])
+    
+    def _validate_mixed_scenario_rules(self, database: str, scenario_def: ScenarioDefinition,
+                                       code_references: Dict[str, List[str]]):
+        """Validate mixed scenario specific rules"""
+        # Should have service layer but no business logic
+        has_config = "configuration" in code_references
+        has_service = "service_layer" in code_references
+        
+        if has_config and has_service:
+            self._add_result(database, scenario_def.scenario_type, "mixed_scenario_structure", "PASS",
+                           ViolationType.INFO, "Mixed scenario properly structured",
+                           ["Has both config and service layer"], [])
+        else:
+            missing = []
+            if not has_config:
+                missing.append("configuration")
+            if not has_service:
+                missing.append("service layer")
+            
+            self._add_result(database, scenario_def.scenario_type, "mixed_scenario_structure", "WARNING",
+                           ViolationType.WARNING, "Mixed scenario incomplete",
+                           [f"Missing: {missing}"], [])
+    
+    def _validate_logic_heavy_rules(self, database: str, scenario_def: ScenarioDefinition,
+                                    code_references: Dict[str, List[str]]):
+        """Validate logic-heavy scenario specific rules"""
+        # Should have business logic and/or analytics
+        has_business = "business_logic" in code_references
+        has_analytics = "analytics" in code_references
+        
+        if has_business or has_analytics:
+            components = []
+            if has_business:
+                components.append("business logic")
+            if has_analytics:
+                components.append("analytics")
+            
+            self._add_result(database, scenario_def.scenario_type, "logic_heavy_complexity", "PASS",
+                           ViolationType.INFO, "Logic-heavy scenario properly implemented",
+                           [f"Has: {components}"], [])
+        else:
+            self._add_result(database, scenario_def.scenario_type, "logic_heavy_complexity", "FAIL",
+                           ViolationType.CRITICAL, "Logic-heavy scenario lacks complex logic",
+                           ["Missing business logic and analytics"], [])
+    
+    def _validate_monitoring_configuration(self, database: str, scenario_def: ScenarioDefinition):
+        """Validate monitoring configurations"""
+        monitor_file = self.repo_root / f"monitoring/database-monitors/{database}_monitor.yaml"
+        
+        # A single open() both probes for the file and reads it
+        try:
+            content = self._read(monitor_file)
+        except FileNotFoundError:
+            self._add_result(database, scenario_def.scenario_type, "monitoring_config", "FAIL",
+                           ViolationType.CRITICAL, "No monitoring configuration found", [], [])
+            return
+        except Exception as e:
+            self._add_result(database, scenario_def.scenario_type, "monitoring_config", "FAIL",
+                           ViolationType.WARNING, f"Monitoring config error: {e}", [], [str(monitor_file)])
+            return
+        
+        # Check for required monitoring elements with one case-insensitive scan
+        required_elements, pattern = self._monitor_checks[scenario_def.scenario_type]
+        found = {match.lower() for match in pattern.findall(content)}
+        missing_elements = [elem for elem in required_elements if elem.lower() not in found]
+        
+        if missing_elements:
+            self._add_result(database, scenario_def.scenario_type, "monitoring_config", "WARNING",
+                           ViolationType.WARNING, "Monitoring config incomplete",
+                           [f"Missing: {missing_elements}"], [str(monitor_file)])
+        else:
+            self._add_result(database, scenario_def.scenario_type, "monitoring_config", "PASS",
+                           ViolationType.INFO, "Monitoring properly configured", [], [str(monitor_file)])
+    
+    def _validate_helm_configuration(self, database: str, scenario_def: ScenarioDefinition):
+        """Validate Helm chart configurations"""
+        helm_file = self.repo_root / f"helm-charts/{database}/values.yaml"
+        
+        if helm_file.exists():
+            self._add_result(database, scenario_def.scenario_type, "helm_config", "PASS",
+                           ViolationType.INFO, "Helm configuration found", [], [str(helm_file)])
+        else:
+            self._add_result(database, scenario_def.scenario_type, "helm_config", "WARNING",
+                           ViolationType.WARNING, "No Helm configuration found", [], [])
+    
+    def _validate_documentation(self, database: str, scenario_def: ScenarioDefinition):
+        """Validate documentation exists and is complete"""
+        doc_file = self.repo_root / "docs/database-ownership.md"
+        
+        try:
+            complete = (self._mmap_contains(doc_file, database.encode())
+                        and self._mmap_contains(doc_file, scenario_def.owner_email.encode()))
+        except FileNotFoundError:
+            self._add_result(database, scenario_def.scenario_type, "documentation", "FAIL",
+                           ViolationType.CRITICAL, "No documentation found", [], [])
+            return
+        
+        if complete:
+            self._add_result(database, scenario_def.scenario_type, "documentation", "PASS",
+                           ViolationType.INFO, "Documentation complete", [], [str(doc_file)])
+        else:
+            self._add_result(database, scenario_def.scenario_type, "documentation", "WARNING",
+                           ViolationType.WARNING, "Documentation incomplete", 
+                           [f"Missing database or owner info"], [str(doc_file)])
+    
+    def _add_result(self, database: str, scenario: ScenarioType, check_name: str, 
+                    status: str, violation_type: ViolationType, message: str, 
+                    details: List[str], file_refs: List[str]):
+        """Add validation result"""
+        # Enums stay the typed API for callers; results carry their plain string values
+        result = ValidationResult(
+            database=database,
+            scenario=scenario.value,
+            check_name=check_name,
+            status=status,
+            violation_type=violation_type.value,
+            message=message,
+            details=details,
+            file_references=file_refs
+        )
+        # Buffered per worker thread; validate_all_scenarios merges and prints in order
+        self._local.results.append(result)
+    
+    def _generate_validation_report(self):
+        """Generate comprehensive validation report"""
+        print("\n" + "=" * 60)
+        print("📋 VALIDATION SUMMARY")
+        print("=" * 60)
+        
+        # Count results by status
+        status_counts = {"PASS": 0, "FAIL": 0, "WARNING": 0}
+        for result in self.results:
+            status_counts[result.status] += 1
+        
+        print(f"✅ PASSED: {status_counts['PASS']}")
+        print(f"❌ FAILED: {status_counts['FAIL']}")
+        print(f"⚠️  WARNINGS: {status_counts['WARNING']}")
+        print(f"📊 TOTAL CHECKS: {len(self.results)}")
+        
+        # Critical failures
+        critical = ViolationType.CRITICAL.value
+        critical_failures = [r for r in self.results 
+                           if r.status == "FAIL" and r.violation_type == critical]
+        
+        if critical_failures:
+            print(f"\n🚨 CRITICAL FAILURES ({len(critical_failures)}):")
+            for failure in critical_failures:
+                print(f"  ❌ {failure.database} ({failure.scenario}): {failure.message}")
+        
+        # Scenario compliance summary
+        print(f"\n📊 SCENARIO COMPLIANCE:")
+        for scenario_type in ScenarioType:
+            scenario_results = [r for r in self.results if r.scenario == scenario_type.value]
+            passes = len([r for r in scenario_results if r.status == "PASS"])
+            total = len(scenario_results)
+            compliance_rate = (passes / total * 100) if total > 0 else 0
+            print(f"  {scenario_type.value}: {compliance_rate:.1f}% ({passes}/{total})")
+        
+        # Overall assessment
+        overall_compliance = (status_counts["PASS"] / len(self.results) * 100) if self.results else 0
+        print(f"\n🎯 OVERALL COMPLIANCE: {overall_compliance:.1f}%")
+        
+        if critical_failures:
+            print("\n❌ VALIDATION FAILED - Critical issues must be resolved")
+            return False
+        elif status_counts["FAIL"] > 0:
+            print("\n⚠️  VALIDATION PASSED WITH ISSUES - Review failures")
+            return True
+        else:
+            print("\n✅ VALIDATION PASSED - All scenarios properly implemented")
+            return True
+
+def write_results_json(results: List[ValidationResult], f: TextIO):
+    """Stream results as an indented JSON array, one record at a time"""
+    if not results:
+        f.write("[]")
+        return
+    f.write("[\n")
+    for i, result in enumerate(results):
+        if i:
+            f.write(",\n")
+        record = json.dumps({
+            "database": result.database,
+            "scenario": result.scenario,
+            "check": result.check_name,
+            "status": result.status,
+            "violation_type": result.violation_type,
+            "message": result.message,
+            "details": result.details,
+            "files": result.file_references
+        }, indent=2)
+        f.write("  " + record.replace("\n", "\n  "))
+    f.write("\n]")
+
+def main():
+    """Main validation entry point"""
+    parser = argparse.ArgumentParser(description="Validate database decommissioning test scenarios")
+    parser.add_argument("--quiet", action="store_true", help="only print the summary report")
+    args = parser.parse_args()
+    
+    print("🔍 Database Decommissioning Test Scenarios Validation")
+    print("=" * 60)
+    print("Validating scenario separation and implementation...")
+    
+    validator = DatabaseScenarioValidator(verbose=not args.quiet)
+    results = validator.validate_all_scenarios()
+    
+    # Save results to JSON for CI/CD integration
+    with open("validation_results.json", "w") as f:
+        write_results_json(results, f)
+    
+    print(f"\n💾 Results saved to validation_results.json")
+    
+    # Exit code for CI/CD
+    critical_failures = [r for r in results if r.status == "FAIL" and 
+                        r.violation_type == ViolationType.CRITICAL.value]
+    exit_code = 1 if critical_failures else 0
+    
+    print(f"\n🚀 Validation complete - Exit code: {exit_code}")
+    return exit_code
+
+if __name__ == "__main__":
+    exit(main())
@@ -4,6 +4,7 @@
 
 import asyncio
 import logging
+import time
 from typing import Dict, List, Optional, Tuple, Any, Union
 from dataclasses import dataclass, field
 from datetime import datetime, date, timedelta
@@ -11,8 +12,95 @@ from decimal import Decimal, ROUND_HALF_UP
 import asyncpg
 from enum import Enum
 import statistics
+from bisect import bisect_left
+from string import Template
 from collections import defaultdict
 
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; forecasts reduce plain lists
+    np = None
+
+try:
+    from src.analytics.analytics_kernels import compute_metrics
+except ImportError:  # numba is optional; score products one at a time
+    compute_metrics = None
+
+# How long a portfolio analysis is reused before Postgres is queried again
+PORTFOLIO_CACHE_TTL_SECONDS = 300
+
+# Theme popularity factors for market penetration
+_MARKET_PENETRATION_FACTORS = {
+    "Star Wars": 0.85,
+    "City": 0.65,
+    "Creator Expert": 0.35,
+    "Technic": 0.45,
+    "Friends": 0.55,
+}
+
+# Fixed reference year for market penetration decay; unlike popularity
+# recency, penetration scores do not move with the calendar
+_PENETRATION_REFERENCE_YEAR = 2025
+
+# Themes scoring the strong brand factor in competitive advantage
+_STRONG_BRANDS = frozenset({"Star Wars", "Creator Expert", "Technic", "Architecture"})
+
+# Theme-based retail price multipliers, in percent
+_THEME_PRICE_MULTIPLIERS_PCT = {
+    "Creator Expert": 180,
+    "Star Wars": 150,
+    "Technic": 140,
+    "Architecture": 160,
+    "Ideas": 170,
+    "City": 110,
+    "Friends": 100,
+    "Classic": 90,
+}
+
+# Theme groupings for market segmentation
+_CREATOR_THEMES = frozenset({"Creator Expert", "Architecture", "Ideas"})
+_LICENSED_THEMES = frozenset({"Star Wars", "Harry Potter", "Marvel", "DC Comics"})
+_EDUCATIONAL_THEMES = frozenset({"Education", "Mindstorms"})
+
+# Themes flagged in forecast risks and recommendations
+_LICENSE_DEPENDENT_THEMES = frozenset({"Star Wars", "Harry Potter"})
+_ADULT_COLLECTOR_THEMES = frozenset({"Creator Expert", "Architecture"})
+
+# Market risk messages, one per bit of the risk mask in _assess_market_risks
+_RISK_MESSAGES = (
+    "LOW_CONSUMER_INTEREST: Below-average popularity scores",
+    "MARKET_SATURATION: Limited growth potential",
+    "LICENSE_DEPENDENCY: Revenue dependent on external IP",
+    "COMMODITY_PRESSURE: High competition in basic building sets",
+)
+_RISKS_BY_MASK = tuple(
+    tuple(message for bit, message in enumerate(_RISK_MESSAGES) if mask >> bit & 1)
+    or ("LOW_RISK: No significant risks identified",)
+    for mask in range(1 << len(_RISK_MESSAGES))
+)
+
+# Executive summary layout, parsed once at import (the growth line keeps its
+# trailing space, hence the split literal)
+_SUMMARY_TEMPLATE = Template(
+    """
+        EXECUTIVE SUMMARY - $theme Market Analysis
+
+        Projected Revenue: $$$revenue
+        Growth Rate: $growth_rate
+        Risk Level: $risk_level
+
+        The $theme theme shows $growth_label \n"""
+    """        growth potential with $impact revenue impact.
+
+        Key Focus: $focus
+        """
+)
+# Growth rates above each threshold move up one label
+_GROWTH_THRESHOLDS = (0.03, 0.08)
+_GROWTH_LABELS = ("limited", "moderate", "strong")
+# Indexed by the number of identified risks (1, 2, 3+)
+_RISK_LEVELS = ("LOW", "MODERATE", "HIGH")
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -36,7 +124,7 @@ class RevenueCategory(Enum):
     ENTRY_LEVEL = "ENTRY_LEVEL"  # <$50 sets
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProductPerformanceMetrics:
     """Product performance analytics"""
 
@@ -45,16 +133,139 @@ class ProductPerformanceMetrics:
     theme: str
     year_released: int
     piece_count: int
-    estimated_retail_price: Decimal
+    price_cents: int
     market_segment: MarketSegment
     revenue_category: RevenueCategory
     popularity_score: float
-    profit_margin_estimate: Decimal
+    margin_bp: int  # Profit margin, rounded half up to whole basis points
     market_penetration: float
     competitive_advantage: float
 
+    @property
+    def estimated_retail_price(self) -> Decimal:
+        """Estimated retail price in dollars"""
+        return Decimal(self.price_cents) / 100
+
+    @property
+    def profit_margin_estimate(self) -> Decimal:
+        """Profit margin as a fraction of the retail price
+
+        Four decimal places: the exact Decimal margin rounded to basis points.
+        """
+        return Decimal(self.margin_bp) / 10000
+
+    @classmethod
+    def from_estimates(
+        cls,
+        set_num: str,
+        set_name: str,
+        theme: str,
+        year_released: int,
+        piece_count: int,
+        estimated_retail_price: Decimal,
+        market_segment: MarketSegment,
+        revenue_category: RevenueCategory,
+        popularity_score: float,
+        profit_margin_estimate: Decimal,
+        market_penetration: float,
+        competitive_advantage: float,
+    ) -> "ProductPerformanceMetrics":
+        """Build metrics from a dollar price and fractional margin
+
+        Takes the fields under their pre-integer names; the price is rounded
+        half up to whole cents and the margin to whole basis points.
+        """
+        return cls(
+            set_num=set_num,
+            set_name=set_name,
+            theme=theme,
+            year_released=year_released,
+            piece_count=piece_count,
+            price_cents=int(
+                (Decimal(estimated_retail_price) * 100).to_integral_value(
+                    ROUND_HALF_UP
+                )
+            ),
+            market_segment=market_segment,
+            revenue_category=revenue_category,
+            popularity_score=popularity_score,
+            margin_bp=int(
+                (Decimal(profit_margin_estimate) * 10000).to_integral_value(
+                    ROUND_HALF_UP
+                )
+            ),
+            market_penetration=market_penetration,
+            competitive_advantage=competitive_advantage,
+        )
+
 
 @dataclass
+class PortfolioBatch:
+    """Columnar view of a portfolio for array reductions (requires numpy)
+
+    Rows are sorted by theme so every theme is one contiguous slice.
+    """
+
+    set_nums: "np.ndarray"
+    themes: "np.ndarray"
+    price_cents: "np.ndarray"  # int64
+    popularity: "np.ndarray"  # float64
+    margin_bp: "np.ndarray"  # int64
+    theme_ids: "np.ndarray"  # int32
+    theme_index: Dict[str, int]
+    order: "np.ndarray"  # Position of each sorted row in the source portfolio
+    theme_starts: "np.ndarray"  # First row of each theme id
+    theme_slices: Dict[str, slice]
+
+    @classmethod
+    def from_metrics(
+        cls, portfolio: List[ProductPerformanceMetrics]
+    ) -> "PortfolioBatch":
+        """Lay out a list of product metrics as parallel columns"""
+        n = len(portfolio)
+        set_nums = np.empty(n, dtype=object)
+        themes = np.empty(n, dtype=object)
+        price_cents = np.empty(n, dtype=np.int64)
+        popularity = np.empty(n, dtype=np.float64)
+        margin_bp = np.empty(n, dtype=np.int64)
+        theme_ids = np.empty(n, dtype=np.int32)
+
+        theme_index: Dict[str, int] = {}
+        for i, metrics in enumerate(portfolio):
+            set_nums[i] = metrics.set_num
+            themes[i] = metrics.theme
+            price_cents[i] = metrics.price_cents
+            popularity[i] = metrics.popularity_score
+            margin_bp[i] = metrics.margin_bp
+            theme_ids[i] = theme_index.setdefault(metrics.theme, len(theme_index))
+
+        # Stable, so each theme keeps its portfolio order
+        order = np.argsort(theme_ids, kind="stable")
+        theme_ids = theme_ids[order]
+        # Ids are dense and assigned in first-seen order, so np.unique
+        # returns one start per id, in id order
+        _, theme_starts = np.unique(theme_ids, return_index=True)
+        theme_ends = np.append(theme_starts[1:], n)
+        theme_slices = {
+            theme: slice(int(theme_starts[theme_id]), int(theme_ends[theme_id]))
+            for theme, theme_id in theme_index.items()
+        }
+
+        return cls(
+            set_nums=set_nums[order],
+            themes=themes[order],
+            price_cents=price_cents[order],
+            popularity=popularity[order],
+            margin_bp=margin_bp[order],
+            theme_ids=theme_ids,
+            theme_index=theme_index,
+            order=order,
+            theme_starts=theme_starts,
+            theme_slices=theme_slices,
+        )
+
+
+@dataclass(frozen=True, slots=True)
 class MarketForecast:
     """Market forecasting model results"""
 
@@ -68,7 +279,7 @@ class MarketForecast:
     executive_summary: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExecutiveMetrics:
     """Executive dashboard metrics"""
 
@@ -99,12 +310,26 @@ class LegoBusinessIntelligenceSystem:
     def __init__(self, connection_string: str):
         self.connection_string = connection_string
         self._market_data = self._initialize_market_intelligence()
+        self._portfolio_query = self._build_portfolio_query()
+        self._compound_factors = self._build_compound_factors()
+        self._pool: Optional[asyncpg.Pool] = None
+        self._pool_lock = asyncio.Lock()
+        # (loaded at, portfolio, portfolio grouped by theme, columnar portfolio)
+        self._portfolio_cache: Optional[
+            Tuple[
+                float,
+                List[ProductPerformanceMetrics],
+                Dict[str, List[ProductPerformanceMetrics]],
+                Optional[PortfolioBatch],
+            ]
+        ] = None
+        self._portfolio_lock = asyncio.Lock()
 
     def _initialize_market_intelligence(self) -> Dict[str, Any]:
         """Initialize market intelligence data (would come from external sources)"""
         return {
-            "average_price_per_piece": Decimal("0.12"),  # Industry average
-            "premium_threshold": Decimal("200.00"),
+            "average_price_per_piece_cents": 12,  # Industry average
+            "premium_threshold_cents": 20000,
             "market_growth_rates": {
                 "creator_expert": 0.15,  # 15% annual growth
                 "licensed_products": 0.08,  # 8% annual growth
@@ -120,6 +345,39 @@ class LegoBusinessIntelligenceSystem:
             },
         }
 
+    def _build_compound_factors(self) -> Dict[Tuple[str, int], float]:
+        """Precompute compounded growth for each segment over common horizons"""
+        factors = {}
+        for segment, rate in self._market_data["market_growth_rates"].items():
+            monthly_growth = (1 + rate) ** (1 / 12) - 1
+            for months in (6, 12, 24, 36):
+                factors[(segment, months)] = (1 + monthly_growth) ** months
+        return factors
+
+    async def _ensure_pool(self) -> asyncpg.Pool:
+        """Get the shared connection pool, creating it on first use"""
+        if self._pool is not None:
+            return self._pool
+
+        async with self._pool_lock:
+            # Another task may have created the pool while we waited
+            if self._pool is None:
+                self._pool = await asyncpg.create_pool(
+                    self.connection_string,
+                    min_size=10,
+                    max_size=50,
+                    statement_cache_size=1024,
+                    max_inactive_connection_lifetime=300,
+                )
+        return self._pool
+
+    async def close(self) -> None:
+        """Close the shared connection pool"""
+        async with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            await pool.close()
+
     async def analyze_product_portfolio(self) -> List[ProductPerformanceMetrics]:
         """
         EXECUTIVE FUNCTION: Comprehensive product portfolio analysis
@@ -129,146 +387,273 @@ class LegoBusinessIntelligenceSystem:
         - Product discontinuation decisions
         - Investment allocation
         - Strategic planning
+
+        Results are reused for PORTFOLIO_CACHE_TTL_SECONDS before re-querying.
         """
-        query = """
-        SELECT DISTINCT
-            s.set_num,
-            s.name as set_name,
-            t.name as theme,
-            s.year,
-            s.num_parts,
-            pc.name as primary_color,
-            COUNT(DISTINCT ip.part_num) as unique_parts,
-            AVG(p.part_material) as avg_complexity
-        FROM sets s
-        JOIN themes t ON s.theme_id = t.id
-        LEFT JOIN inventories i ON s.set_num = i.set_num
-        LEFT JOIN inventory_parts ip ON i.id = ip.inventory_id
-        LEFT JOIN parts p ON ip.part_num = p.part_num
-        LEFT JOIN colors pc ON ip.color_id = pc.id
-        WHERE s.year >= 2015  -- Focus on recent products
-        GROUP BY s.set_num, s.name, t.name, s.year, s.num_parts, pc.name
-        ORDER BY s.year DESC, s.num_parts DESC
-        LIMIT 500
+        _, portfolio_metrics, _, _ = await self._load_portfolio()
+        return portfolio_metrics
+
+    async def _load_portfolio(
+        self,
+    ) -> Tuple[
+        float,
+        List[ProductPerformanceMetrics],
+        Dict[str, List[ProductPerformanceMetrics]],
+        Optional[PortfolioBatch],
+    ]:
+        """Get the cached portfolio and its theme index, refreshing it when stale
+
+        The columnar batch is None when numpy is not installed.
         """
+        async with self._portfolio_lock:
+            cache = self._portfolio_cache
+            if cache and time.monotonic() - cache[0] < PORTFOLIO_CACHE_TTL_SECONDS:
+                return cache
+
+            portfolio_metrics = await self._fetch_portfolio()
+
+            batch = None
+            if np is not None:
+                batch = PortfolioBatch.from_metrics(portfolio_metrics)
+                by_theme = {
+                    theme: [portfolio_metrics[i] for i in batch.order[rows]]
+                    for theme, rows in batch.theme_slices.items()
+                }
+            else:
+                by_theme = defaultdict(list)
+                for metrics in portfolio_metrics:
+                    by_theme[metrics.theme].append(metrics)
+                by_theme = dict(by_theme)
+
+            self._portfolio_cache = (
+                time.monotonic(),
+                portfolio_metrics,
+                by_theme,
+                batch,
+            )
+            return self._portfolio_cache
 
-        try:
-            conn = await asyncpg.connect(self.connection_string)
-            rows = await conn.fetch(query)
-            await conn.close()
-
-            portfolio_metrics = []
+    def _build_portfolio_query(self) -> str:
+        """Build the portfolio query, pricing and classifying products in SQL
 
-            for row in rows:
-                # Calculate sophisticated business metrics
-                estimated_price = self._calculate_estimated_retail_price(
-                    row["num_parts"], row["theme"]
-                )
-                market_segment = self._determine_market_segment(
-                    row["theme"], estimated_price
-                )
-                revenue_category = self._categorize_revenue_impact(estimated_price)
+        This query is the only implementation of the retail price model: the
+        theme multiplier times the per-piece price, rounded to price points.
+        Postgres does that arithmetic per row.
+        """
 
-                # Advanced analytics calculations
-                popularity_score = self._calculate_popularity_score(
-                    row["year"], row["num_parts"], row["unique_parts"]
-                )
-                profit_margin = self._estimate_profit_margin(
-                    estimated_price, row["num_parts"]
-                )
-                market_penetration = self._calculate_market_penetration(
-                    row["theme"], row["year"]
-                )
-                competitive_advantage = self._assess_competitive_advantage(
-                    row["num_parts"], row["unique_parts"], row["theme"]
-                )
+        def sql_list(themes) -> str:
+            return ", ".join(
+                "'" + theme.replace("'", "''") + "'" for theme in sorted(themes)
+            )
 
-                metrics = ProductPerformanceMetrics(
-                    set_num=row["set_num"],
-                    set_name=row["set_name"],
-                    theme=row["theme"],
-                    year_released=row["year"],
-                    piece_count=row["num_parts"] or 0,
-                    estimated_retail_price=estimated_price,
-                    market_segment=market_segment,
-                    revenue_category=revenue_category,
-                    popularity_score=popularity_score,
-                    profit_margin_estimate=profit_margin,
-                    market_penetration=market_penetration,
-                    competitive_advantage=competitive_advantage,
-                )
+        theme_multipliers = ", ".join(
+            "('" + theme.replace("'", "''") + f"', {multiplier})"
+            for theme, multiplier in _THEME_PRICE_MULTIPLIERS_PCT.items()
+        )
+        price_per_piece = self._market_data["average_price_per_piece_cents"]
+        premium_threshold = self._market_data["premium_threshold_cents"]
 
-                portfolio_metrics.append(metrics)
+        return f"""
+        WITH theme_mult(theme, mult) AS (
+            VALUES {theme_multipliers}
+        ),
+        portfolio AS (
+            SELECT DISTINCT
+                s.set_num,
+                s.name as set_name,
+                t.name as theme,
+                s.year,
+                s.num_parts,
+                pc.name as primary_color,
+                COUNT(DISTINCT ip.part_num) as unique_parts,
+                AVG(p.part_material) as avg_complexity
+            FROM sets s
+            JOIN themes t ON s.theme_id = t.id
+            LEFT JOIN inventories i ON s.set_num = i.set_num
+            LEFT JOIN inventory_parts ip ON i.id = ip.inventory_id
+            LEFT JOIN parts p ON ip.part_num = p.part_num
+            LEFT JOIN colors pc ON ip.color_id = pc.id
+            WHERE s.year >= 2015  -- Focus on recent products
+            GROUP BY s.set_num, s.name, t.name, s.year, s.num_parts, pc.name
+            ORDER BY s.year DESC, s.num_parts DESC
+            LIMIT 500
+        ),
+        scaled AS (
+            -- Price in hundredths of a cent, so the multiplier stays exact
+            SELECT
+                portfolio.*,
+                COALESCE(portfolio.num_parts, 0)::bigint
+                    * {price_per_piece} * COALESCE(tm.mult, 120) AS scaled_price
+            FROM portfolio
+            LEFT JOIN theme_mult tm ON tm.theme = portfolio.theme
+        ),
+        priced AS (
+            SELECT
+                scaled.*,
+                CASE
+                    WHEN scaled_price < 300000 THEN 2999
+                    WHEN scaled_price < 1000000 THEN scaled_price / 100000 * 1000 + 999
+                    ELSE scaled_price / 500000 * 5000 + 4999
+                END AS price_cents
+            FROM scaled
+        )
+        SELECT
+            set_num,
+            set_name,
+            theme,
+            year,
+            num_parts,
+            unique_parts,
+            price_cents,
+            CASE
+                WHEN theme IN ({sql_list(_CREATOR_THEMES)}) THEN 'CREATOR_EXPERT'
+                WHEN theme IN ({sql_list(_LICENSED_THEMES)}) THEN 'LICENSED_PRODUCTS'
+                WHEN theme IN ({sql_list(_EDUCATIONAL_THEMES)}) THEN 'EDUCATIONAL'
+                WHEN theme LIKE '%Holiday%' OR theme LIKE '%Christmas%' THEN 'SEASONAL'
+                ELSE 'CLASSIC_BUILDING'
+            END AS market_segment,
+            CASE
+                WHEN price_cents >= {premium_threshold} THEN 'PREMIUM'
+                WHEN price_cents >= 5000 THEN 'MAINSTREAM'
+                ELSE 'ENTRY_LEVEL'
+            END AS revenue_category
+        FROM priced
+        ORDER BY year DESC, num_parts DESC
+        """
 
-            logger.info(f"Analyzed {len(portfolio_metrics)} products in portfolio")
+    async def _fetch_portfolio(self) -> List[ProductPerformanceMetrics]:
+        """Query the product portfolio and score every product"""
+        try:
+            pool = await self._ensure_pool()
+            async with pool.acquire() as conn:
+                # Stream rows through a server-side cursor. The query text never
+                # changes, so asyncpg's per-connection statement cache (sized in
+                # _ensure_pool) keeps it prepared and later runs skip parse/plan.
+                async with conn.transaction():
+                    cursor = conn.cursor(self._portfolio_query, prefetch=100)
+                    current_year = datetime.now().year
+                    if compute_metrics is not None:
+                        rows = [row async for row in cursor]
+                        portfolio_metrics = self._score_portfolio_batch(
+                            rows, current_year
+                        )
+                    else:
+                        portfolio_metrics = [
+                            self._score_product(row, current_year)
+                            async for row in cursor
+                        ]
+
+            logger.info("Analyzed %s products in portfolio", len(portfolio_metrics))
             return portfolio_metrics
 
         except Exception as e:
-            logger.error(f"Portfolio analysis failed: {e}")
+            logger.error("Portfolio analysis failed: %s", e)
             raise
 
-    def _calculate_estimated_retail_price(
-        self, piece_count: int, theme: str
-    ) -> Decimal:
-        """Calculate estimated retail price using proprietary algorithm"""
-        if not piece_count:
-            return Decimal("29.99")  # Default entry price
+    def _score_product(
+        self, row: asyncpg.Record, current_year: int
+    ) -> ProductPerformanceMetrics:
+        """Score a single portfolio row"""
+        # Price, segment and revenue category come priced from the query
+        estimated_price = row["price_cents"]
+        market_segment = MarketSegment(row["market_segment"])
+        revenue_category = RevenueCategory(row["revenue_category"])
+
+        # Advanced analytics calculations
+        popularity_score = self._calculate_popularity_score(
+            row["year"], row["num_parts"], row["unique_parts"], current_year
+        )
+        profit_margin = self._estimate_profit_margin(
+            estimated_price, row["num_parts"] or 0
+        )
+        market_penetration = self._calculate_market_penetration(
+            row["theme"], row["year"]
+        )
+        competitive_advantage = self._assess_competitive_advantage(
+            row["num_parts"], row["unique_parts"], row["theme"]
+        )
 
-        base_price = (
-            Decimal(str(piece_count)) * self._market_data["average_price_per_piece"]
+        return ProductPerformanceMetrics(
+            set_num=row["set_num"],
+            set_name=row["set_name"],
+            theme=row["theme"],
+            year_released=row["year"],
+            piece_count=row["num_parts"] or 0,
+            price_cents=estimated_price,
+            market_segment=market_segment,
+            revenue_category=revenue_category,
+            popularity_score=popularity_score,
+            margin_bp=profit_margin,
+            market_penetration=market_penetration,
+            competitive_advantage=competitive_advantage,
         )
 
-        # Theme-based premium multipliers
-        theme_multipliers = {
-            "Creator Expert": Decimal("1.8"),
-            "Star Wars": Decimal("1.5"),
-            "Technic": Decimal("1.4"),
-            "Architecture": Decimal("1.6"),
-            "Ideas": Decimal("1.7"),
-            "City": Decimal("1.1"),
-            "Friends": Decimal("1.0"),
-            "Classic": Decimal("0.9"),
-        }
+    def _score_portfolio_batch(
+        self, rows: List[asyncpg.Record], current_year: int
+    ) -> List[ProductPerformanceMetrics]:
+        """Score all portfolio rows at once with the compiled kernel"""
+        n = len(rows)
+        years = np.empty(n, dtype=np.float64)
+        pieces = np.empty(n, dtype=np.float64)
+        unique_parts = np.empty(n, dtype=np.float64)
+        prices = np.empty(n, dtype=np.float64)
+        theme_ids = np.empty(n, dtype=np.int64)
+
+        theme_index: Dict[str, int] = {}
+        for i, row in enumerate(rows):
+            years[i] = row["year"]
+            pieces[i] = row["num_parts"] or 0
+            unique_parts[i] = row["unique_parts"]
+            prices[i] = row["price_cents"] / 100
+            theme_ids[i] = theme_index.setdefault(row["theme"], len(theme_index))
+
+        # Per-theme factors, indexed by theme id
+        penetration_factors = np.array(
+            [_MARKET_PENETRATION_FACTORS.get(theme, 0.25) for theme in theme_index],
+            dtype=np.float64,
+        )
+        brand_factors = np.array(
+            [0.8 if theme in _STRONG_BRANDS else 0.4 for theme in theme_index],
+            dtype=np.float64,
+        )
 
-        multiplier = theme_multipliers.get(theme, Decimal("1.2"))
-        estimated_price = base_price * multiplier
+        popularity, advantage, margin, penetration = compute_metrics(
+            years,
+            pieces,
+            unique_parts,
+            prices,
+            theme_ids,
+            penetration_factors,
+            brand_factors,
+            float(current_year),
+            float(_PENETRATION_REFERENCE_YEAR),
+        )
 
-        # Round to realistic price points
-        if estimated_price < 30:
-            return Decimal("29.99")
-        elif estimated_price < 100:
-            return (estimated_price // 10) * 10 + Decimal("9.99")
-        else:
-            return (estimated_price // 50) * 50 + Decimal("49.99")
-
-    def _determine_market_segment(self, theme: str, price: Decimal) -> MarketSegment:
-        """Determine market segment based on theme and price"""
-        if theme in ["Creator Expert", "Architecture", "Ideas"]:
-            return MarketSegment.CREATOR_EXPERT
-        elif theme in ["Star Wars", "Harry Potter", "Marvel", "DC Comics"]:
-            return MarketSegment.LICENSED_PRODUCTS
-        elif theme in ["Education", "Mindstorms"]:
-            return MarketSegment.EDUCATIONAL
-        elif "Holiday" in theme or "Christmas" in theme:
-            return MarketSegment.SEASONAL
-        else:
-            return MarketSegment.CLASSIC_BUILDING
-
-    def _categorize_revenue_impact(self, price: Decimal) -> RevenueCategory:
-        """Categorize product by revenue impact"""
-        if price >= self._market_data["premium_threshold"]:
-            return RevenueCategory.PREMIUM
-        elif price >= Decimal("50.00"):
-            return RevenueCategory.MAINSTREAM
-        else:
-            return RevenueCategory.ENTRY_LEVEL
+        portfolio_metrics = []
+        for i, row in enumerate(rows):
+            portfolio_metrics.append(
+                ProductPerformanceMetrics(
+                    set_num=row["set_num"],
+                    set_name=row["set_name"],
+                    theme=row["theme"],
+                    year_released=row["year"],
+                    piece_count=row["num_parts"] or 0,
+                    price_cents=row["price_cents"],
+                    market_segment=MarketSegment(row["market_segment"]),
+                    revenue_category=RevenueCategory(row["revenue_category"]),
+                    popularity_score=float(popularity[i]),
+                    margin_bp=round(float(margin[i]) * 10000),
+                    market_penetration=float(penetration[i]),
+                    competitive_advantage=float(advantage[i]),
+                )
+            )
+        return portfolio_metrics
 
     def _calculate_popularity_score(
-        self, year: int, piece_count: int, unique_parts: int
+        self, year: int, piece_count: int, unique_parts: int, current_year: int
     ) -> float:
         """Calculate proprietary popularity score (0-100)"""
         # Recency factor (newer products score higher)
-        current_year = datetime.now().year
         recency_score = max(0, 100 - (current_year - year) * 10)
 
         # Complexity factor (optimal complexity scores highest)
@@ -288,38 +673,26 @@ class LegoBusinessIntelligenceSystem:
         )
         return max(0, min(100, popularity))
 
-    def _estimate_profit_margin(
-        self, retail_price: Decimal, piece_count: int
-    ) -> Decimal:
-        """Estimate profit margin using cost modeling"""
-        # Simplified cost model (real version would be highly confidential)
-        material_cost = Decimal(str(piece_count)) * Decimal("0.04")  # $0.04 per piece
-        manufacturing_cost = material_cost * Decimal("1.5")
-        total_cost = manufacturing_cost + retail_price * Decimal(
-            "0.15"
-        )  # 15% for overhead
-
-        profit_margin = (retail_price - total_cost) / retail_price
-        return max(
-            Decimal("0.05"), min(Decimal("0.70"), profit_margin)
-        )  # Cap between 5-70%
+    def _estimate_profit_margin(self, price_cents: int, piece_count: int) -> int:
+        """Estimate profit margin using cost modeling
+
+        Returns whole basis points: the cost share is rounded half up, so the
+        margin can differ from the exact ratio by up to half a basis point.
+        """
+        # Simplified cost model (real version would be highly confidential):
+        # $0.04 material per piece, 1.5x for manufacturing, 15% for overhead,
+        # so margin = 85% - 6 cents per piece / price
+        cost_bp = (2 * 60000 * piece_count + price_cents) // (2 * price_cents)
+        return max(500, min(7000, 8500 - cost_bp))  # Cap between 5-70%
 
     def _calculate_market_penetration(self, theme: str, year: int) -> float:
         """Calculate market penetration score (0-1)"""
         # Proprietary market penetration algorithm
         base_penetration = 0.15  # 15% base market penetration
 
-        # Theme popularity factors
-        theme_factors = {
-            "Star Wars": 0.85,
-            "City": 0.65,
-            "Creator Expert": 0.35,
-            "Technic": 0.45,
-            "Friends": 0.55,
-        }
-
-        theme_factor = theme_factors.get(theme, 0.25)
-        year_factor = max(0.1, 1.0 - (2025 - year) * 0.1)  # Decay over time
+        theme_factor = _MARKET_PENETRATION_FACTORS.get(theme, 0.25)
+        # Decay over time
+        year_factor = max(0.1, 1.0 - (_PENETRATION_REFERENCE_YEAR - year) * 0.1)
 
         return min(1.0, base_penetration + theme_factor * year_factor)
 
@@ -334,8 +707,7 @@ class LegoBusinessIntelligenceSystem:
             innovation_factor = 0
 
         # Brand strength factor
-        strong_brands = ["Star Wars", "Creator Expert", "Technic", "Architecture"]
-        brand_factor = 0.8 if theme in strong_brands else 0.4
+        brand_factor = 0.8 if theme in _STRONG_BRANDS else 0.4
 
         # Complexity factor
         complexity_factor = min(1.0, piece_count / 2000)  # Normalize to 2000 pieces
@@ -360,90 +732,169 @@ class LegoBusinessIntelligenceSystem:
         """
         try:
             # Get historical data for theme
-            portfolio_data = await self.analyze_product_portfolio()
-            theme_products = [p for p in portfolio_data if p.theme == theme]
+            _, _, portfolio_by_theme, batch = await self._load_portfolio()
+            theme_products = portfolio_by_theme.get(theme, [])
 
             if not theme_products:
                 raise ValueError(f"No data available for theme: {theme}")
 
             # Calculate current metrics
-            total_revenue = sum(p.estimated_retail_price for p in theme_products)
-            avg_margin = statistics.mean(
-                [float(p.profit_margin_estimate) for p in theme_products]
-            )
-            avg_popularity = statistics.mean(
-                [p.popularity_score for p in theme_products]
-            )
+            if batch is not None:
+                rows = batch.theme_slices[theme]
+                total_revenue_cents = int(batch.price_cents[rows].sum())
+                avg_margin = float(batch.margin_bp[rows].mean()) / 10000
+                avg_popularity = float(batch.popularity[rows].mean())
+            else:
+                total_revenue_cents = sum(p.price_cents for p in theme_products)
+                avg_margin = (
+                    statistics.mean([p.margin_bp for p in theme_products]) / 10000
+                )
+                avg_popularity = statistics.mean(
+                    [p.popularity_score for p in theme_products]
+                )
 
-            # Market segment analysis
-            market_segment = theme_products[0].market_segment
-            growth_rate = self._market_data["market_growth_rates"].get(
-                market_segment.value.lower(), 0.05
+            forecast = self._build_forecast(
+                theme,
+                forecast_months,
+                theme_products[0].market_segment,
+                total_revenue_cents,
+                avg_margin,
+                avg_popularity,
             )
 
-            # Forecast calculations
-            monthly_growth = (1 + growth_rate) ** (1 / 12) - 1
-            projected_revenue = total_revenue * (
-                (1 + monthly_growth) ** forecast_months
-            )
-
-            # Confidence intervals (simplified statistical model)
-            variance = 0.15  # 15% variance
-            lower_bound = projected_revenue * (1 - variance)
-            upper_bound = projected_revenue * (1 + variance)
-
-            # Risk assessment
-            risk_factors = self._assess_market_risks(theme, avg_popularity, growth_rate)
+            # Callers may forecast theme by theme; skip the currency
+            # formatting when INFO is off
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Generated market forecast for %s: $%s",
+                    theme,
+                    format(forecast.projected_revenue, ",.2f"),
+                )
+            return forecast
 
-            # Strategic recommendations
-            recommendations = self._generate_strategic_recommendations(
-                theme, projected_revenue, growth_rate, avg_margin
-            )
+        except Exception as e:
+            logger.error("Market forecast generation failed for %s: %s", theme, e)
+            raise
 
-            # Executive summary
-            executive_summary = self._create_executive_summary(
-                theme, projected_revenue, growth_rate, risk_factors
-            )
+    async def generate_all_forecasts(
+        self, forecast_months: int = 12
+    ) -> Dict[str, MarketForecast]:
+        """
+        STRATEGIC PLANNING: Generate market forecasts for every theme at once
 
-            forecast = MarketForecast(
-                forecast_period=f"{forecast_months} months",
-                theme=theme,
-                projected_revenue=projected_revenue,
-                confidence_interval=(lower_bound, upper_bound),
-                market_growth_rate=growth_rate,
-                risk_factors=risk_factors,
-                strategic_recommendations=recommendations,
-                executive_summary=executive_summary,
-            )
+        Loads the portfolio once and reduces all themes in a single pass,
+        for board reports covering the whole portfolio.
+        """
+        try:
+            _, _, portfolio_by_theme, batch = await self._load_portfolio()
+
+            if batch is not None and batch.theme_index:
+                # Themes are contiguous runs, so reduceat sums each in one pass
+                starts = batch.theme_starts
+                counts = np.diff(np.append(starts, len(batch.theme_ids)))
+                totals = np.add.reduceat(batch.price_cents, starts)
+                margin_means = np.add.reduceat(batch.margin_bp, starts) / counts
+                popularity_means = np.add.reduceat(batch.popularity, starts) / counts
+                theme_metrics = {
+                    theme: (
+                        int(totals[theme_id]),
+                        float(margin_means[theme_id]) / 10000,
+                        float(popularity_means[theme_id]),
+                    )
+                    for theme, theme_id in batch.theme_index.items()
+                }
+            else:
+                theme_metrics = {
+                    theme: (
+                        sum(p.price_cents for p in products),
+                        statistics.mean([p.margin_bp for p in products]) / 10000,
+                        statistics.mean([p.popularity_score for p in products]),
+                    )
+                    for theme, products in portfolio_by_theme.items()
+                }
+
+            forecasts = {}
+            for theme, (revenue_cents, margin, popularity) in theme_metrics.items():
+                forecasts[theme] = self._build_forecast(
+                    theme,
+                    forecast_months,
+                    portfolio_by_theme[theme][0].market_segment,
+                    revenue_cents,
+                    margin,
+                    popularity,
+                )
 
-            logger.info(
-                f"Generated market forecast for {theme}: ${projected_revenue:,.2f}"
-            )
-            return forecast
+            logger.info("Generated market forecasts for %s themes", len(forecasts))
+            return forecasts
 
         except Exception as e:
-            logger.error(f"Market forecast generation failed for {theme}: {e}")
+            logger.error(
+                "Market forecast generation failed for all themes: %s", e
+            )
             raise
 
-    def _assess_market_risks(
-        self, theme: str, avg_popularity: float, growth_rate: float
-    ) -> List[str]:
-        """Assess market risks for strategic planning"""
-        risks = []
+    def _build_forecast(
+        self,
+        theme: str,
+        forecast_months: int,
+        market_segment: MarketSegment,
+        total_revenue_cents: int,
+        avg_margin: float,
+        avg_popularity: float,
+    ) -> MarketForecast:
+        """Project a theme's revenue and assemble its forecast"""
+        # Market segment analysis
+        segment_key = market_segment.value.lower()
+        growth_rate = self._market_data["market_growth_rates"].get(segment_key, 0.05)
+
+        # Forecast calculations
+        growth_factor = self._compound_factors.get((segment_key, forecast_months))
+        if growth_factor is None:
+            monthly_growth = (1 + growth_rate) ** (1 / 12) - 1
+            growth_factor = (1 + monthly_growth) ** forecast_months
+        projected_cents = round(total_revenue_cents * growth_factor)
 
-        if avg_popularity < 40:
-            risks.append("LOW_CONSUMER_INTEREST: Below-average popularity scores")
+        # Confidence intervals (simplified statistical model)
+        variance = 0.15  # 15% variance
+        lower_bound = Decimal(round(projected_cents * (1 - variance))) / 100
+        upper_bound = Decimal(round(projected_cents * (1 + variance))) / 100
+        projected_revenue = Decimal(projected_cents) / 100
 
-        if growth_rate < 0.03:
-            risks.append("MARKET_SATURATION: Limited growth potential")
+        # Risk assessment
+        risk_factors = self._assess_market_risks(theme, avg_popularity, growth_rate)
 
-        if theme in ["Star Wars", "Harry Potter"]:
-            risks.append("LICENSE_DEPENDENCY: Revenue dependent on external IP")
+        # Strategic recommendations
+        recommendations = self._generate_strategic_recommendations(
+            theme, projected_revenue, growth_rate, avg_margin
+        )
 
-        if "Classic" in theme:
-            risks.append("COMMODITY_PRESSURE: High competition in basic building sets")
+        # Executive summary
+        executive_summary = self._create_executive_summary(
+            theme, projected_cents, growth_rate, risk_factors
+        )
 
-        return risks or ["LOW_RISK: No significant risks identified"]
+        return MarketForecast(
+            forecast_period=f"{forecast_months} months",
+            theme=theme,
+            projected_revenue=projected_revenue,
+            confidence_interval=(lower_bound, upper_bound),
+            market_growth_rate=growth_rate,
+            risk_factors=risk_factors,
+            strategic_recommendations=recommendations,
+            executive_summary=executive_summary,
+        )
+
+    def _assess_market_risks(
+        self, theme: str, avg_popularity: float, growth_rate: float
+    ) -> List[str]:
+        """Assess market risks for strategic planning"""
+        risk_bits = (
+            (avg_popularity < 40)
+            | (growth_rate < 0.03) << 1
+            | (theme in _LICENSE_DEPENDENT_THEMES) << 2
+            | ("Classic" in theme) << 3
+        )
+        return list(_RISKS_BY_MASK[risk_bits])
 
     def _generate_strategic_recommendations(
         self, theme: str, revenue: Decimal, growth_rate: float, margin: float
@@ -470,7 +921,7 @@ class LegoBusinessIntelligenceSystem:
                 "COST_OPTIMIZATION: Review manufacturing and pricing strategies"
             )
 
-        if theme in ["Creator Expert", "Architecture"]:
+        if theme in _ADULT_COLLECTOR_THEMES:
             recommendations.append(
                 "ADULT_MARKET_FOCUS: Continue targeting adult collectors"
             )
@@ -480,26 +931,23 @@ class LegoBusinessIntelligenceSystem:
         ]
 
     def _create_executive_summary(
-        self, theme: str, revenue: Decimal, growth_rate: float, risks: List[str]
+        self, theme: str, revenue_cents: int, growth_rate: float, risks: List[str]
     ) -> str:
         """Create executive summary for board presentations"""
-        risk_level = (
-            "HIGH" if len(risks) > 2 else "MODERATE" if len(risks) > 1 else "LOW"
+        return _SUMMARY_TEMPLATE.substitute(
+            theme=theme,
+            revenue=f"{revenue_cents / 100:,.0f}",
+            growth_rate=f"{growth_rate:.1%}",
+            risk_level=_RISK_LEVELS[min(len(risks), 3) - 1],
+            growth_label=_GROWTH_LABELS[bisect_left(_GROWTH_THRESHOLDS, growth_rate)],
+            impact="significant" if revenue_cents > 10_000_000_000 else "moderate",
+            focus=(
+                "Maintain market leadership"
+                if revenue_cents > 5_000_000_000
+                else "Optimize performance"
+            ),
         )
 
-        return f"""
-        EXECUTIVE SUMMARY - {theme} Market Analysis
-
-        Projected Revenue: ${revenue:,.0f}
-        Growth Rate: {growth_rate:.1%}
-        Risk Level: {risk_level}
-
-        The {theme} theme shows {'strong' if growth_rate > 0.08 else 'moderate' if growth_rate > 0.03 else 'limited'} 
-        growth potential with {'significant' if revenue > 100000000 else 'moderate'} revenue impact.
-
-        Key Focus: {'Maintain market leadership' if revenue > 50000000 else 'Optimize performance'}
-        """
-
 
 if __name__ == "__main__":
 
@@ -518,4 +966,12 @@ if __name__ == "__main__":
         print("📊 Market intelligence enabled")
         print("📊 Revenue forecasting ready")
 
+    # Hosting processes should do the same before starting their event loop
+    try:
+        import uvloop  # optional, faster event loop for asyncpg workloads
+
+        uvloop.install()
+    except ImportError:
+        pass
+
     asyncio.run(demo())
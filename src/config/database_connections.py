@@ -2,13 +2,18 @@
 # Database connection configurations for Mixed Reference scenarios
 # These databases have service layer connections but NO complex business logic
 
+import asyncio
 import os
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, Iterable, Optional
 from dataclasses import dataclass
+from functools import cached_property
 from urllib.parse import quote_plus
 
+if TYPE_CHECKING:
+    import asyncpg
 
-@dataclass
+
+@dataclass(frozen=True)
 class DatabaseConfig:
     """Database configuration data class"""
 
@@ -20,79 +25,135 @@ class DatabaseConfig:
     ssl_mode: str = "require"
     scenario_type: str = "MIXED"
 
-    @property
+    @cached_property
     def connection_string(self) -> str:
-        """Generate PostgreSQL connection string"""
+        """Generate PostgreSQL connection string (built once per config)"""
         return (
             f"postgresql://{quote_plus(self.username)}:"
             f"{quote_plus(self.password)}@{self.host}:{self.port}/"
             f"{self.database}?sslmode={self.ssl_mode}"
         )
 
+    @cached_property
+    def connection_requirements(self) -> Dict[str, bool]:
+        """Required-setting checks for this config (computed once per config)"""
+        requirements = {
+            "host_set": bool(self.host),
+            "username_set": bool(self.username),
+            "password_set": bool(self.password),
+            "ssl_enabled": self.ssl_mode == "require",
+            "azure_postgres": "postgres.database.azure.com" in self.host,
+        }
+        requirements["valid"] = (
+            requirements["host_set"]
+            and requirements["username_set"]
+            and requirements["password_set"]
+        )
+        return requirements
+
+
+# Mixed scenario databases: name -> (environment variable prefix, scenario type)
+_DATABASE_SPECS = {
+    "pagila": ("PAGILA", "MIXED"),  # DVD Rental Store
+    "chinook": ("CHINOOK", "MIXED"),  # Digital Media Store
+    "netflix": ("NETFLIX", "MIXED"),  # Content Catalog
+}
+
 
 class DatabaseConnectionManager:
     """Manages database connections for mixed scenario databases"""
 
     def __init__(self):
+        # Configurations are built from the environment on first use
         self._connections: Dict[str, DatabaseConfig] = {}
-        self._load_configurations()
-
-    def _load_configurations(self) -> None:
-        """Load database configurations from environment variables"""
-
-        # Mixed Scenario: Pagila Database (DVD Rental Store)
-        self._connections["pagila"] = DatabaseConfig(
-            host=os.getenv(
-                "PAGILA_DB_HOST", "psql-pagila-staging.postgres.database.azure.com"
-            ),
-            port=int(os.getenv("PAGILA_DB_PORT", "5432")),
-            database=os.getenv("PAGILA_DB_NAME", "pagila"),
-            username=os.getenv("PAGILA_DB_USER", "dbadmin"),
-            password=os.getenv("PAGILA_DB_PASSWORD", ""),
-            ssl_mode=os.getenv("PAGILA_DB_SSL_MODE", "require"),
-            scenario_type="MIXED",
-        )
-
-        # Mixed Scenario: Chinook Database (Digital Media Store)
-        self._connections["chinook"] = DatabaseConfig(
-            host=os.getenv(
-                "CHINOOK_DB_HOST", "psql-chinook-staging.postgres.database.azure.com"
+        # One pool per connection string, shared by every service so DSN
+        # parsing and TLS handshakes happen once rather than per operation
+        self._pools: Dict[str, "asyncpg.Pool"] = {}
+        self._pools_lock = asyncio.Lock()
+
+    def _load_configuration(self, name: str) -> DatabaseConfig:
+        """Load one database configuration from environment variables"""
+        prefix, scenario_type = _DATABASE_SPECS[name]
+        env = os.environ
+        return DatabaseConfig(
+            host=env.get(
+                f"{prefix}_DB_HOST", f"psql-{name}-staging.postgres.database.azure.com"
             ),
-            port=int(os.getenv("CHINOOK_DB_PORT", "5432")),
-            database=os.getenv("CHINOOK_DB_NAME", "chinook"),
-            username=os.getenv("CHINOOK_DB_USER", "dbadmin"),
-            password=os.getenv("CHINOOK_DB_PASSWORD", ""),
-            ssl_mode=os.getenv("CHINOOK_DB_SSL_MODE", "require"),
-            scenario_type="MIXED",
-        )
-
-        # Mixed Scenario: Netflix Database (Content Catalog)
-        self._connections["netflix"] = DatabaseConfig(
-            host=os.getenv(
-                "NETFLIX_DB_HOST", "psql-netflix-staging.postgres.database.azure.com"
-            ),
-            port=int(os.getenv("NETFLIX_DB_PORT", "5432")),
-            database=os.getenv("NETFLIX_DB_NAME", "netflix"),
-            username=os.getenv("NETFLIX_DB_USER", "dbadmin"),
-            password=os.getenv("NETFLIX_DB_PASSWORD", ""),
-            ssl_mode=os.getenv("NETFLIX_DB_SSL_MODE", "require"),
-            scenario_type="MIXED",
+            port=int(env.get(f"{prefix}_DB_PORT", "5432")),
+            database=env.get(f"{prefix}_DB_NAME", name),
+            username=env.get(f"{prefix}_DB_USER", "dbadmin"),
+            password=env.get(f"{prefix}_DB_PASSWORD", ""),
+            ssl_mode=env.get(f"{prefix}_DB_SSL_MODE", "require"),
+            scenario_type=scenario_type,
         )
 
     def get_config(self, database_name: str) -> Optional[DatabaseConfig]:
         """Get database configuration by name"""
-        return self._connections.get(database_name.lower())
+        name = database_name.lower()
+        config = self._connections.get(name)
+        if config is None and name in _DATABASE_SPECS:
+            config = self._connections[name] = self._load_configuration(name)
+        return config
 
     def get_connection_string(self, database_name: str) -> Optional[str]:
         """Get connection string for database"""
         config = self.get_config(database_name)
         return config.connection_string if config else None
 
+    async def get_pool(
+        self,
+        database_name: str,
+        min_size: int = 1,
+        max_size: int = 10,
+        command_timeout: Optional[float] = None,
+    ) -> "asyncpg.Pool":
+        """Get the shared connection pool for a database, creating it on first use
+
+        Pools are keyed by connection string, so databases that resolve to the
+        same server and credentials share one pool. Sizing only applies to the
+        caller that creates the pool.
+        """
+        config = self.get_config(database_name)
+        if not config:
+            raise ValueError(f"Database not found: {database_name}")
+
+        key = config.connection_string
+        pool = self._pools.get(key)
+        if pool is not None:
+            return pool
+
+        async with self._pools_lock:
+            # Another task may have created the pool while we waited
+            pool = self._pools.get(key)
+            if pool is None:
+                import asyncpg
+
+                pool = await asyncpg.create_pool(
+                    key,
+                    min_size=min_size,
+                    max_size=max_size,
+                    command_timeout=command_timeout,
+                )
+                self._pools[key] = pool
+        return pool
+
+    async def warmup(self, database_names: Iterable[str]) -> None:
+        """Create the shared pools for several databases concurrently
+
+        Meant for application startup, so first requests find a ready pool.
+        """
+        await asyncio.gather(*(self.get_pool(name) for name in database_names))
+
+    async def close_pools(self) -> None:
+        """Close all shared connection pools"""
+        async with self._pools_lock:
+            pools, self._pools = self._pools, {}
+        for pool in pools.values():
+            await pool.close()
+
     def list_databases(self) -> Dict[str, str]:
         """List all configured databases with their scenario types"""
-        return {
-            name: config.scenario_type for name, config in self._connections.items()
-        }
+        return {name: scenario for name, (_, scenario) in _DATABASE_SPECS.items()}
 
     def validate_connection_requirements(self, database_name: str) -> Dict[str, bool]:
         """Validate that required environment variables are set"""
@@ -100,23 +161,8 @@ class DatabaseConnectionManager:
         if not config:
             return {"valid": False, "error": "Database not found"}
 
-        validation_results = {
-            "host_set": bool(config.host),
-            "username_set": bool(config.username),
-            "password_set": bool(config.password),
-            "ssl_enabled": config.ssl_mode == "require",
-            "azure_postgres": "postgres.database.azure.com" in config.host,
-        }
-
-        validation_results["valid"] = all(
-            [
-                validation_results["host_set"],
-                validation_results["username_set"],
-                validation_results["password_set"],
-            ]
-        )
-
-        return validation_results
+        # Copy so callers can't modify the cached checks
+        return dict(config.connection_requirements)
 
 
 # Global connection manager instance
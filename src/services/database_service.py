@@ -4,12 +4,13 @@
 
 import asyncio
 import logging
+import time
 from typing import Dict, List, Optional, Any, Tuple
 from contextlib import asynccontextmanager
 import asyncpg
 from asyncpg import Connection, Pool
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 
 from src.config.database_connections import connection_manager, DatabaseConfig
 
@@ -17,45 +18,79 @@ from src.config.database_connections import connection_manager, DatabaseConfig
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# How long table metadata is reused before information_schema is queried again
+TABLE_INFO_CACHE_TTL_SECONDS = 60
+
+def _iso(ns: int) -> str:
+    """Format a time.time_ns() timestamp as a UTC ISO-8601 string"""
+    return datetime.fromtimestamp(ns / 1e9, tz=timezone.utc).isoformat()
+
 @dataclass
 class ConnectionInfo:
     """Connection information for monitoring"""
     database_name: str
-    connected_at: datetime
+    connected_at_ns: int
     connection_count: int
-    last_query_at: Optional[datetime] = None
+    # Wall-clock ns of the last acquire; a datetime is built only when read
+    last_query_ns: Optional[int] = None
     scenario_type: str = "MIXED"
 
+    @property
+    def connected_at(self) -> datetime:
+        """UTC time the pool was attached"""
+        return datetime.fromtimestamp(self.connected_at_ns / 1e9, tz=timezone.utc)
+
+    @property
+    def last_query_at(self) -> Optional[datetime]:
+        """UTC time of the last connection acquire, if any"""
+        if self.last_query_ns is None:
+            return None
+        return datetime.fromtimestamp(self.last_query_ns / 1e9, tz=timezone.utc)
+
 class DatabaseHealthChecker:
     """Health check utilities for database connections"""
 
     @staticmethod
-    async def check_connection(config: DatabaseConfig) -> Dict[str, Any]:
-        """Check if database connection is healthy"""
+    async def check_connection(
+        config: DatabaseConfig,
+        pool: Optional[Pool] = None,
+        server_version: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Check if database connection is healthy
+
+        Uses a connection from pool when given, otherwise connects just for the probe.
+        A known server_version is reported as-is and only SELECT 1 is run.
+        """
         try:
-            conn = await asyncpg.connect(config.connection_string)
-
-            # Simple health check query
-            result = await conn.fetchval("SELECT 1")
-            server_version = await conn.fetchval("SELECT version()")
-
-            await conn.close()
+            # A successful query is the health check
+            if pool is not None:
+                async with pool.acquire() as conn:
+                    if server_version is None:
+                        server_version = await conn.fetchval("SELECT version()")
+                    else:
+                        await conn.fetchval("SELECT 1")
+            else:
+                conn = await asyncpg.connect(config.connection_string)
+                try:
+                    server_version = await conn.fetchval("SELECT version()")
+                finally:
+                    await conn.close()
 
             return {
                 "healthy": True,
                 "database": config.database,
                 "server_version": server_version,
-                "checked_at": datetime.utcnow().isoformat(),
+                "checked_at": _iso(time.time_ns()),
                 "scenario_type": config.scenario_type
             }
 
         except Exception as e:
-            logger.error(f"Health check failed for {config.database}: {e}")
+            logger.error("Health check failed for %s: %s", config.database, e)
             return {
                 "healthy": False,
                 "database": config.database,
                 "error": str(e),
-                "checked_at": datetime.utcnow().isoformat(),
+                "checked_at": _iso(time.time_ns()),
                 "scenario_type": config.scenario_type
             }
 
@@ -65,18 +100,25 @@ class DatabaseService:
     def __init__(self):
         self._pools: Dict[str, Pool] = {}
         self._connection_info: Dict[str, ConnectionInfo] = {}
+        # database -> (loaded at, table info); metadata changes rarely
+        self._meta_cache: Dict[str, Tuple[float, List[asyncpg.Record]]] = {}
+        # database -> version() reported by its server, fixed for the pool's life
+        self._server_versions: Dict[str, str] = {}
 
     async def initialize_pool(self, database_name: str, min_size: int = 2, max_size: int = 10) -> bool:
-        """Initialize connection pool for a database"""
+        """Borrow the shared connection pool for a database
+
+        connection_manager owns the pool; min_size and max_size only apply if
+        this call is the one that creates it.
+        """
         try:
             config = connection_manager.get_config(database_name)
             if not config:
-                logger.error(f"No configuration found for database: {database_name}")
+                logger.error("No configuration found for database: %s", database_name)
                 return False
 
-            # Create connection pool
-            pool = await asyncpg.create_pool(
-                config.connection_string,
+            pool = await connection_manager.get_pool(
+                database_name,
                 min_size=min_size,
                 max_size=max_size,
                 command_timeout=30
@@ -85,16 +127,16 @@ class DatabaseService:
             self._pools[database_name] = pool
             self._connection_info[database_name] = ConnectionInfo(
                 database_name=database_name,
-                connected_at=datetime.utcnow(),
-                connection_count=min_size,
+                connected_at_ns=time.time_ns(),
+                connection_count=pool.get_size(),
                 scenario_type=config.scenario_type
             )
 
-            logger.info(f"Initialized connection pool for {database_name}")
+            logger.info("Attached connection pool for %s", database_name)
             return True
 
         except Exception as e:
-            logger.error(f"Failed to initialize pool for {database_name}: {e}")
+            logger.error("Failed to initialize pool for %s: %s", database_name, e)
             return False
 
     @asynccontextmanager
@@ -105,9 +147,9 @@ class DatabaseService:
 
         pool = self._pools[database_name]
         async with pool.acquire() as connection:
-            # Update last query time
-            if database_name in self._connection_info:
-                self._connection_info[database_name].last_query_at = datetime.utcnow()
+            self._connection_info[database_name].last_query_ns = time.time_ns()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Acquired connection for %s (%d idle)", database_name, pool.get_idle_size())
             yield connection
 
     async def execute_query(self, database_name: str, query: str, *args) -> List[Dict[str, Any]]:
@@ -118,11 +160,44 @@ class DatabaseService:
                 return [dict(row) for row in rows]
 
         except Exception as e:
-            logger.error(f"Query execution failed for {database_name}: {e}")
+            logger.error("Query execution failed for %s: %s", database_name, e)
+            raise
+
+    async def fetch(self, database_name: str, query: str, *args) -> List[asyncpg.Record]:
+        """Execute a simple SELECT query, returning asyncpg Records as-is
+
+        Records support row["column"] lookups; use execute_query when plain
+        dicts are needed.
+        """
+        try:
+            async with self.get_connection(database_name) as conn:
+                return await conn.fetch(query, *args)
+
+        except Exception as e:
+            logger.error("Query execution failed for %s: %s", database_name, e)
+            raise
+
+    async def count(self, database_name: str, table: str) -> int:
+        """Count the rows of a table (simple read operation)"""
+        # Quoted, so mixed-case names like Chinook's "Track" resolve as written
+        identifier = '"' + table.replace('"', '""') + '"'
+        try:
+            async with self.get_connection(database_name) as conn:
+                return await conn.fetchval(f"SELECT COUNT(*) FROM {identifier}")
+
+        except Exception as e:
+            logger.error("Row count failed for %s.%s: %s", database_name, table, e)
             raise
 
     async def get_table_info(self, database_name: str) -> List[Dict[str, Any]]:
-        """Get basic table information (metadata only)"""
+        """Get basic table information (metadata only), cached briefly
+
+        The cache holds the immutable Records; every call gets its own dicts.
+        """
+        cached = self._meta_cache.get(database_name)
+        if cached and time.monotonic() - cached[0] < TABLE_INFO_CACHE_TTL_SECONDS:
+            return [dict(row) for row in cached[1]]
+
         query = """
         SELECT 
             table_name,
@@ -133,7 +208,26 @@ class DatabaseService:
         ORDER BY table_name
         """
 
-        return await self.execute_query(database_name, query)
+        table_info = await self.fetch(database_name, query)
+        self._meta_cache[database_name] = (time.monotonic(), table_info)
+        return [dict(row) for row in table_info]
+
+    async def health_check(self, database_name: str) -> Dict[str, Any]:
+        """Check database health over this service's pool when it is initialized"""
+        config = connection_manager.get_config(database_name)
+        if not config:
+            return {
+                "healthy": False,
+                "error": "Configuration not found",
+                "database": database_name
+            }
+        pool = self._pools.get(database_name)
+        result = await DatabaseHealthChecker.check_connection(
+            config, pool, self._server_versions.get(database_name)
+        )
+        if pool is not None and result["healthy"]:
+            self._server_versions[database_name] = result["server_version"]
+        return result
 
     async def get_connection_stats(self, database_name: str) -> Dict[str, Any]:
         """Get connection statistics"""
@@ -147,21 +241,26 @@ class DatabaseService:
             "database_name": database_name,
             "pool_size": pool.get_size(),
             "pool_idle": pool.get_idle_size(),
-            "connected_at": info.connected_at.isoformat() if info else None,
-            "last_query_at": info.last_query_at.isoformat() if info and info.last_query_at else None,
+            "connected_at": _iso(info.connected_at_ns) if info else None,
+            "last_query_at": _iso(info.last_query_ns) if info and info.last_query_ns else None,
             "scenario_type": info.scenario_type if info else "UNKNOWN"
         }
 
     async def close_pool(self, database_name: str) -> None:
-        """Close connection pool for a database"""
+        """Release this service's hold on a database's pool
+
+        The pool itself is shared and stays open until
+        connection_manager.close_pools() runs at shutdown.
+        """
         if database_name in self._pools:
-            await self._pools[database_name].close()
             del self._pools[database_name]
             del self._connection_info[database_name]
-            logger.info(f"Closed connection pool for {database_name}")
+            self._meta_cache.pop(database_name, None)
+            self._server_versions.pop(database_name, None)
+            logger.info("Released connection pool for %s", database_name)
 
     async def close_all_pools(self) -> None:
-        """Close all connection pools"""
+        """Release all connection pools held by this service"""
         for database_name in list(self._pools.keys()):
             await self.close_pool(database_name)
 
@@ -176,19 +275,11 @@ class PagilaService(DatabaseService):
 
     async def get_film_count(self) -> int:
         """Get total number of films (simple read operation)"""
-        result = await self.execute_query(
-            self.database_name, 
-            "SELECT COUNT(*) as count FROM film"
-        )
-        return result[0]["count"] if result else 0
+        return await self.count(self.database_name, "film")
 
     async def get_customer_count(self) -> int:
         """Get total number of customers (simple read operation)"""
-        result = await self.execute_query(
-            self.database_name,
-            "SELECT COUNT(*) as count FROM customer"
-        )
-        return result[0]["count"] if result else 0
+        return await self.count(self.database_name, "customer")
 
 class ChinookService(DatabaseService):
     """Service for Chinook digital media database (Mixed scenario)"""
@@ -199,19 +290,11 @@ class ChinookService(DatabaseService):
 
     async def get_track_count(self) -> int:
         """Get total number of tracks (simple read operation)"""
-        result = await self.execute_query(
-            self.database_name,
-            "SELECT COUNT(*) as count FROM "Track""
-        )
-        return result[0]["count"] if result else 0
+        return await self.count(self.database_name, "Track")
 
     async def get_artist_count(self) -> int:
         """Get total number of artists (simple read operation)"""
-        result = await self.execute_query(
-            self.database_name,
-            "SELECT COUNT(*) as count FROM "Artist""
-        )
-        return result[0]["count"] if result else 0
+        return await self.count(self.database_name, "Artist")
 
 class NetflixService(DatabaseService):
     """Service for Netflix content database (Mixed scenario)"""
@@ -222,15 +305,11 @@ class NetflixService(DatabaseService):
 
     async def get_title_count(self) -> int:
         """Get total number of titles (simple read operation)"""
-        result = await self.execute_query(
-            self.database_name,
-            "SELECT COUNT(*) as count FROM netflix_titles"
-        )
-        return result[0]["count"] if result else 0
+        return await self.count(self.database_name, "netflix_titles")
 
     async def get_content_types(self) -> List[str]:
         """Get distinct content types (simple read operation)"""
-        result = await self.execute_query(
+        result = await self.fetch(
             self.database_name,
             "SELECT DISTINCT type FROM netflix_titles WHERE type IS NOT NULL"
         )
@@ -254,21 +333,23 @@ class MixedScenarioServiceFactory:
 
     @staticmethod
     async def health_check_all() -> Dict[str, Dict[str, Any]]:
-        """Run health checks on all mixed scenario databases"""
-        results = {}
+        """Run health checks on all mixed scenario databases concurrently"""
+        db_names = ["pagila", "chinook", "netflix"]
 
-        for db_name in ["pagila", "chinook", "netflix"]:
+        async def check(db_name: str) -> Dict[str, Any]:
             config = connection_manager.get_config(db_name)
             if config:
-                results[db_name] = await DatabaseHealthChecker.check_connection(config)
-            else:
-                results[db_name] = {
-                    "healthy": False,
-                    "error": "Configuration not found",
-                    "database": db_name
-                }
+                return await DatabaseHealthChecker.check_connection(config)
+            return {
+                "healthy": False,
+                "error": "Configuration not found",
+                "database": db_name
+            }
 
-        return results
+        # check_connection reports its own failures, so one slow or broken
+        # database never holds up or hides the others
+        checks = await asyncio.gather(*(check(db_name) for db_name in db_names))
+        return dict(zip(db_names, checks))
 
 # Global service instances
 pagila_service = PagilaService()
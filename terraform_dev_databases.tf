@@ -40,46 +40,29 @@ resource "random_password" "db_admin_password" {
   special = true
 }
 
-# Config-Only Scenario: Periodic Table Database
-resource "azurerm_postgresql_flexible_server" "periodic_table" {
-  name                   = "psql-periodic-table-dev"
-  resource_group_name    = azurerm_resource_group.dev_databases.name
-  location              = azurerm_resource_group.dev_databases.location
-  version               = "14"
-  delegated_subnet_id   = azurerm_subnet.database_subnet.id
-  private_dns_zone_id   = azurerm_private_dns_zone.database_dns.id
-  administrator_login    = "dbadmin"
-  administrator_password = random_password.db_admin_password.result
-
-  storage_mb = 32768
-  sku_name   = "B_Standard_B1ms"
-
-  backup_retention_days        = 7
-  geo_redundant_backup_enabled = false
-
-  tags = {
-    Environment = "Development"
-    Purpose     = "Config-Only Testing"
-    Owner       = "chemistry-team@company.com"
-    LastUsed    = "2024-02-20"  # 30+ days ago
-    Criticality = "LOW"
-    Scenario    = "CONFIG_ONLY"
-    DataSize    = "Small"
+# Config-Only Scenario databases; one for_each keeps all three servers in a
+# single resource so Terraform plans and applies them together
+locals {
+  config_only_databases = {
+    periodic_table = {
+      owner     = "chemistry-team@company.com"
+      last_used = "2024-02-20"  # 30+ days ago
+    }
+    world_happiness = {
+      owner     = "analytics-team@company.com"
+      last_used = "2024-01-30"  # 30+ days ago
+    }
+    titanic = {
+      owner     = "data-science-team@company.com"
+      last_used = "2024-02-10"  # 30+ days ago
+    }
   }
-
-  depends_on = [azurerm_private_dns_zone_virtual_network_link.database_dns_link]
 }
 
-resource "azurerm_postgresql_flexible_server_database" "periodic_table_db" {
-  name      = "periodic_table"
-  server_id = azurerm_postgresql_flexible_server.periodic_table.id
-  collation = "en_US.utf8"
-  charset   = "utf8"
-}
+resource "azurerm_postgresql_flexible_server" "config_only" {
+  for_each = local.config_only_databases
 
-# Config-Only Scenario: World Happiness Database
-resource "azurerm_postgresql_flexible_server" "world_happiness" {
-  name                   = "psql-world-happiness-dev"
+  name                   = "psql-${replace(each.key, "_", "-")}-dev"
   resource_group_name    = azurerm_resource_group.dev_databases.name
   location              = azurerm_resource_group.dev_databases.location
   version               = "14"
@@ -97,8 +80,8 @@ resource "azurerm_postgresql_flexible_server" "world_happiness" {
   tags = {
     Environment = "Development"
     Purpose     = "Config-Only Testing"
-    Owner       = "analytics-team@company.com"
-    LastUsed    = "2024-01-30"  # 30+ days ago
+    Owner       = each.value.owner
+    LastUsed    = each.value.last_used
     Criticality = "LOW"
     Scenario    = "CONFIG_ONLY"
     DataSize    = "Small"
@@ -107,48 +90,44 @@ resource "azurerm_postgresql_flexible_server" "world_happiness" {
   depends_on = [azurerm_private_dns_zone_virtual_network_link.database_dns_link]
 }
 
-resource "azurerm_postgresql_flexible_server_database" "world_happiness_db" {
-  name      = "world_happiness"
-  server_id = azurerm_postgresql_flexible_server.world_happiness.id
+resource "azurerm_postgresql_flexible_server_database" "config_only" {
+  for_each = local.config_only_databases
+
+  name      = each.key
+  server_id = azurerm_postgresql_flexible_server.config_only[each.key].id
   collation = "en_US.utf8"
   charset   = "utf8"
 }
 
-# Config-Only Scenario: Titanic Database
-resource "azurerm_postgresql_flexible_server" "titanic" {
-  name                   = "psql-titanic-dev"
-  resource_group_name    = azurerm_resource_group.dev_databases.name
-  location              = azurerm_resource_group.dev_databases.location
-  version               = "14"
-  delegated_subnet_id   = azurerm_subnet.database_subnet.id
-  private_dns_zone_id   = azurerm_private_dns_zone.database_dns.id
-  administrator_login    = "dbadmin"
-  administrator_password = random_password.db_admin_password.result
+# State moves from the former one-resource-per-database layout
+moved {
+  from = azurerm_postgresql_flexible_server.periodic_table
+  to   = azurerm_postgresql_flexible_server.config_only["periodic_table"]
+}
 
-  storage_mb = 32768
-  sku_name   = "B_Standard_B1ms"
+moved {
+  from = azurerm_postgresql_flexible_server_database.periodic_table_db
+  to   = azurerm_postgresql_flexible_server_database.config_only["periodic_table"]
+}
 
-  backup_retention_days        = 7
-  geo_redundant_backup_enabled = false
+moved {
+  from = azurerm_postgresql_flexible_server.world_happiness
+  to   = azurerm_postgresql_flexible_server.config_only["world_happiness"]
+}
 
-  tags = {
-    Environment = "Development"
-    Purpose     = "Config-Only Testing"
-    Owner       = "data-science-team@company.com"
-    LastUsed    = "2024-02-10"  # 30+ days ago
-    Criticality = "LOW"
-    Scenario    = "CONFIG_ONLY"
-    DataSize    = "Small"
-  }
+moved {
+  from = azurerm_postgresql_flexible_server_database.world_happiness_db
+  to   = azurerm_postgresql_flexible_server_database.config_only["world_happiness"]
+}
 
-  depends_on = [azurerm_private_dns_zone_virtual_network_link.database_dns_link]
+moved {
+  from = azurerm_postgresql_flexible_server.titanic
+  to   = azurerm_postgresql_flexible_server.config_only["titanic"]
 }
 
-resource "azurerm_postgresql_flexible_server_database" "titanic_db" {
-  name      = "titanic"
-  server_id = azurerm_postgresql_flexible_server.titanic.id
-  collation = "en_US.utf8"
-  charset   = "utf8"
+moved {
+  from = azurerm_postgresql_flexible_server_database.titanic_db
+  to   = azurerm_postgresql_flexible_server_database.config_only["titanic"]
 }
 
 # Network Infrastructure for Databases
@@ -204,16 +183,16 @@ resource "azurerm_private_dns_zone_virtual_network_link" "database_dns_link" {
 
 # Output connection strings for monitoring and testing
 output "periodic_table_connection_string" {
-  value = "postgresql://${azurerm_postgresql_flexible_server.periodic_table.administrator_login}@${azurerm_postgresql_flexible_server.periodic_table.fqdn}:5432/periodic_table"
+  value = "postgresql://${azurerm_postgresql_flexible_server.config_only["periodic_table"].administrator_login}@${azurerm_postgresql_flexible_server.config_only["periodic_table"].fqdn}:5432/periodic_table"
   sensitive = false
 }
 
 output "world_happiness_connection_string" {
-  value = "postgresql://${azurerm_postgresql_flexible_server.world_happiness.administrator_login}@${azurerm_postgresql_flexible_server.world_happiness.fqdn}:5432/world_happiness"
+  value = "postgresql://${azurerm_postgresql_flexible_server.config_only["world_happiness"].administrator_login}@${azurerm_postgresql_flexible_server.config_only["world_happiness"].fqdn}:5432/world_happiness"
   sensitive = false
 }
 
 output "titanic_connection_string" {
-  value = "postgresql://${azurerm_postgresql_flexible_server.titanic.administrator_login}@${azurerm_postgresql_flexible_server.titanic.fqdn}:5432/titanic"
+  value = "postgresql://${azurerm_postgresql_flexible_server.config_only["titanic"].administrator_login}@${azurerm_postgresql_flexible_server.config_only["titanic"].fqdn}:5432/titanic"
   sensitive = false
 }
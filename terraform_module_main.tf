@@ -10,9 +10,19 @@ terraform {
   }
 }
 
-variable "database_name" {
-  description = "Name of the PostgreSQL database"
-  type        = string
+variable "databases" {
+  description = "Databases to create, keyed by database name; one server per database"
+  type = map(object({
+    criticality           = optional(string, "LOW")
+    scenario_type         = string
+    owner_email           = string
+    last_used_date        = string
+    storage_mb            = optional(number, 32768)
+    sku_name              = optional(string, "B_Standard_B1ms")
+    backup_retention_days = optional(number, 7)
+    high_availability     = optional(bool, false)
+    tags                  = optional(map(string), {})
+  }))
 }
 
 variable "resource_group_name" {
@@ -30,51 +40,6 @@ variable "environment" {
   type        = string
 }
 
-variable "criticality" {
-  description = "Database criticality level (LOW, MEDIUM, CRITICAL)"
-  type        = string
-  default     = "LOW"
-}
-
-variable "scenario_type" {
-  description = "Scenario type (CONFIG_ONLY, MIXED, LOGIC_HEAVY)"
-  type        = string
-}
-
-variable "owner_email" {
-  description = "Owner team email"
-  type        = string
-}
-
-variable "last_used_date" {
-  description = "Last used date (YYYY-MM-DD)"
-  type        = string
-}
-
-variable "storage_mb" {
-  description = "Storage size in MB"
-  type        = number
-  default     = 32768
-}
-
-variable "sku_name" {
-  description = "SKU name for the database"
-  type        = string
-  default     = "B_Standard_B1ms"
-}
-
-variable "backup_retention_days" {
-  description = "Backup retention in days"
-  type        = number
-  default     = 7
-}
-
-variable "high_availability" {
-  description = "Enable high availability"
-  type        = bool
-  default     = false
-}
-
 variable "delegated_subnet_id" {
   description = "Delegated subnet ID"
   type        = string
@@ -103,9 +68,12 @@ variable "additional_tags" {
   default     = {}
 }
 
-# PostgreSQL Flexible Server
+# PostgreSQL Flexible Servers, one per database in a single for_each so
+# Terraform plans and applies them in one graph walk
 resource "azurerm_postgresql_flexible_server" "database" {
-  name                   = "psql-${var.database_name}-${var.environment}"
+  for_each = var.databases
+
+  name                   = "psql-${replace(each.key, "_", "-")}-${var.environment}"
   resource_group_name    = var.resource_group_name
   location              = var.location
   version               = "14"
@@ -114,51 +82,56 @@ resource "azurerm_postgresql_flexible_server" "database" {
   administrator_login    = var.administrator_login
   administrator_password = var.administrator_password
 
-  storage_mb = var.storage_mb
-  sku_name   = var.sku_name
+  storage_mb = each.value.storage_mb
+  sku_name   = each.value.sku_name
 
-  backup_retention_days        = var.backup_retention_days
-  geo_redundant_backup_enabled = var.criticality == "CRITICAL" ? true : false
-  high_availability_enabled    = var.high_availability
+  backup_retention_days        = each.value.backup_retention_days
+  geo_redundant_backup_enabled = each.value.criticality == "CRITICAL" ? true : false
+  high_availability_enabled    = each.value.high_availability
 
   tags = merge({
     Environment       = var.environment
-    Criticality      = var.criticality
-    Scenario         = var.scenario_type
-    Owner            = var.owner_email
-    LastUsed         = var.last_used_date
+    Criticality      = each.value.criticality
+    Scenario         = each.value.scenario_type
+    Owner            = each.value.owner_email
+    LastUsed         = each.value.last_used_date
     ManagedBy        = "Terraform"
     DatabaseType     = "PostgreSQL"
-    DecommissioningCandidate = var.last_used_date < "2025-05-01" ? "true" : "false"
-  }, var.additional_tags)
+    DecommissioningCandidate = each.value.last_used_date < "2025-05-01" ? "true" : "false"
+  }, var.additional_tags, each.value.tags)
 }
 
-# Database within the server
+# Database within each server
 resource "azurerm_postgresql_flexible_server_database" "database" {
-  name      = var.database_name
-  server_id = azurerm_postgresql_flexible_server.database.id
+  for_each = var.databases
+
+  name      = each.key
+  server_id = azurerm_postgresql_flexible_server.database[each.key].id
   collation = "en_US.utf8"
   charset   = "utf8"
 }
 
-# Outputs
+# Outputs, keyed by database name
 output "server_id" {
-  value = azurerm_postgresql_flexible_server.database.id
+  value = { for name, server in azurerm_postgresql_flexible_server.database : name => server.id }
 }
 
 output "server_fqdn" {
-  value = azurerm_postgresql_flexible_server.database.fqdn
+  value = { for name, server in azurerm_postgresql_flexible_server.database : name => server.fqdn }
 }
 
 output "database_name" {
-  value = azurerm_postgresql_flexible_server_database.database.name
+  value = { for name, database in azurerm_postgresql_flexible_server_database.database : name => database.name }
 }
 
 output "connection_string" {
-  value = "postgresql://${var.administrator_login}@${azurerm_postgresql_flexible_server.database.fqdn}:5432/${var.database_name}"
+  value = {
+    for name, server in azurerm_postgresql_flexible_server.database :
+    name => "postgresql://${var.administrator_login}@${server.fqdn}:5432/${name}"
+  }
   sensitive = var.environment == "prod"
 }
 
 output "server_tags" {
-  value = azurerm_postgresql_flexible_server.database.tags
+  value = { for name, server in azurerm_postgresql_flexible_server.database : name => server.tags }
 }
@@ -1,40 +1,47 @@
 # terraform/modules/database/outputs.tf
 # Outputs for the reusable database module
 
+# All outputs are maps keyed by database name
+
 output "server_id" {
-  description = "ID of the PostgreSQL server"
-  value       = azurerm_postgresql_flexible_server.database.id
+  description = "ID of each PostgreSQL server"
+  value       = { for name, server in azurerm_postgresql_flexible_server.database : name => server.id }
 }
 
 output "server_fqdn" {
-  description = "FQDN of the PostgreSQL server"
-  value       = azurerm_postgresql_flexible_server.database.fqdn
+  description = "FQDN of each PostgreSQL server"
+  value       = { for name, server in azurerm_postgresql_flexible_server.database : name => server.fqdn }
 }
 
 output "database_name" {
-  description = "Name of the database"
-  value       = azurerm_postgresql_flexible_server_database.database.name
+  description = "Name of each database"
+  value       = { for name, database in azurerm_postgresql_flexible_server_database.database : name => database.name }
 }
 
 output "connection_string" {
-  description = "Connection string for the database"
-  value       = "postgresql://${var.administrator_login}@${azurerm_postgresql_flexible_server.database.fqdn}:5432/${var.database_name}"
-  sensitive   = var.environment == "prod"
+  description = "Connection string for each database"
+  value = {
+    for name, server in azurerm_postgresql_flexible_server.database :
+    name => "postgresql://${var.administrator_login}@${server.fqdn}:5432/${name}"
+  }
+  sensitive = var.environment == "prod"
 }
 
 output "server_tags" {
-  description = "Tags applied to the server"
-  value       = azurerm_postgresql_flexible_server.database.tags
+  description = "Tags applied to each server"
+  value       = { for name, server in azurerm_postgresql_flexible_server.database : name => server.tags }
 }
 
 output "decommissioning_info" {
   description = "Information relevant for decommissioning decisions"
   value = {
-    scenario_type = var.scenario_type
-    criticality   = var.criticality
-    owner_email   = var.owner_email
-    last_used     = var.last_used_date
-    environment   = var.environment
-    requires_manual_review = var.scenario_type == "LOGIC_HEAVY" ? true : false
+    for name, db in var.databases : name => {
+      scenario_type = db.scenario_type
+      criticality   = db.criticality
+      owner_email   = db.owner_email
+      last_used     = db.last_used_date
+      environment   = var.environment
+      requires_manual_review = db.scenario_type == "LOGIC_HEAVY" ? true : false
+    }
   }
 }
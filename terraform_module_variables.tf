@@ -1,13 +1,40 @@
 # terraform/modules/database/variables.tf
 # Variables for the reusable database module
 
-variable "database_name" {
-  description = "Name of the PostgreSQL database"
-  type        = string
+variable "databases" {
+  description = "Databases to create, keyed by database name; one server per database"
+  type = map(object({
+    criticality           = optional(string, "LOW")
+    scenario_type         = string
+    owner_email           = string
+    last_used_date        = string
+    storage_mb            = optional(number, 32768)
+    sku_name              = optional(string, "B_Standard_B1ms")
+    backup_retention_days = optional(number, 7)
+    high_availability     = optional(bool, false)
+    tags                  = optional(map(string), {})
+  }))
+
   validation {
-    condition     = can(regex("^[a-z][a-z0-9_]*$", var.database_name))
+    condition     = alltrue([for name in keys(var.databases) : can(regex("^[a-z][a-z0-9_]*$", name))])
     error_message = "Database name must start with a letter and contain only lowercase letters, numbers, and underscores."
   }
+  validation {
+    condition     = alltrue([for db in values(var.databases) : contains(["LOW", "MEDIUM", "CRITICAL"], db.criticality)])
+    error_message = "Criticality must be one of: LOW, MEDIUM, CRITICAL."
+  }
+  validation {
+    condition     = alltrue([for db in values(var.databases) : contains(["CONFIG_ONLY", "MIXED", "LOGIC_HEAVY"], db.scenario_type)])
+    error_message = "Scenario type must be one of: CONFIG_ONLY, MIXED, LOGIC_HEAVY."
+  }
+  validation {
+    condition     = alltrue([for db in values(var.databases) : can(regex("^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$", db.owner_email))])
+    error_message = "Owner email must be a valid email address."
+  }
+  validation {
+    condition     = alltrue([for db in values(var.databases) : can(regex("^\d{4}-\d{2}-\d{2}$", db.last_used_date))])
+    error_message = "Last used date must be in YYYY-MM-DD format."
+  }
 }
 
 variable "resource_group_name" {
@@ -29,40 +56,3 @@ variable "environment" {
     error_message = "Environment must be one of: dev, staging, prod."
   }
 }
-
-variable "criticality" {
-  description = "Database criticality level"
-  type        = string
-  default     = "LOW"
-  validation {
-    condition     = contains(["LOW", "MEDIUM", "CRITICAL"], var.criticality)
-    error_message = "Criticality must be one of: LOW, MEDIUM, CRITICAL."
-  }
-}
-
-variable "scenario_type" {
-  description = "Scenario type for decommissioning testing"
-  type        = string
-  validation {
-    condition     = contains(["CONFIG_ONLY", "MIXED", "LOGIC_HEAVY"], var.scenario_type)
-    error_message = "Scenario type must be one of: CONFIG_ONLY, MIXED, LOGIC_HEAVY."
-  }
-}
-
-variable "owner_email" {
-  description = "Owner team email address"
-  type        = string
-  validation {
-    condition     = can(regex("^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$", var.owner_email))
-    error_message = "Owner email must be a valid email address."
-  }
-}
-
-variable "last_used_date" {
-  description = "Last used date in YYYY-MM-DD format"
-  type        = string
-  validation {
-    condition     = can(regex("^\d{4}-\d{2}-\d{2}$", var.last_used_date))
-    error_message = "Last used date must be in YYYY-MM-DD format."
-  }
-}
@@ -41,50 +41,54 @@ resource "random_password" "prod_db_admin_password" {
   special = true
 }
 
-# Logic-Heavy Scenario: Employees Database (Payroll System)
-resource "azurerm_postgresql_flexible_server" "employees" {
-  name                   = "psql-employees-prod"
-  resource_group_name    = azurerm_resource_group.prod_critical_databases.name
-  location              = azurerm_resource_group.prod_critical_databases.location
-  version               = "14"
-  delegated_subnet_id   = azurerm_subnet.prod_database_subnet.id
-  private_dns_zone_id   = azurerm_private_dns_zone.prod_database_dns.id
-  administrator_login    = "dbadmin"
-  administrator_password = random_password.prod_db_admin_password.result
-
-  storage_mb = 1048576  # 1TB for large dataset
-  sku_name   = "GP_Standard_D4s_v3"  # High performance
-
-  backup_retention_days        = 35
-  geo_redundant_backup_enabled = true
-  high_availability_enabled    = true
-
-  tags = {
-    Environment = "Production"
-    Purpose     = "Payroll & HR System"
-    Owner       = "hr-team@company.com"
-    LastUsed    = "2025-06-24"  # Active usage
-    Criticality = "CRITICAL"
-    Scenario    = "LOGIC_HEAVY"
-    DataSize    = "Large"
-    BusinessImpact = "Multi-million dollar payroll operations"
-    RequiresManualReview = "true"
-    ComplianceRequirement = "SOX, GDPR"
+# Logic-Heavy Scenario databases; one for_each keeps all three servers in a
+# single resource so Terraform plans and applies them together
+locals {
+  logic_heavy_databases = {
+    # Employees Database (Payroll System)
+    employees = {
+      storage_mb = 1048576  # 1TB for large dataset
+      sku_name   = "GP_Standard_D4s_v3"  # High performance
+      tags = {
+        Purpose     = "Payroll & HR System"
+        Owner       = "hr-team@company.com"
+        DataSize    = "Large"
+        BusinessImpact = "Multi-million dollar payroll operations"
+        ComplianceRequirement = "SOX, GDPR"
+      }
+    }
+    # Lego Database (Business Intelligence)
+    lego = {
+      storage_mb = 524288  # 512GB for analytics
+      sku_name   = "GP_Standard_D8s_v3"  # High performance for analytics
+      tags = {
+        Purpose     = "Revenue Analytics & Forecasting"
+        Owner       = "analytics-team@company.com"
+        DataSize    = "Medium"
+        BusinessImpact = "Executive decision support, revenue forecasting"
+        ComplianceRequirement = "Financial reporting"
+      }
+    }
+    # Postgres Air Database (Flight Operations)
+    postgres_air = {
+      storage_mb = 2097152  # 2TB for flight operations
+      sku_name   = "GP_Standard_D16s_v3"  # Very high performance
+      tags = {
+        Purpose     = "Flight Operations & Safety"
+        Owner       = "operations-team@company.com"
+        DataSize    = "Very Large"
+        BusinessImpact = "Flight safety, regulatory compliance"
+        ComplianceRequirement = "FAA, EASA regulations"
+        SafetyCritical = "true"
+      }
+    }
   }
-
-  depends_on = [azurerm_private_dns_zone_virtual_network_link.prod_database_dns_link]
 }
 
-resource "azurerm_postgresql_flexible_server_database" "employees_db" {
-  name      = "employees"
-  server_id = azurerm_postgresql_flexible_server.employees.id
-  collation = "en_US.utf8"
-  charset   = "utf8"
-}
+resource "azurerm_postgresql_flexible_server" "logic_heavy" {
+  for_each = local.logic_heavy_databases
 
-# Logic-Heavy Scenario: Lego Database (Business Intelligence)
-resource "azurerm_postgresql_flexible_server" "lego" {
-  name                   = "psql-lego-prod"
+  name                   = "psql-${replace(each.key, "_", "-")}-prod"
   resource_group_name    = azurerm_resource_group.prod_critical_databases.name
   location              = azurerm_resource_group.prod_critical_databases.location
   version               = "14"
@@ -93,76 +97,62 @@ resource "azurerm_postgresql_flexible_server" "lego" {
   administrator_login    = "dbadmin"
   administrator_password = random_password.prod_db_admin_password.result
 
-  storage_mb = 524288  # 512GB for analytics
-  sku_name   = "GP_Standard_D8s_v3"  # High performance for analytics
+  storage_mb = each.value.storage_mb
+  sku_name   = each.value.sku_name
 
   backup_retention_days        = 35
   geo_redundant_backup_enabled = true
   high_availability_enabled    = true
 
-  tags = {
+  tags = merge({
     Environment = "Production"
-    Purpose     = "Revenue Analytics & Forecasting"
-    Owner       = "analytics-team@company.com"
     LastUsed    = "2025-06-24"  # Active usage
     Criticality = "CRITICAL"
     Scenario    = "LOGIC_HEAVY"
-    DataSize    = "Medium"
-    BusinessImpact = "Executive decision support, revenue forecasting"
     RequiresManualReview = "true"
-    ComplianceRequirement = "Financial reporting"
-  }
+  }, each.value.tags)
 
   depends_on = [azurerm_private_dns_zone_virtual_network_link.prod_database_dns_link]
 }
 
-resource "azurerm_postgresql_flexible_server_database" "lego_db" {
-  name      = "lego"
-  server_id = azurerm_postgresql_flexible_server.lego.id
+resource "azurerm_postgresql_flexible_server_database" "logic_heavy" {
+  for_each = local.logic_heavy_databases
+
+  name      = each.key
+  server_id = azurerm_postgresql_flexible_server.logic_heavy[each.key].id
   collation = "en_US.utf8"
   charset   = "utf8"
 }
 
-# Logic-Heavy Scenario: Postgres Air Database (Flight Operations)
-resource "azurerm_postgresql_flexible_server" "postgres_air" {
-  name                   = "psql-postgres-air-prod"
-  resource_group_name    = azurerm_resource_group.prod_critical_databases.name
-  location              = azurerm_resource_group.prod_critical_databases.location
-  version               = "14"
-  delegated_subnet_id   = azurerm_subnet.prod_database_subnet.id
-  private_dns_zone_id   = azurerm_private_dns_zone.prod_database_dns.id
-  administrator_login    = "dbadmin"
-  administrator_password = random_password.prod_db_admin_password.result
+# State moves from the former one-resource-per-database layout
+moved {
+  from = azurerm_postgresql_flexible_server.employees
+  to   = azurerm_postgresql_flexible_server.logic_heavy["employees"]
+}
 
-  storage_mb = 2097152  # 2TB for flight operations
-  sku_name   = "GP_Standard_D16s_v3"  # Very high performance
+moved {
+  from = azurerm_postgresql_flexible_server_database.employees_db
+  to   = azurerm_postgresql_flexible_server_database.logic_heavy["employees"]
+}
 
-  backup_retention_days        = 35
-  geo_redundant_backup_enabled = true
-  high_availability_enabled    = true
+moved {
+  from = azurerm_postgresql_flexible_server.lego
+  to   = azurerm_postgresql_flexible_server.logic_heavy["lego"]
+}
 
-  tags = {
-    Environment = "Production"
-    Purpose     = "Flight Operations & Safety"
-    Owner       = "operations-team@company.com"
-    LastUsed    = "2025-06-24"  # Active usage
-    Criticality = "CRITICAL"
-    Scenario    = "LOGIC_HEAVY"
-    DataSize    = "Very Large"
-    BusinessImpact = "Flight safety, regulatory compliance"
-    RequiresManualReview = "true"
-    ComplianceRequirement = "FAA, EASA regulations"
-    SafetyCritical = "true"
-  }
+moved {
+  from = azurerm_postgresql_flexible_server_database.lego_db
+  to   = azurerm_postgresql_flexible_server_database.logic_heavy["lego"]
+}
 
-  depends_on = [azurerm_private_dns_zone_virtual_network_link.prod_database_dns_link]
+moved {
+  from = azurerm_postgresql_flexible_server.postgres_air
+  to   = azurerm_postgresql_flexible_server.logic_heavy["postgres_air"]
 }
 
-resource "azurerm_postgresql_flexible_server_database" "postgres_air_db" {
-  name      = "postgres_air"
-  server_id = azurerm_postgresql_flexible_server.postgres_air.id
-  collation = "en_US.utf8"
-  charset   = "utf8"
+moved {
+  from = azurerm_postgresql_flexible_server_database.postgres_air_db
+  to   = azurerm_postgresql_flexible_server_database.logic_heavy["postgres_air"]
 }
 
 # Production Network Infrastructure
@@ -218,16 +208,16 @@ resource "azurerm_private_dns_zone_virtual_network_link" "prod_database_dns_link
 
 # Output connection strings (sensitive for production)
 output "employees_connection_string" {
-  value = "postgresql://${azurerm_postgresql_flexible_server.employees.administrator_login}@${azurerm_postgresql_flexible_server.employees.fqdn}:5432/employees"
+  value = "postgresql://${azurerm_postgresql_flexible_server.logic_heavy["employees"].administrator_login}@${azurerm_postgresql_flexible_server.logic_heavy["employees"].fqdn}:5432/employees"
   sensitive = true
 }
 
 output "lego_connection_string" {
-  value = "postgresql://${azurerm_postgresql_flexible_server.lego.administrator_login}@${azurerm_postgresql_flexible_server.lego.fqdn}:5432/lego"
+  value = "postgresql://${azurerm_postgresql_flexible_server.logic_heavy["lego"].administrator_login}@${azurerm_postgresql_flexible_server.logic_heavy["lego"].fqdn}:5432/lego"
   sensitive = true
 }
 
 output "postgres_air_connection_string" {
-  value = "postgresql://${azurerm_postgresql_flexible_server.postgres_air.administrator_login}@${azurerm_postgresql_flexible_server.postgres_air.fqdn}:5432/postgres_air"
+  value = "postgresql://${azurerm_postgresql_flexible_server.logic_heavy["postgres_air"].administrator_login}@${azurerm_postgresql_flexible_server.logic_heavy["postgres_air"].fqdn}:5432/postgres_air"
   sensitive = true
 }
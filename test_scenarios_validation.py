@@ -15,10 +15,27 @@ Version: 1.0
 import os
 import re
 import json
+import mmap
+import threading
 from pathlib import Path
 from typing import Dict, List, Set, Tuple, Any
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
+from fnmatch import fnmatchcase
+from itertools import chain
+from operator import attrgetter
+
+try:
+    import orjson  # optional, faster JSON serializer
+except ImportError:
+    orjson = None
+
+try:
+    import ahocorasick  # pyahocorasick, optional multi-pattern matcher
+except ImportError:
+    ahocorasick = None
 
 
 class ScenarioType(Enum):
@@ -33,7 +50,7 @@ class ViolationType(Enum):
     INFO = "INFO"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationResult:
     """Validation result for a specific check"""
 
@@ -47,101 +64,337 @@ class ValidationResult:
     file_references: List[str]
 
 
+TERRAFORM_PATTERNS = (
+    "terraform_*_databases.tf",
+    "terraform_*_critical_databases.tf",
+    "terraform_module_*.tf",
+)
+
+STATUS_EMOJI = {"PASS": "✅", "FAIL": "❌", "WARNING": "⚠️"}
+
+# Database scenario definitions: (database, scenario type, criticality, owner)
+_SCENARIOS: Tuple[Tuple[str, ScenarioType, str, str], ...] = (
+    # Config-Only scenarios
+    ("periodic_table", ScenarioType.CONFIG_ONLY, "LOW", "chemistry-team@company.com"),
+    ("world_happiness", ScenarioType.CONFIG_ONLY, "LOW", "analytics-team@company.com"),
+    ("titanic", ScenarioType.CONFIG_ONLY, "LOW", "data-science-team@company.com"),
+    # Mixed scenarios
+    ("pagila", ScenarioType.MIXED, "MEDIUM", "development-team@company.com"),
+    ("chinook", ScenarioType.MIXED, "MEDIUM", "media-team@company.com"),
+    ("netflix", ScenarioType.MIXED, "MEDIUM", "content-team@company.com"),
+    # Logic-Heavy scenarios
+    ("employees", ScenarioType.LOGIC_HEAVY, "CRITICAL", "hr-team@company.com"),
+    ("lego", ScenarioType.LOGIC_HEAVY, "CRITICAL", "analytics-team@company.com"),
+    (
+        "postgres_air",
+        ScenarioType.LOGIC_HEAVY,
+        "CRITICAL",
+        "operations-team@company.com",
+    ),
+)
+_DATABASES = tuple(database for database, *_ in _SCENARIOS)
+
+# Application code directories and the code type they represent
+APP_CODE_DIRS = (
+    ("src/config/", "configuration"),
+    ("src/services/", "service_layer"),
+    ("src/business/", "business_logic"),
+    ("src/analytics/", "analytics"),
+)
+_CODE_TYPE_BY_DIR = {
+    Path(dir_path).name: code_type for dir_path, code_type in APP_CODE_DIRS
+}
+
+# Code types a MIXED database may use / must not touch / a LOGIC_HEAVY one must have
+MIXED_ALLOWED_TYPES = frozenset({"configuration", "service_layer"})
+MIXED_FORBIDDEN_TYPES = frozenset({"business_logic", "analytics"})
+LOGIC_HEAVY_REQUIRED_TYPES = frozenset({"business_logic", "analytics"})
+
+# Directories never descended into while scanning the repository
+PRUNED_DIRS = frozenset({".git", "node_modules", "__pycache__"})
+
+
+def _read_fd(fd: int) -> bytes:
+    """Read an open file to EOF with unbuffered os.read calls"""
+    size = os.fstat(fd).st_size
+    chunks = []
+    while True:
+        chunk = os.read(fd, max(size, 65536))
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+
+
+def _read_batch(paths) -> Dict[str, bytes]:
+    """Read all paths, announcing the whole batch to the kernel before reading"""
+    fds = {}
+    for path in dict.fromkeys(paths):
+        try:
+            fds[path] = os.open(path, os.O_RDONLY)
+        except OSError:
+            pass  # Unreadable files are left to the per-check error handling
+
+    contents = {}
+    try:
+        # Queue readahead for every file first so the device sees them all at once
+        for fd in fds.values():
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        for path, fd in fds.items():
+            try:
+                contents[path] = _read_fd(fd)
+            except OSError:
+                pass
+    finally:
+        for fd in fds.values():
+            os.close(fd)
+    return contents
+
+
 class DatabaseScenarioValidator:
     """Main validator for database scenarios"""
 
     def __init__(self, repo_root: str = "."):
         self.repo_root = Path(repo_root)
         self.results: List[ValidationResult] = []
+        self._local = threading.local()
 
         # Database scenario definitions
-        self.scenarios = {
-            # Config-Only scenarios
-            "periodic_table": ("CONFIG_ONLY", "LOW", "chemistry-team@company.com"),
-            "world_happiness": ("CONFIG_ONLY", "LOW", "analytics-team@company.com"),
-            "titanic": ("CONFIG_ONLY", "LOW", "data-science-team@company.com"),
-            # Mixed scenarios
-            "pagila": ("MIXED", "MEDIUM", "development-team@company.com"),
-            "chinook": ("MIXED", "MEDIUM", "media-team@company.com"),
-            "netflix": ("MIXED", "MEDIUM", "content-team@company.com"),
-            # Logic-Heavy scenarios
-            "employees": ("LOGIC_HEAVY", "CRITICAL", "hr-team@company.com"),
-            "lego": ("LOGIC_HEAVY", "CRITICAL", "analytics-team@company.com"),
-            "postgres_air": ("LOGIC_HEAVY", "CRITICAL", "operations-team@company.com"),
+        self.scenarios = _SCENARIOS
+
+        # Repository index and file contents, filled by validate_all_scenarios
+        self._code_files: Dict[str, List[str]] = {
+            code_type: [] for _, code_type in APP_CODE_DIRS
         }
+        self._helm_files: Dict[str, Path] = {}
+        self._monitor_files: Dict[str, Path] = {}
+        self._file_data: Dict[str, bytes] = {}
+        self._terraform_contents: List[bytes] = []
+        self._code_hits: Dict[str, Dict[str, List[str]]] = {}
+
+        # All database names are matched in a single pass over each file
+        self._db_automaton = None
+        if ahocorasick is not None:
+            self._db_automaton = ahocorasick.Automaton()
+            for database in _DATABASES:
+                self._db_automaton.add_word(database, database)
+            self._db_automaton.make_automaton()
+        # Fallback: one bytes alternation; the lookahead reports overlapping names too
+        self._db_regex = re.compile(
+            b"(?=("
+            + b"|".join(re.escape(database.encode()) for database in _DATABASES)
+            + b"))"
+        )
+
+        # Per scenario type: required monitor elements and one case-insensitive
+        # regex that finds all of them in a single pass, one capture group each
+        self._monitor_checks: Dict[
+            ScenarioType, Tuple[List[str], "re.Pattern[str]"]
+        ] = {}
+        for scenario_type in ScenarioType:
+            required_elements = [
+                scenario_type.value,
+                "threshold",
+                "alert",
+                "database_name",
+            ]
+            self._monitor_checks[scenario_type] = (
+                required_elements,
+                re.compile(
+                    "(?="
+                    + "|".join(f"({re.escape(elem)})" for elem in required_elements)
+                    + ")",
+                    re.IGNORECASE,
+                ),
+            )
 
     def validate_all_scenarios(self) -> bool:
         """Run all validation checks and return success status"""
         print("🔍 Starting database scenario validation...")
         print("=" * 60)
 
-        for database, (scenario_str, criticality, owner) in self.scenarios.items():
-            scenario_type = ScenarioType(scenario_str)
-            print(f"\n📊 Validating {database} ({scenario_type.value})")
+        # Every file the checks need is classified by one walk and read in one batch
+        terraform_files = self._scan_repo_once()
+        self._file_data = {}
+        if hasattr(os, "posix_fadvise"):
+            self._file_data = _read_batch(
+                chain(
+                    chain.from_iterable(self._code_files.values()),
+                    map(str, terraform_files),
+                    map(str, self._monitor_files.values()),
+                )
+            )
 
-            # Core validation checks
-            self._validate_scenario_separation(database, scenario_type)
-            self._validate_infrastructure_files(database, scenario_type)
-            self._validate_monitoring_setup(database, scenario_type)
+        # Terraform contents are shared by every database's check
+        self._terraform_contents = []
+        for tf_file in terraform_files:
+            try:
+                self._terraform_contents.append(self._read(tf_file))
+            except Exception:
+                pass
+
+        # Application code is scanned once for all databases
+        self._code_hits = self._scan_app_code()
+
+        # Databases are checked concurrently against the shared read-only indices;
+        # map() keeps each database's results (and output) in definition order
+        workers = min(len(self.scenarios), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            per_database = list(executor.map(self._validate_one, self.scenarios))
+
+        for (database, scenario_type, _, _), results in zip(
+            self.scenarios, per_database
+        ):
+            print(f"\n📊 Validating {database} ({scenario_type.value})")
+            for result in results:
+                print(
+                    f"  {STATUS_EMOJI.get(result.status, '❓')} "
+                    f"{result.check_name}: {result.message}"
+                )
+            self.results.extend(results)
 
         return self._generate_report()
 
+    def _validate_one(
+        self, scenario: Tuple[str, ScenarioType, str, str]
+    ) -> List[ValidationResult]:
+        """Run every check for one database, collecting results per worker thread"""
+        database, scenario_type, _, _ = scenario
+        self._local.results = []
+
+        # Core validation checks
+        self._validate_scenario_separation(database, scenario_type)
+        self._validate_infrastructure_files(database, scenario_type)
+        self._validate_monitoring_setup(database, scenario_type)
+
+        return self._local.results
+
+    def _databases_in(self, data) -> List[str]:
+        """Database names occurring in data (bytes or mmap), in definition order"""
+        if self._db_automaton is not None:
+            # Names are ASCII, so latin-1 maps bytes to characters one-to-one
+            text = data[:].decode("latin-1")
+            found = {database for _, database in self._db_automaton.iter(text)}
+        else:
+            found = {match.group(1).decode() for match in self._db_regex.finditer(data)}
+        return [database for database in _DATABASES if database in found]
+
+    def _scan_repo_once(self) -> List[Path]:
+        """Index code, Helm and monitor files in one walk; return Terraform files"""
+        self._code_files = {code_type: [] for _, code_type in APP_CODE_DIRS}
+        self._helm_files = {}
+        self._monitor_files = {}
+        terraform_files = []
+
+        root = str(self.repo_root)
+        for dirpath, dirnames, filenames in os.walk(root):
+            if dirpath == root:
+                # Infrastructure files live at the top level; only src/ is descended
+                dirnames[:] = [name for name in dirnames if name == "src"]
+                for name in filenames:
+                    if name.endswith(".tf") and any(
+                        fnmatchcase(name, pattern) for pattern in TERRAFORM_PATTERNS
+                    ):
+                        terraform_files.append(self.repo_root / name)
+                    elif name.endswith(".yaml"):
+                        if name.startswith("helm_values_"):
+                            database = name[len("helm_values_") : -len(".yaml")]
+                            self._helm_files[database] = self.repo_root / name
+                        elif name.startswith("datadog_monitor_"):
+                            database = name[len("datadog_monitor_") : -len(".yaml")]
+                            self._monitor_files[database] = self.repo_root / name
+                continue
+
+            dirnames[:] = [name for name in dirnames if name not in PRUNED_DIRS]
+            parts = Path(os.path.relpath(dirpath, root)).parts
+            code_type = _CODE_TYPE_BY_DIR.get(parts[1]) if len(parts) > 1 else None
+            if code_type is not None:
+                self._code_files[code_type].extend(
+                    str(Path(dirpath, name))
+                    for name in filenames
+                    if name.endswith(".py")
+                )
+
+        return terraform_files
+
+    def _read(self, path) -> bytes:
+        """File contents from the batch read, falling back to a direct read"""
+        data = self._file_data.get(str(path))
+        return data if data is not None else Path(path).read_bytes()
+
+    def _mapped_databases(self, path: str) -> List[str]:
+        """Database names in a file that was not batch read, via a read-only mmap"""
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                return self._databases_in(mm)
+        finally:
+            os.close(fd)
+
+    def _scan_app_code(self) -> Dict[str, Dict[str, List[str]]]:
+        """Map code type -> database -> files, reading each .py file once"""
+        code_hits = {}
+
+        for code_type, py_files in self._code_files.items():
+            hits: Dict[str, List[str]] = {}
+            for py_file in py_files:
+                try:
+                    data = self._file_data.get(py_file)
+                    if data is not None:
+                        databases = self._databases_in(data)
+                    else:
+                        databases = self._mapped_databases(py_file)
+                except (OSError, ValueError):
+                    continue  # Skip unreadable files (empty files can't be mapped)
+                for database in databases:
+                    hits.setdefault(database, []).append(py_file)
+            code_hits[code_type] = hits
+
+        return code_hits
+
     def _validate_scenario_separation(self, database: str, scenario_type: ScenarioType):
         """Validate that scenarios follow separation rules"""
 
-        # Check for application code references
-        app_code_files = [
-            ("src/config/", "configuration"),
-            ("src/services/", "service_layer"),
-            ("src/business/", "business_logic"),
-            ("src/analytics/", "analytics"),
-        ]
+        # A config-only database passes without collecting any references;
+        # any() stops at the first code type that mentions it
+        if scenario_type == ScenarioType.CONFIG_ONLY and not any(
+            database in hits for hits in self._code_hits.values()
+        ):
+            self._add_result(
+                database,
+                scenario_type,
+                "config_only_purity",
+                "PASS",
+                ViolationType.INFO,
+                "No application code references (correct)",
+                [],
+                [],
+            )
+            return
 
-        found_references = {}
-
-        for dir_path, code_type in app_code_files:
-            full_path = self.repo_root / dir_path
-            if full_path.exists():
-                for py_file in full_path.rglob("*.py"):
-                    try:
-                        content = py_file.read_text(encoding="utf-8")
-                        if database in content:
-                            if code_type not in found_references:
-                                found_references[code_type] = []
-                            found_references[code_type].append(str(py_file))
-                    except Exception:
-                        pass  # Skip files that can't be read
+        # Check for application code references
+        found_references = {
+            code_type: hits[database]
+            for code_type, hits in self._code_hits.items()
+            if database in hits
+        }
 
         # Validate based on scenario type
         if scenario_type == ScenarioType.CONFIG_ONLY:
-            if found_references:
-                self._add_result(
-                    database,
-                    scenario_type,
-                    "config_only_purity",
-                    "FAIL",
-                    ViolationType.CRITICAL,
-                    "Config-only database has application code references",
-                    [f"Found in: {list(found_references.keys())}"],
-                    sum(found_references.values(), []),
-                )
-            else:
-                self._add_result(
-                    database,
-                    scenario_type,
-                    "config_only_purity",
-                    "PASS",
-                    ViolationType.INFO,
-                    "No application code references (correct)",
-                    [],
-                    [],
-                )
+            self._add_result(
+                database,
+                scenario_type,
+                "config_only_purity",
+                "FAIL",
+                ViolationType.CRITICAL,
+                "Config-only database has application code references",
+                [f"Found in: {list(found_references.keys())}"],
+                list(chain.from_iterable(found_references.values())),
+            )
 
         elif scenario_type == ScenarioType.MIXED:
-            allowed_types = {"configuration", "service_layer"}
-            forbidden_types = {"business_logic", "analytics"}
-
-            violations = [t for t in found_references.keys() if t in forbidden_types]
+            violations = [
+                t for t in found_references.keys() if t in MIXED_FORBIDDEN_TYPES
+            ]
 
             if violations:
                 self._add_result(
@@ -152,10 +405,10 @@ class DatabaseScenarioValidator:
                     ViolationType.CRITICAL,
                     "Mixed scenario has forbidden business logic",
                     [f"Found forbidden: {violations}"],
-                    sum([found_references[v] for v in violations], []),
+                    list(chain.from_iterable(found_references[v] for v in violations)),
                 )
             else:
-                has_allowed = any(t in found_references for t in allowed_types)
+                has_allowed = any(t in found_references for t in MIXED_ALLOWED_TYPES)
                 if has_allowed:
                     self._add_result(
                         database,
@@ -180,8 +433,9 @@ class DatabaseScenarioValidator:
                     )
 
         elif scenario_type == ScenarioType.LOGIC_HEAVY:
-            required_types = {"business_logic", "analytics"}
-            missing_types = [t for t in required_types if t not in found_references]
+            missing_types = sorted(
+                LOGIC_HEAVY_REQUIRED_TYPES.difference(found_references)
+            )
 
             if missing_types:
                 self._add_result(
@@ -212,25 +466,8 @@ class DatabaseScenarioValidator:
         """Validate infrastructure file existence"""
 
         # Check Terraform files
-        terraform_patterns = [
-            "terraform_*_databases.tf",
-            "terraform_*_critical_databases.tf",
-            "terraform_module_*.tf",
-        ]
-
-        terraform_found = False
-        for pattern in terraform_patterns:
-            matches = list(self.repo_root.glob(pattern))
-            for tf_file in matches:
-                try:
-                    content = tf_file.read_text(encoding="utf-8")
-                    if database in content:
-                        terraform_found = True
-                        break
-                except Exception:
-                    pass
-            if terraform_found:
-                break
+        needle = database.encode()
+        terraform_found = any(needle in content for content in self._terraform_contents)
 
         if terraform_found:
             self._add_result(
@@ -256,10 +493,7 @@ class DatabaseScenarioValidator:
             )
 
         # Check Helm files
-        helm_pattern = f"helm_values_{database}.yaml"
-        helm_files = list(self.repo_root.glob(helm_pattern))
-
-        if helm_files:
+        if database in self._helm_files:
             self._add_result(
                 database,
                 scenario_type,
@@ -285,26 +519,20 @@ class DatabaseScenarioValidator:
     def _validate_monitoring_setup(self, database: str, scenario_type: ScenarioType):
         """Validate monitoring configuration"""
 
-        monitor_pattern = f"datadog_monitor_{database}.yaml"
-        monitor_files = list(self.repo_root.glob(monitor_pattern))
+        monitor_file = self._monitor_files.get(database)
 
-        if monitor_files:
+        if monitor_file is not None:
             # Check monitor content
             try:
-                monitor_file = monitor_files[0]
-                content = monitor_file.read_text(encoding="utf-8")
-
-                required_elements = [
-                    scenario_type.value,
-                    "threshold",
-                    "alert",
-                    "database_name",
-                ]
+                content = self._read(monitor_file).decode("utf-8")
 
+                required_elements, pattern = self._monitor_checks[scenario_type]
+                # The matching group number identifies the element; no lowercasing
+                found = {match.lastindex for match in pattern.finditer(content)}
                 missing = [
                     elem
-                    for elem in required_elements
-                    if elem.lower() not in content.lower()
+                    for group, elem in enumerate(required_elements, 1)
+                    if group not in found
                 ]
 
                 if missing:
@@ -374,11 +602,7 @@ class DatabaseScenarioValidator:
             details=details,
             file_references=file_refs,
         )
-        self.results.append(result)
-
-        # Print immediate feedback
-        status_emoji = {"PASS": "✅", "FAIL": "❌", "WARNING": "⚠️"}
-        print(f"  {status_emoji.get(status, '❓')} {check_name}: {message}")
+        self._local.results.append(result)
 
     def _generate_report(self) -> bool:
         """Generate validation report and return success status"""
@@ -387,9 +611,7 @@ class DatabaseScenarioValidator:
         print("=" * 60)
 
         # Count results by status
-        status_counts = {"PASS": 0, "FAIL": 0, "WARNING": 0}
-        for result in self.results:
-            status_counts[result.status] += 1
+        status_counts = Counter(map(attrgetter("status"), self.results))
 
         print(f"✅ PASSED: {status_counts['PASS']}")
         print(f"❌ FAILED: {status_counts['FAIL']}")
@@ -433,8 +655,13 @@ class DatabaseScenarioValidator:
             )
 
         try:
-            with open("validation_results.json", "w") as f:
-                json.dump(results_data, f, indent=2)
+            if orjson is not None:
+                Path("validation_results.json").write_bytes(
+                    orjson.dumps(results_data, option=orjson.OPT_INDENT_2)
+                )
+            else:
+                with open("validation_results.json", "w") as f:
+                    json.dump(results_data, f, indent=2)
             print(f"\n💾 Results saved to validation_results.json")
         except Exception as e:
             print(f"\n⚠️  Could not save results: {e}")
@@ -0,0 +1,71 @@
+"""Tests for the deployment driver's handling of the database admin password"""
+
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import deploy_scenarios
+
+PASSWORD = "s3cret-admin-password"
+
+
+class FakeProcess:
+    """Stands in for an asyncio subprocess that exits successfully"""
+
+    returncode = 0
+
+    async def communicate(self, stdin=None):
+        return b"", b""
+
+
+class AdminPasswordTest(unittest.TestCase):
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        (self.root / "terraform_dev_databases.tf").write_text("")
+        (self.root / "terraform_prod_critical_databases.tf").write_text("")
+        self.calls = []
+
+        async def create_subprocess_exec(*command, env=None, **kwargs):
+            self.calls.append((command, env))
+            return FakeProcess()
+
+        for patcher in (
+            mock.patch.object(deploy_scenarios, "REPO_ROOT", self.root),
+            mock.patch.object(deploy_scenarios, "LOG_FILE", self.root / "deployment.log"),
+            mock.patch.object(
+                deploy_scenarios.asyncio, "create_subprocess_exec", create_subprocess_exec
+            ),
+            mock.patch.dict("os.environ", {"DB_ADMIN_PASSWORD": PASSWORD}),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def dry_run(self, environment):
+        deployer = deploy_scenarios.ScenarioDeployer(dry_run=True, force=True)
+        try:
+            asyncio.run(getattr(deployer, f"deploy_{environment}")())
+            deployer.generate_report(environment)
+        finally:
+            deployer.close()
+        return (self.root / f"deployment_report_{environment}.md").read_text()
+
+    def test_dry_run_reports_never_contain_the_password(self):
+        for environment in ("dev", "prod"):
+            with self.subTest(environment=environment):
+                report = self.dry_run(environment)
+                self.assertIn("terraform plan", report)
+                self.assertNotIn(PASSWORD, report)
+
+    def test_password_reaches_terraform_through_the_environment(self):
+        self.dry_run("prod")
+        plans = [(c, env) for c, env in self.calls if c[:2] == ("terraform", "plan")]
+        self.assertTrue(plans)
+        for command, env in plans:
+            self.assertNotIn(PASSWORD, " ".join(command))
+            self.assertEqual(env["TF_VAR_admin_password"], PASSWORD)
+
+
+if __name__ == "__main__":
+    unittest.main()
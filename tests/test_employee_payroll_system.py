@@ -0,0 +1,194 @@
+"""Parity of the integer-cent payroll rules with the original Decimal formula"""
+
+import asyncio
+import importlib.util
+import random
+import unittest
+from datetime import date
+from decimal import ROUND_HALF_UP, Decimal
+
+if importlib.util.find_spec("asyncpg"):
+    from src.business import employee_payroll_system as payroll
+else:
+    payroll = None
+
+PERIODS = (
+    (date(2024, 1, 1), date(2024, 1, 14)),
+    (date(2024, 2, 1), date(2024, 2, 29)),
+    (date(2024, 1, 1), date(2024, 12, 31)),
+)
+
+
+def decimal_net_pay(salary, pay_period_start, pay_period_end, overtime_hours, rates):
+    """Net pay as the original Decimal implementation of calculate_payroll computed it"""
+    days_in_period = (pay_period_end - pay_period_start).days + 1
+    base_pay = salary / Decimal("365") * Decimal(str(days_in_period))
+    if overtime_hours > 0:
+        overtime_pay = salary / Decimal("2080") * Decimal("1.5") * overtime_hours
+    else:
+        overtime_pay = Decimal("0")
+    gross_pay = base_pay + overtime_pay
+
+    fica_tax = gross_pay * rates["fica_rate"]
+    if gross_pay > Decimal("147000"):
+        fica_tax = Decimal("147000") * rates["fica_rate"]
+    total_deductions = (
+        gross_pay * rates["federal_rate"]
+        + gross_pay * rates["state_rate"]
+        + fica_tax
+        + gross_pay * rates["medicare_rate"]
+    )
+    return (gross_pay - total_deductions).quantize(
+        Decimal("0.01"), rounding=ROUND_HALF_UP
+    )
+
+
+@unittest.skipIf(payroll is None, "asyncpg is not installed")
+class PayrollParityTest(unittest.TestCase):
+    def setUp(self):
+        self.system = payroll.EmployeePayrollSystem("postgresql://unused")
+        rng = random.Random(20240101)
+        self.employees = {
+            emp_no: payroll.Employee(
+                emp_no=emp_no,
+                first_name="Test",
+                last_name="Employee",
+                hire_date=date(2015, 1, 1),
+                birth_date=date(1980, 1, 1),
+                gender="F",
+                current_salary=Decimal(rng.randint(38000, 160000)),
+            )
+            for emp_no in range(500)
+        }
+        # Fractional overtime of up to three decimal places, plus none and negative
+        self.overtime = {
+            emp_no: rng.choice(
+                (
+                    Decimal("0"),
+                    Decimal("-4"),
+                    Decimal("0.333"),
+                    Decimal(rng.randint(1, 40000)) / 1000,
+                    Decimal(rng.randint(1, 400)) / 10,
+                )
+            )
+            for emp_no in self.employees
+        }
+
+        async def get_employees_details(emp_nos):
+            return {emp_no: self.employees[emp_no] for emp_no in emp_nos}
+
+        self.system.get_employees_details = get_employees_details
+
+    def expected(self, emp_no, pay_period_start, pay_period_end):
+        return decimal_net_pay(
+            self.employees[emp_no].current_salary,
+            pay_period_start,
+            pay_period_end,
+            self.overtime[emp_no],
+            self.system._tax_rates,
+        )
+
+    def test_single_employee_net_pay_matches_decimal_formula(self):
+        for pay_period_start, pay_period_end in PERIODS:
+            for emp_no, employee in self.employees.items():
+                calculation = self.system._compute_payroll(
+                    employee, pay_period_start, pay_period_end, self.overtime[emp_no]
+                )
+                self.assertEqual(
+                    calculation.net_pay,
+                    self.expected(emp_no, pay_period_start, pay_period_end),
+                    (emp_no, pay_period_start, pay_period_end),
+                )
+
+    @unittest.skipIf(payroll is not None and payroll.np is None, "numpy is not installed")
+    def test_pay_run_net_pay_matches_decimal_formula(self):
+        emp_nos = list(self.employees)
+        self.assertGreaterEqual(len(emp_nos), payroll.VECTORIZED_PAYROLL_MIN_EMPLOYEES)
+        for pay_period_start, pay_period_end in PERIODS:
+            run = asyncio.run(
+                self.system.calculate_payroll_batch(
+                    emp_nos, pay_period_start, pay_period_end, self.overtime
+                )
+            )
+            for emp_no, calculation in zip(emp_nos, run):
+                self.assertEqual(
+                    calculation.net_pay,
+                    self.expected(emp_no, pay_period_start, pay_period_end),
+                    (emp_no, pay_period_start, pay_period_end),
+                )
+
+
+@unittest.skipIf(
+    payroll is None or payroll.np is None, "asyncpg or numpy is not installed"
+)
+class PayRunWidthTest(unittest.TestCase):
+    """Pay runs whose exact numerators sit near the int64 limit"""
+
+    AMOUNTS = (
+        "gross_pay",
+        "federal_tax",
+        "state_tax",
+        "fica_tax",
+        "medicare_tax",
+        "total_deductions",
+        "net_pay",
+        "overtime_pay",
+    )
+
+    def assert_run_matches_single(
+        self, salary, overtime, pay_period_start, pay_period_end
+    ):
+        system = payroll.EmployeePayrollSystem("postgresql://unused")
+        employees = {
+            emp_no: payroll.Employee(
+                emp_no=emp_no,
+                first_name="Test",
+                last_name="Employee",
+                hire_date=date(2015, 1, 1),
+                birth_date=date(1980, 1, 1),
+                gender="F",
+                current_salary=salary,
+            )
+            for emp_no in range(payroll.VECTORIZED_PAYROLL_MIN_EMPLOYEES)
+        }
+
+        async def get_employees_details(emp_nos):
+            return {emp_no: employees[emp_no] for emp_no in emp_nos}
+
+        system.get_employees_details = get_employees_details
+        run = asyncio.run(
+            system.calculate_payroll_batch(
+                list(employees), pay_period_start, pay_period_end, overtime
+            )
+        )
+        for calculation in run:
+            single = system._compute_payroll(
+                employees[calculation.emp_no],
+                pay_period_start,
+                pay_period_end,
+                overtime.get(calculation.emp_no, Decimal("0")),
+            )
+            for amount in self.AMOUNTS:
+                self.assertEqual(
+                    getattr(calculation, amount),
+                    getattr(single, amount),
+                    (calculation.emp_no, amount),
+                )
+
+    def test_fica_cap_numerator_outgrows_int64(self):
+        # A small salary keeps gross tiny, but the FICA cap scaled to the
+        # run's overtime denominator does not fit in int64
+        self.assert_run_matches_single(
+            Decimal("10"), {0: Decimal("0.0000001")}, *PERIODS[0]
+        )
+
+    def test_negative_overtime_does_not_shrink_the_bound(self):
+        self.assert_run_matches_single(
+            Decimal("160000"),
+            {emp_no: Decimal("-1000000.0000001") for emp_no in range(64)},
+            *PERIODS[2],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+"""Parity of the compiled portfolio kernel with the per-product scoring methods"""
+
+import importlib.util
+import random
+import unittest
+
+if importlib.util.find_spec("asyncpg"):
+    from src.analytics import lego_business_intelligence as lego
+else:
+    lego = None
+
+
+@unittest.skipIf(
+    lego is None or lego.compute_metrics is None,
+    "asyncpg or the numba kernel is not available",
+)
+class PortfolioKernelParityTest(unittest.TestCase):
+    SCORES = (
+        "popularity_score",
+        "margin_bp",
+        "market_penetration",
+        "competitive_advantage",
+    )
+
+    def test_batch_scores_match_single_product_scores(self):
+        rng = random.Random(20250101)
+        themes = [*lego._MARKET_PENETRATION_FACTORS, "Architecture", "Ninjago"]
+        rows = [
+            {
+                "set_num": f"{i}-1",
+                "set_name": "Test Set",
+                "theme": rng.choice(themes),
+                "year": rng.randint(1970, 2025),
+                "num_parts": rng.choice((0, rng.randint(1, 6000))),
+                "unique_parts": rng.randint(0, 900),
+                "price_cents": rng.randint(100, 90000),
+                "market_segment": "CLASSIC_BUILDING",
+                "revenue_category": "MAINSTREAM",
+            }
+            for i in range(300)
+        ]
+        system = lego.LegoBusinessIntelligenceSystem("postgresql://unused")
+
+        batch = system._score_portfolio_batch(rows, 2026)
+        for row, metrics in zip(rows, batch):
+            single = system._score_product(row, 2026)
+            for score in self.SCORES:
+                self.assertEqual(
+                    getattr(metrics, score),
+                    getattr(single, score),
+                    (row["set_num"], score),
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()